@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the tool result path on large responses.
+
+Builds large Senzing-shaped payloads with the fake engine (an entity with
+hundreds of records, a 2000-entity network, a deep how-resolution and a wide
+search) and measures, per payload:
+
+  format_sz    format_result() on an SzResult (the normal, no-parse path)
+  format_str   format_result() on a plain string (parsed for an "error" key)
+  call_tool    server.call_tool() end to end, engine latency and caches off
+  serialize    the MCP transport serializing the tool result to JSON
+
+Each stage reports the best and median wall time over --repeat runs and the
+peak traced Python memory of one run. --save-baseline writes the numbers to
+a JSON file; --baseline compares against one and exits non-zero when a
+stage is more than --tolerance slower (by at least --slack-ms) or larger,
+so changes to server.py cannot quietly make large responses slower.
+Baselines are machine-specific: record them on the machine (or CI runner
+class) that checks them.
+
+Usage:
+  bench_format_result.py [--repeat N] [--scale F] [--only NAME[,NAME]]
+                         [--save-baseline PATH] [--baseline PATH]
+                         [--tolerance T] [--slack-ms MS] [--json]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from bench_server import SRC, install_stub_senzing
+
+# name: (tool, arguments, SDK method, spec overrides); sizes scale with --scale
+FIXTURES = {
+    "entity": ("get_entity", {"entity_id": 1}, "get_entity_by_entity_id",
+               {"records_per_entity": 500, "related_per_entity": 200}),
+    "network": ("expand_network", {"entity_ids": [1], "max_degrees": 1, "max_entities": 2000, "page_size": 0},
+                "find_network_by_entity_id", {"network_entities": 2000, "related_per_entity": 20}),
+    "how": ("explain_how_resolved", {"entity_id": 1}, "how_entity_by_entity_id",
+            {"records_per_entity": 300}),
+    "search": ("search_entities", {"attributes": {"NAME_FULL": "Entity 1"}}, "search_by_attributes",
+               {"search_results": 200, "records_per_entity": 20}),
+}
+STAGES = ("format_sz", "format_str", "call_tool", "serialize")
+SIZE_KEYS = ("records_per_entity", "related_per_entity", "network_entities", "search_results")
+
+
+def fixture_spec(overrides: dict, scale: float) -> dict:
+    from senzing_mcp.fake_engine import load_spec
+
+    spec = load_spec("1")
+    spec["default"] = {}
+    spec["methods"] = {}
+    for key, value in overrides.items():
+        spec[key] = max(1, int(value * scale)) if key in SIZE_KEYS else value
+    return spec
+
+
+def measure(func, repeat: int) -> dict:
+    """Time func() repeat times, then trace the peak memory of one more run."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "best_ms": round(min(times) * 1000, 3),
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_fixture(server, name: str, repeat: int, scale: float) -> dict:
+    from mcp.types import CallToolResult
+    from senzing_mcp.fake_engine import FakeEngine
+    from senzing_mcp.results import SzResult
+
+    tool, arguments, method, overrides = FIXTURES[name]
+    engine = FakeEngine(fixture_spec(overrides, scale))
+    server.sdk_wrapper.engine = engine
+
+    loop = asyncio.new_event_loop()
+    try:
+        content = loop.run_until_complete(server.call_tool(tool, arguments))
+        if content[0].text.startswith(server.ERROR_PREFIXES):
+            raise RuntimeError(f"{name}: {content[0].text}")
+        payload = content[-1].text
+        sz_payload = SzResult(payload)
+        note = content[0].text
+
+        def call_tool():
+            loop.run_until_complete(server.call_tool(tool, arguments))
+
+        def serialize():
+            CallToolResult(content=content, isError=False).model_dump_json(by_alias=True, exclude_none=True)
+
+        stages = {
+            "format_sz": lambda: server.format_result(sz_payload, note),
+            "format_str": lambda: server.format_result(payload, note),
+            "call_tool": call_tool,
+            "serialize": serialize,
+        }
+        result = {"method": method, "payload_kb": round(len(payload.encode()) / 1024, 1)}
+        for stage in STAGES:
+            result[stage] = measure(stages[stage], repeat)
+        return result
+    finally:
+        loop.close()
+
+
+def run(args) -> dict:
+    install_stub_senzing()
+    sys.path.insert(0, SRC)
+    os.environ["SENZING_MCP_ENTITY_CACHE_SIZE"] = "0"
+    os.environ["SENZING_MCP_SEARCH_CACHE_SIZE"] = "0"
+    from senzing_mcp import server
+
+    server.sdk_wrapper._initialized = True
+    return {name: run_fixture(server, name, args.repeat, args.scale) for name in args.only}
+
+
+def compare(results: dict, baseline: dict, tolerance: float, slack_ms: float) -> list[str]:
+    """Return a message for each stage slower or larger than baseline * (1 + tolerance).
+
+    Times must also exceed the baseline by slack_ms, so timer noise on
+    sub-millisecond stages does not fail the run.
+    """
+    failures = []
+    for name, fixture in results.items():
+        for stage in STAGES:
+            base = baseline.get(name, {}).get(stage)
+            if not base:
+                continue
+            for key in ("best_ms", "peak_kb"):
+                limit = base[key] * (1 + tolerance)
+                if key == "best_ms":
+                    limit = max(limit, base[key] + slack_ms)
+                if fixture[stage][key] > limit:
+                    failures.append(f"{name}.{stage} {key} {fixture[stage][key]} > {round(limit, 1)} "
+                                    f"(baseline {base[key]})")
+    return failures
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage (default: 5)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Scale fixture sizes by F (default: 1)")
+    parser.add_argument("--only", type=lambda value: value.split(","), default=list(FIXTURES),
+                        help=f"Comma-separated fixtures to run (default: {','.join(FIXTURES)})")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="Fail if slower or larger than this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="Allowed regression over the baseline, as a fraction (default: 0.3)")
+    parser.add_argument("--slack-ms", type=float, default=1.0,
+                        help="Time regressions smaller than this are ignored (default: 1)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+    unknown = set(args.only) - set(FIXTURES)
+    if unknown:
+        parser.error(f"unknown fixture(s): {', '.join(sorted(unknown))}")
+    return args
+
+
+def main():
+    args = parse_args()
+    results = run(args)
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(results, json.load(f), args.tolerance, args.slack_ms)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.json:
+        print(json.dumps({"results": results, "failures": failures}))
+    else:
+        for name, fixture in results.items():
+            print(f"{name} ({fixture['method']}, {fixture['payload_kb']} KB)")
+            for stage in STAGES:
+                stats = fixture[stage]
+                print(f"  {stage:<11} best {stats['best_ms']:>9} ms   median {stats['median_ms']:>9} ms"
+                      f"   peak {stats['peak_kb']:>9} KB")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Replay recorded SDK traffic through the server layer and check for regressions.
+
+Loads a fixture store written with SENZING_MCP_RECORD_FILE, serves it with
+the replay engine and issues every recorded call through the SDK wrapper
+(caching, coalescing, bulkheads and result handling included) at a fixed
+concurrency. Reports throughput, p50/p95/p99 latency, peak traced Python
+memory and peak RSS. With --max-p95-ms / --max-memory-mb it exits non-zero
+when a limit is exceeded, for use in CI on machines without Senzing.
+
+Usage:
+  bench_replay.py FIXTURE [--concurrency N] [--speed S] [--repeat N]
+                  [--max-p95-ms MS] [--max-memory-mb MB] [--json]
+
+--speed scales the recorded engine timings (1 = original, 0 = no delay).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tracemalloc
+
+from bench_server import SRC, drive, install_stub_senzing, peak_rss_mb
+
+
+def load_calls(path: str, repeat: int) -> list[tuple[str, list]]:
+    sys.path.insert(0, SRC)
+    from senzing_mcp.replay import _open
+
+    with _open(path, "r") as f:
+        calls = [(entry["method"], entry["args"]) for entry in map(json.loads, filter(str.strip, f))]
+    return calls * repeat
+
+
+async def run(args) -> dict:
+    install_stub_senzing()
+    sys.path.insert(0, SRC)
+    from senzing_mcp.sdk_wrapper import SenzingSDKWrapper
+
+    wrapper = SenzingSDKWrapper()
+    await wrapper.initialize()
+    calls = load_calls(args.fixture, args.repeat)
+
+    async def call_engine(method, call_args):
+        result = await wrapper._call_engine(method, *call_args)
+        return result.is_error
+
+    tracemalloc.start()
+    try:
+        result = await drive(call_engine, calls, args.concurrency)
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await wrapper.cleanup()
+    result["peak_traced_mb"] = round(peak / (1024 * 1024), 1)
+    result["peak_rss_mb"] = peak_rss_mb()["self"]
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("fixture", help="Fixture store written with SENZING_MCP_RECORD_FILE")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent calls in flight (default: 16)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Recorded timing scale (default: 1)")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the fixture N times (default: 1)")
+    parser.add_argument("--max-p95-ms", type=float, help="Fail if p95 latency exceeds this")
+    parser.add_argument("--max-memory-mb", type=float, help="Fail if peak traced memory exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    os.environ["SENZING_MCP_REPLAY_FILE"] = args.fixture
+    os.environ["SENZING_MCP_REPLAY_SPEED"] = str(args.speed)
+    result = asyncio.run(run(args))
+
+    failures = []
+    if args.max_p95_ms is not None and result["p95_ms"] > args.max_p95_ms:
+        failures.append(f"p95 {result['p95_ms']}ms > {args.max_p95_ms}ms")
+    if args.max_memory_mb is not None and result["peak_traced_mb"] > args.max_memory_mb:
+        failures.append(f"peak memory {result['peak_traced_mb']}MB > {args.max_memory_mb}MB")
+
+    if args.json:
+        print(json.dumps({**result, "failures": failures}))
+    else:
+        print(f"replayed {result['requests']} calls, {result['errors']} errors, concurrency={args.concurrency}")
+        print(f"throughput: {result['throughput_rps']} calls/s over {result['elapsed_s']}s")
+        print(f"latency:    p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms")
+        print(f"memory:     peak traced {result['peak_traced_mb']} MB, peak RSS {result['peak_rss_mb']} MB")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
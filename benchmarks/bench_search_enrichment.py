@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark search_by_attributes feature enrichment against a stubbed engine.
+
+Compares the previous strategy (re-running the whole search with feature
+flags when 1-10 entities come back) with the current one (one search, then
+concurrent feature fetches for just the returned entity IDs).
+
+Usage:
+  bench_search_enrichment.py [--searches N] [--entities N]
+                             [--search-ms MS] [--entity-ms MS] [--concurrency N]
+
+The stub engine sleeps for a fixed time per call, standing in for the
+engine/database work, so the numbers show the latency and call-count saving
+rather than absolute Senzing performance.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+# Results must come from the engine every time for a fair comparison
+os.environ["SENZING_MCP_ENTITY_CACHE_SIZE"] = "0"
+os.environ["SENZING_MCP_SEARCH_CACHE_SIZE"] = "0"
+
+try:
+    import senzing  # noqa: F401
+    import senzing_core  # noqa: F401
+except ImportError:
+    # Allow running without a Senzing install, as the unit tests do
+    sys.modules["senzing"] = MagicMock()
+    sys.modules["senzing_core"] = MagicMock()
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from senzing_mcp.sdk_wrapper import SenzingSDKWrapper, SzEngineFlags  # noqa: E402
+
+
+class StubEngine:
+    """Engine stand-in with fixed per-call latency and call counters."""
+
+    def __init__(self, entities: int, search_ms: float, entity_ms: float):
+        self.entities = entities
+        self.search_ms = search_ms
+        self.entity_ms = entity_ms
+        self.calls = {"search_by_attributes": 0, "get_entity_by_entity_id": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, method: str):
+        with self._lock:
+            self.calls[method] += 1
+
+    def search_by_attributes(self, attributes, flags):
+        self._count("search_by_attributes")
+        time.sleep(self.search_ms / 1000)
+        return json.dumps({"RESOLVED_ENTITIES": [
+            {"ENTITY": {"RESOLVED_ENTITY": {
+                "ENTITY_ID": eid,
+                "RECORDS": [{"DATA_SOURCE": "CUSTOMERS", "RECORD_ID": str(eid)}],
+            }}}
+            for eid in range(1, self.entities + 1)
+        ]})
+
+    def get_entity_by_entity_id(self, entity_id, flags):
+        self._count("get_entity_by_entity_id")
+        time.sleep(self.entity_ms / 1000)
+        return json.dumps({"RESOLVED_ENTITY": {
+            "ENTITY_ID": entity_id,
+            "FEATURES": {"NAME": [{"FEAT_DESC": f"Entity {entity_id}"}]},
+            "RECORDS": [{"DATA_SOURCE": "CUSTOMERS", "RECORD_ID": str(entity_id), "FEATURES": []}],
+        }})
+
+
+async def double_search(wrapper: SenzingSDKWrapper, attributes: str) -> str:
+    """The previous strategy: search, count, then search again with feature flags."""
+    flags = 0
+    result = await wrapper._run_async(wrapper.engine.search_by_attributes, attributes, flags)
+    entity_count = len(json.loads(result).get("RESOLVED_ENTITIES", []))
+    if 0 < entity_count < 11:
+        enhanced_flags = (
+            flags |
+            SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_FEATURES |
+            SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_FEATURES
+        )
+        result = await wrapper._run_async(wrapper.engine.search_by_attributes, attributes, enhanced_flags)
+    return result
+
+
+async def run_strategy(name, search, args) -> dict:
+    engine = StubEngine(args.entities, args.search_ms, args.entity_ms)
+    wrapper = SenzingSDKWrapper()
+    wrapper.engine = engine
+    wrapper._initialized = True
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def one(i):
+        async with semaphore:
+            start = time.perf_counter()
+            await search(wrapper, json.dumps({"NAME_FULL": f"Name {i}"}))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.searches)))
+    elapsed = time.perf_counter() - start
+    wrapper.executor.shutdown(wait=True)
+
+    latencies.sort()
+    return {
+        "strategy": name,
+        "elapsed_s": elapsed,
+        "mean_ms": statistics.mean(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "search_calls": engine.calls["search_by_attributes"],
+        "entity_calls": engine.calls["get_entity_by_entity_id"],
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--searches", type=int, default=50, help="Searches to run per strategy (default: 50)")
+    parser.add_argument("--entities", type=int, default=5, help="Entities returned per search (default: 5)")
+    parser.add_argument("--search-ms", type=float, default=40.0, help="Stub search latency (default: 40)")
+    parser.add_argument("--entity-ms", type=float, default=4.0, help="Stub get_entity latency (default: 4)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent searches (default: 1)")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    results = [
+        await run_strategy("double search", double_search, args),
+        await run_strategy("single search + enrich", SenzingSDKWrapper.search_by_attributes, args),
+    ]
+
+    print(f"{args.searches} searches, {args.entities} entities each, "
+          f"search={args.search_ms}ms entity={args.entity_ms}ms, concurrency={args.concurrency}\n")
+    print(f"{'strategy':<24} {'total s':>8} {'mean ms':>8} {'p95 ms':>8} {'searches':>9} {'fetches':>8}")
+    for r in results:
+        print(f"{r['strategy']:<24} {r['elapsed_s']:>8.2f} {r['mean_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+              f"{r['search_calls']:>9} {r['entity_calls']:>8}")
+
+    saving = 1 - results[1]["mean_ms"] / results[0]["mean_ms"]
+    print(f"\nMean latency saving: {saving:.0%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Throughput/latency benchmark for the MCP server against the fake engine.
+
+Drives a weighted mix of tool calls at a fixed concurrency and reports
+throughput, p50/p95/p99 latency, errors and the server's peak RSS. The
+server runs with SENZING_MCP_FAKE_ENGINE, so no Senzing repository is needed
+and the numbers reflect the server's own overhead plus the fake engine's
+configured latencies.
+
+Usage:
+  bench_server.py [--transport inproc|stdio|sse|http] [--concurrency N]
+                  [--requests N] [--fake-spec SPEC] [--id-range N]
+                  [--json] [-- SERVER_ARGS...]
+
+  inproc  calls server.call_tool() directly (no transport)
+  stdio   spawns the server and talks MCP over stdin/stdout
+  sse     spawns the server with --http and talks MCP over HTTP/SSE
+  http    spawns the server with --streamable-http --stateless and talks
+          MCP over streamable HTTP (add -- --workers N to scale out)
+
+Arguments after "--" are passed to the server, e.g.
+  bench_server.py --transport sse -- --engine-workers 4 --max-workers 16
+
+SPEC is a SENZING_MCP_FAKE_ENGINE value: "1", inline JSON or a file path
+(see src/senzing_mcp/fake_engine.py). Use --no-cache to disable the result
+caches so every call reaches the engine.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Tool mix: (tool, weight)
+DEFAULT_MIX = (
+    ("get_entity", 40),
+    ("search_entities", 25),
+    ("get_source_record", 10),
+    ("get_entities", 5),
+    ("find_path", 5),
+    ("expand_network", 5),
+    ("explain_why_related", 5),
+    ("explain_how_resolved", 5),
+)
+
+
+def install_stub_senzing():
+    """Register minimal senzing modules when the SDK is not installed.
+
+    The fake engine needs real exception classes and integer flags; nothing
+    else from the SDK is used. The exception classes are the fake engine's
+    own, so errors pickled back from engine worker processes match them.
+    """
+    try:
+        import senzing  # noqa: F401
+        import senzing_core  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    sys.path.insert(0, SRC)
+    from senzing_mcp.fake_engine import SzError, SzNotFoundError
+
+    class _Flags(type):
+        def __getattr__(cls, name):
+            return 0
+
+    senzing = types.ModuleType("senzing")
+    senzing.SzError = SzError
+    senzing.SzNotFoundError = SzNotFoundError
+    senzing.SzEngine = object
+    senzing.SzEngineFlags = _Flags("SzEngineFlags", (), {})
+    senzing_core = types.ModuleType("senzing_core")
+    senzing_core.SzAbstractFactoryCore = None
+    sys.modules["senzing"] = senzing
+    sys.modules["senzing_core"] = senzing_core
+
+
+def peak_rss_mb() -> dict:
+    """Peak RSS of this process and of its largest child, in MB (Linux units)."""
+    to_mb = 1 / 1024 if sys.platform != "darwin" else 1 / (1024 * 1024)
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * to_mb, 1),
+        "children": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * to_mb, 1),
+    }
+
+
+def serve(server_args: list[str]):
+    """Run the server in this process (the stdio/sse subprocess side)."""
+    install_stub_senzing()
+    sys.path.insert(0, SRC)
+    from senzing_mcp import server
+
+    rss_file = os.environ.get("BENCH_RSS_FILE")
+    sys.argv = ["senzing-mcp-server", *server_args]
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if rss_file:
+            with open(rss_file, "w") as f:
+                json.dump(peak_rss_mb(), f)
+
+
+def make_calls(count: int, id_range: int, seed: int) -> list[tuple[str, dict]]:
+    """Build a reproducible list of (tool, arguments) calls from the mix."""
+    rng = random.Random(seed)
+    tools = [tool for tool, _ in DEFAULT_MIX]
+    weights = [weight for _, weight in DEFAULT_MIX]
+
+    def entity_id():
+        return rng.randint(1, id_range)
+
+    calls = []
+    for tool in rng.choices(tools, weights, k=count):
+        if tool == "get_entity" or tool == "explain_how_resolved":
+            arguments = {"entity_id": entity_id()}
+        elif tool == "search_entities":
+            arguments = {"attributes": {"NAME_FULL": f"Entity {entity_id()}", "DATE_OF_BIRTH": "1980-01-01"}}
+        elif tool == "get_source_record":
+            arguments = {"data_source": "CUSTOMERS", "record_id": str(entity_id())}
+        elif tool == "get_entities":
+            arguments = {"entity_ids": [entity_id() for _ in range(10)]}
+        elif tool == "find_path":
+            arguments = {"start_entity_id": entity_id(), "end_entity_id": entity_id(), "max_degrees": 3}
+        elif tool == "expand_network":
+            arguments = {"entity_ids": [entity_id()], "max_degrees": 2, "max_entities": 100}
+        else:
+            arguments = {"entity_id_1": entity_id(), "entity_id_2": entity_id()}
+        calls.append((tool, arguments))
+    return calls
+
+
+async def drive(call_tool, calls, concurrency: int) -> dict:
+    """Run calls through call_tool(tool, arguments) -> is_error at a fixed concurrency."""
+    latencies = []
+    errors = 0
+    pending = iter(calls)
+
+    async def worker():
+        nonlocal errors
+        for tool, arguments in pending:
+            start = time.perf_counter()
+            try:
+                if await call_tool(tool, arguments):
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(p):
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 2)
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+async def run_inproc(args, calls) -> dict:
+    install_stub_senzing()
+    sys.path.insert(0, SRC)
+    from senzing_mcp import server
+
+    sys.argv = ["senzing-mcp-server", *args.server_args]
+    server_args = server.parse_args()
+    if server_args.max_workers is not None or server_args.bulkhead:
+        server.sdk_wrapper.configure_concurrency(server_args.max_workers, dict(server_args.bulkhead))
+    if server_args.engine_workers is not None:
+        server.sdk_wrapper.engine_workers = server_args.engine_workers
+    await server.sdk_wrapper.initialize()
+
+    async def call_tool(tool, arguments):
+        content = await server.call_tool(tool, arguments)
+        return content[0].text.startswith(server.ERROR_PREFIXES)
+
+    try:
+        result = await drive(call_tool, calls, args.concurrency)
+    finally:
+        await server.sdk_wrapper.cleanup()
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_remote(args, calls, env) -> dict:
+    from mcp import ClientSession, StdioServerParameters
+
+    serve_cmd = [os.path.abspath(__file__), "--serve", "--", *args.server_args]
+
+    async def run_session(read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+
+            async def call_tool(tool, arguments):
+                result = await session.call_tool(tool, arguments)
+                return result.isError or result.content[0].text.startswith("⚠️ SENZING ERROR")
+
+            return await drive(call_tool, calls, args.concurrency)
+
+    if args.transport == "stdio":
+        from mcp.client.stdio import stdio_client
+
+        params = StdioServerParameters(command=sys.executable, args=serve_cmd, env=env)
+        async with stdio_client(params) as (read_stream, write_stream):
+            return await run_session(read_stream, write_stream)
+
+    port = free_port()
+    transport_args = ["--http"] if args.transport == "sse" else ["--streamable-http", "--stateless"]
+    process = subprocess.Popen(
+        [sys.executable, *serve_cmd, *transport_args, "--port", str(port)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("server did not start")
+                await asyncio.sleep(0.1)
+        if args.transport == "sse":
+            from mcp.client.sse import sse_client
+
+            async with sse_client(f"http://127.0.0.1:{port}/sse") as (read_stream, write_stream):
+                return await run_session(read_stream, write_stream)
+
+        from mcp.client.streamable_http import streamablehttp_client
+
+        async with streamablehttp_client(f"http://127.0.0.1:{port}/mcp") as (read_stream, write_stream, _):
+            return await run_session(read_stream, write_stream)
+    finally:
+        process.send_signal(subprocess.signal.SIGINT)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transport", choices=("inproc", "stdio", "sse", "http"), default="inproc")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent calls in flight (default: 16)")
+    parser.add_argument("--requests", type=int, default=2000, help="Total tool calls (default: 2000)")
+    parser.add_argument("--fake-spec", default="1", help="SENZING_MCP_FAKE_ENGINE value (default: 1)")
+    parser.add_argument("--id-range", type=int, default=10000, help="Entity IDs are drawn from 1..N (default: 10000)")
+    parser.add_argument("--seed", type=int, default=1, help="Workload random seed (default: 1)")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the entity and search caches")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("server_args", nargs=argparse.REMAINDER, help="Arguments for the server (after --)")
+    args = parser.parse_args(argv)
+    if args.server_args[:1] == ["--"]:
+        args.server_args = args.server_args[1:]
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.serve:
+        serve(args.server_args)
+        return
+
+    os.environ["SENZING_MCP_FAKE_ENGINE"] = args.fake_spec
+    if args.no_cache:
+        os.environ["SENZING_MCP_ENTITY_CACHE_SIZE"] = "0"
+        os.environ["SENZING_MCP_SEARCH_CACHE_SIZE"] = "0"
+    calls = make_calls(args.requests, args.id_range, args.seed)
+
+    if args.transport == "inproc":
+        result = asyncio.run(run_inproc(args, calls))
+    else:
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as rss_file:
+            rss_path = rss_file.name
+        env = {**os.environ, "BENCH_RSS_FILE": rss_path}
+        try:
+            result = asyncio.run(run_remote(args, calls, env))
+            time.sleep(0.5)  # let the server write its peak RSS on exit
+            with open(rss_path) as f:
+                result["peak_rss_mb"] = json.load(f)
+        except (OSError, ValueError):
+            result.setdefault("peak_rss_mb", None)
+        finally:
+            os.unlink(rss_path)
+
+    result = {"transport": args.transport, "concurrency": args.concurrency, **result}
+    if args.json:
+        print(json.dumps(result))
+        return
+
+    print(f"transport={result['transport']} concurrency={result['concurrency']} "
+          f"requests={result['requests']} errors={result['errors']}")
+    print(f"throughput: {result['throughput_rps']} calls/s over {result['elapsed_s']}s")
+    print(f"latency:    p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms")
+    rss = result.get("peak_rss_mb")
+    if rss:
+        print(f"peak RSS:   server {rss['self']} MB, largest child {rss['children']} MB")
+
+
+if __name__ == "__main__":
+    main()
+elif __name__ == "__mp_main__":
+    # Server worker processes (--workers) re-import this script before the server
+    install_stub_senzing()
@@ -6,11 +6,15 @@ Usage:
   senzing_test.py list-tools
   senzing_test.py search <name>
   senzing_test.py get <entity_id>
+  senzing_test.py get-many <entity_id> [entity_id ...]
   senzing_test.py get-record <data_source> <record_id>
+  senzing_test.py get-records <data_source:record_id> [data_source:record_id ...]
   senzing_test.py find-path <entity_id1> <entity_id2> [max_degrees]
   senzing_test.py expand <entity_id> [max_degrees] [max_entities]
   senzing_test.py why <entity_id1> <entity_id2>
   senzing_test.py how <entity_id>
+  senzing_test.py load <calls.jsonl> [--sessions N] [--concurrency N] [--rate R]
+                       [--repeat N] [--sse URL] [--json]
 
 Examples:
   # List available MCP tools
@@ -22,9 +26,15 @@ Examples:
   # Get entity details by ID
   senzing_test.py get 1
 
+  # Get several entities in one call
+  senzing_test.py get-many 1 2 3
+
   # Get entity by source record
   senzing_test.py get-record CUSTOMERS 1001
 
+  # Get entities for several source records
+  senzing_test.py get-records CUSTOMERS:1001 CUSTOMERS:1002
+
   # Find relationship path between entities
   senzing_test.py find-path 1 2
   senzing_test.py find-path 1 2 3  # with max_degrees
@@ -40,18 +50,30 @@ Examples:
   # Explain how entity was resolved
   senzing_test.py how 1
 
+  # Replay a JSONL file of tool calls over 4 persistent sessions, 16 in flight
+  senzing_test.py load calls.jsonl --sessions 4 --concurrency 16
+
+  # Replay at a fixed rate against a running server's SSE endpoint
+  senzing_test.py load calls.jsonl --rate 50 --sse http://localhost:8000/sse
+
+Load files hold one call per line: {"tool": "get_entity", "arguments": {"entity_id": 1}}
+
 Environment Variables:
   SENZING_ENGINE_CONFIGURATION_JSON  Required: Senzing database config
   LD_LIBRARY_PATH                    Required: Path to Senzing libraries
   SENZING_MCP_COMMAND                Optional: Path to senzing-mcp (default: "senzing-mcp")
 """
 
+import argparse
 import asyncio
+import itertools
 import json
 import os
 import sys
-from contextlib import asynccontextmanager
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 
 SENZING_MCP_COMMAND = os.getenv("SENZING_MCP_COMMAND", "senzing-mcp")
@@ -82,6 +104,15 @@ async def get_mcp_session():
             yield session
 
 
+@asynccontextmanager
+async def get_sse_session(url):
+    """Context manager for an MCP client session against a running server's SSE endpoint."""
+    async with sse_client(url) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
+
+
 async def cmd_list_tools():
     """List all available MCP tools."""
     async with get_mcp_session() as session:
@@ -99,7 +130,7 @@ async def cmd_search(name):
         result = await session.call_tool("search_entities", {
             "attributes": {"NAME_FULL": name}
         })
-        data = json.loads(result.content[0].text)
+        data = json.loads(result.content[-1].text)
         print(json.dumps(data, indent=2))
 
 
@@ -110,7 +141,18 @@ async def cmd_get_entity(entity_id):
         result = await session.call_tool("get_entity", {
             "entity_id": int(entity_id)
         })
-        data = json.loads(result.content[0].text)
+        data = json.loads(result.content[-1].text)
+        print(json.dumps(data, indent=2))
+
+
+async def cmd_get_entities(entity_ids):
+    """Get details for several entities in one call."""
+    print(f"📄 Getting details for Entity IDs {', '.join(entity_ids)}...\n")
+    async with get_mcp_session() as session:
+        result = await session.call_tool("get_entities", {
+            "entity_ids": [int(eid) for eid in entity_ids]
+        })
+        data = json.loads(result.content[-1].text)
         print(json.dumps(data, indent=2))
 
 
@@ -122,7 +164,20 @@ async def cmd_get_record(data_source, record_id):
             "data_source": data_source,
             "record_id": record_id
         })
-        data = json.loads(result.content[0].text)
+        data = json.loads(result.content[-1].text)
+        print(json.dumps(data, indent=2))
+
+
+async def cmd_get_records(record_keys):
+    """Get entities for several DATA_SOURCE:RECORD_ID keys."""
+    print(f"🔍 Getting entities for records {', '.join(record_keys)}...\n")
+    records = []
+    for key in record_keys:
+        data_source, _, record_id = key.partition(":")
+        records.append({"data_source": data_source, "record_id": record_id})
+    async with get_mcp_session() as session:
+        result = await session.call_tool("get_source_records", {"records": records})
+        data = json.loads(result.content[-1].text)
         print(json.dumps(data, indent=2))
 
 
@@ -135,7 +190,7 @@ async def cmd_find_path(entity_id1, entity_id2, max_degrees=3):
             "end_entity_id": int(entity_id2),
             "max_degrees": int(max_degrees)
         })
-        data = json.loads(result.content[0].text)
+        data = json.loads(result.content[-1].text)
         print(json.dumps(data, indent=2))
 
 
@@ -148,7 +203,7 @@ async def cmd_expand(entity_id, max_degrees=1, max_entities=10):
             "max_degrees": int(max_degrees),
             "max_entities": int(max_entities)
         })
-        data = json.loads(result.content[0].text)
+        data = json.loads(result.content[-1].text)
         print(json.dumps(data, indent=2))
 
 
@@ -160,7 +215,7 @@ async def cmd_why(entity_id1, entity_id2):
             "entity_id1": int(entity_id1),
             "entity_id2": int(entity_id2)
         })
-        data = json.loads(result.content[0].text)
+        data = json.loads(result.content[-1].text)
         print(json.dumps(data, indent=2))
 
 
@@ -171,10 +226,125 @@ async def cmd_how(entity_id):
         result = await session.call_tool("explain_how_resolved", {
             "entity_id": int(entity_id)
         })
-        data = json.loads(result.content[0].text)
+        data = json.loads(result.content[-1].text)
         print(json.dumps(data, indent=2))
 
 
+# Tool responses starting with these are counted as errors (see server.ERROR_PREFIXES)
+ERROR_PREFIXES = ("⚠️ SENZING ERROR", "Error: ", "Unknown tool: ")
+
+
+def parse_load_args(argv):
+    """Parse the options of the load command."""
+    parser = argparse.ArgumentParser(prog="senzing_test.py load",
+                                     description="Replay a JSONL file of tool calls and report per-tool latency.")
+    parser.add_argument("calls", help='JSONL file, one {"tool": ..., "arguments": {...}} per line')
+    parser.add_argument("--sessions", type=int, default=1, help="Persistent MCP sessions to open (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum calls in flight (default: 8)")
+    parser.add_argument("--rate", type=float, help="Start calls at this many per second (default: as fast as possible)")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the file N times (default: 1)")
+    parser.add_argument("--sse", metavar="URL", help="Connect to a running server's SSE endpoint instead of stdio")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def load_calls(path):
+    """Read (tool, arguments) pairs from a JSONL file."""
+    calls = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if "tool" not in entry:
+                raise ValueError(f"{path}:{line_number}: missing \"tool\"")
+            calls.append((entry["tool"], entry.get("arguments", {})))
+    return calls
+
+
+def percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def load_report(stats, elapsed):
+    """Summarize per-tool (latency, is_error) samples."""
+    tools = {}
+    for tool, samples in sorted(stats.items()):
+        latencies = sorted(latency for latency, _ in samples)
+        errors = sum(1 for _, is_error in samples if is_error)
+        tools[tool] = {
+            "calls": len(samples),
+            "errors": errors,
+            "error_rate": round(errors / len(samples), 4),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2),
+        }
+    total = sum(tool["calls"] for tool in tools.values())
+    return {
+        "calls": total,
+        "errors": sum(tool["errors"] for tool in tools.values()),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "tools": tools,
+    }
+
+
+async def cmd_load(argv):
+    """Replay tool calls from a JSONL file over persistent sessions."""
+    args = parse_load_args(argv)
+    calls = load_calls(args.calls) * args.repeat
+    if not calls:
+        raise ValueError(f"No calls in {args.calls}")
+    target = args.sse or SENZING_MCP_COMMAND
+    print(f"🚚 Replaying {len(calls)} calls over {args.sessions} session(s) to {target}...\n", file=sys.stderr)
+
+    async with AsyncExitStack() as stack:
+        sessions = [
+            await stack.enter_async_context(get_sse_session(args.sse) if args.sse else get_mcp_session())
+            for _ in range(args.sessions)
+        ]
+        session_cycle = itertools.cycle(sessions)
+        slots = asyncio.Semaphore(args.concurrency)
+        stats = {}
+
+        async def run_call(session, tool, arguments):
+            try:
+                start = time.perf_counter()
+                try:
+                    result = await session.call_tool(tool, arguments)
+                    is_error = result.isError or result.content[0].text.startswith(ERROR_PREFIXES)
+                except Exception:
+                    is_error = True
+                stats.setdefault(tool, []).append((time.perf_counter() - start, is_error))
+            finally:
+                slots.release()
+
+        start = time.perf_counter()
+        tasks = []
+        for index, (tool, arguments) in enumerate(calls):
+            if args.rate:
+                delay = start + index / args.rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await slots.acquire()
+            tasks.append(asyncio.create_task(run_call(next(session_cycle), tool, arguments)))
+        await asyncio.gather(*tasks)
+        report = load_report(stats, time.perf_counter() - start)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'tool':<24}{'calls':>8}{'errors':>8}{'err%':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for tool, row in report["tools"].items():
+        print(f"{tool:<24}{row['calls']:>8}{row['errors']:>8}{row['error_rate'] * 100:>8.1f}"
+              f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}")
+    print(f"\n{report['calls']} calls, {report['errors']} errors in {report['elapsed_s']}s "
+          f"({report['throughput_rps']} calls/s)")
+
+
 def main():
     """Parse CLI arguments and dispatch to appropriate command."""
     if len(sys.argv) < 2:
@@ -193,9 +363,15 @@ def main():
         elif command == "get" and len(sys.argv) >= 3:
             asyncio.run(cmd_get_entity(sys.argv[2]))
 
+        elif command == "get-many" and len(sys.argv) >= 3:
+            asyncio.run(cmd_get_entities(sys.argv[2:]))
+
         elif command == "get-record" and len(sys.argv) >= 4:
             asyncio.run(cmd_get_record(sys.argv[2], sys.argv[3]))
 
+        elif command == "get-records" and len(sys.argv) >= 3:
+            asyncio.run(cmd_get_records(sys.argv[2:]))
+
         elif command == "find-path" and len(sys.argv) >= 4:
             max_degrees = int(sys.argv[4]) if len(sys.argv) > 4 else 3
             asyncio.run(cmd_find_path(sys.argv[2], sys.argv[3], max_degrees))
@@ -211,6 +387,9 @@ def main():
         elif command == "how" and len(sys.argv) >= 3:
             asyncio.run(cmd_how(sys.argv[2]))
 
+        elif command == "load" and len(sys.argv) >= 3:
+            asyncio.run(cmd_load(sys.argv[2:]))
+
         else:
             print("❌ Invalid command or missing arguments\n")
             print(__doc__)
@@ -0,0 +1,123 @@
+"""Bounded in-process caches for Senzing SDK results."""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed TTL.
+
+    A max_size of 0 (or a ttl of 0) disables the cache: every get() is a miss
+    and put() stores nothing.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry (hit/miss counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Phone formatting characters: whitespace, dashes, dots and parentheses
+_PHONE_FORMATTING = re.compile(r"[\s\-.()]")
+
+
+def _normalize_attribute(key: str, value: Any) -> Any:
+    """Normalize one search attribute value for use in a cache key."""
+    if isinstance(value, dict):
+        return _normalize_attributes(value)
+    if isinstance(value, list):
+        return [_normalize_attribute(key, item) for item in value]
+    if not isinstance(value, str):
+        return value
+    if key.endswith("PHONE_NUMBER"):
+        digits = _PHONE_FORMATTING.sub("", value).removeprefix("+")
+        # Vanity numbers such as 1-800-FLOWERS are kept as given
+        return digits if digits.isdigit() else value
+    if "EMAIL" in key:
+        return value.strip().lower()
+    if key.startswith("NAME") or "_NAME" in key:
+        return " ".join(value.split()).casefold()
+    return " ".join(value.split())
+
+
+def _normalize_attributes(attributes: dict) -> dict:
+    normalized = {}
+    for key, value in attributes.items():
+        key = str(key).strip().upper()
+        normalized[key] = _normalize_attribute(key, value)
+    return normalized
+
+
+def canonical_search_key(attributes: str) -> str:
+    """Return a canonical form of a search attribute JSON document.
+
+    Keys are upper-cased and sorted, names are whitespace-collapsed and
+    case-folded, phone numbers stripped of formatting and emails lower-cased, so
+    near-identical searches share one cache entry. Input that is not a JSON
+    object is returned unchanged.
+    """
+    try:
+        data = json.loads(attributes)
+    except (TypeError, ValueError):
+        return attributes
+    if not isinstance(data, dict):
+        return attributes
+    return json.dumps(_normalize_attributes(data), sort_keys=True, separators=(",", ":"))
@@ -0,0 +1,79 @@
+"""Concurrency helpers for sharing and limiting SDK calls."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls onto one shared future.
+
+    The first caller for a key starts the work; callers arriving while it is
+    in flight await the same future. Each caller awaits through
+    asyncio.shield(), so cancelling one caller never cancels the shared work
+    or the other callers. Keys are forgotten as soon as the work completes,
+    so results are never reused after the fact (that is the caches' job).
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Hashable, start: Callable[[], Awaitable[Any]]) -> Any:
+        """Await start() once per key among concurrent callers."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(start())
+            self._inflight[key] = future
+            future.add_done_callback(_forget_when_done(self._inflight, key))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+
+def _forget_when_done(inflight: dict, key: Hashable) -> Callable[[asyncio.Future], None]:
+    """Return a done-callback that drops key from inflight once its future finishes."""
+
+    def forget(future: asyncio.Future):
+        if inflight.get(key) is future:
+            del inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    return forget
+
+
+class Bulkhead:
+    """Concurrency limit for one class of operations, with queue-depth tracking.
+
+    A limit of 0 means unlimited (only the shared executor bounds the class).
+    """
+
+    def __init__(self, name: str, limit: int = 0):
+        self.name = name
+        self.limit = limit
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+    async def __aenter__(self):
+        if self._semaphore is not None:
+            self.waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+        self.active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.active -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        """Return the limit, running calls and queued calls."""
+        return {"limit": self.limit, "active": self.active, "waiting": self.waiting}
@@ -0,0 +1,125 @@
+"""Serve MCP sessions over a local Unix socket.
+
+In daemon mode one long-lived server process owns the Senzing engine and
+its caches, and every connection to the socket is an independent MCP
+session framed like STDIO (one JSON-RPC message per line). STDIO clients
+reach it through the senzing-mcp-shim entry point (see shim.py), so a new
+session costs a socket connect instead of a Python start and a Senzing
+factory initialization.
+
+The socket is created with owner-only permissions, in a directory only
+its owner can write to (created 0700 if missing); anyone who can connect
+can query the repository.
+"""
+
+import logging
+import os
+import signal
+import socket
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable
+
+import anyio
+from anyio.abc import SocketStream
+from anyio.streams.buffered import BufferedByteReceiveStream
+
+import mcp.types as types
+from mcp.shared.message import SessionMessage
+
+from senzing_mcp.shim import make_socket_dir
+
+logger = logging.getLogger(__name__)
+
+# Largest accepted client message (tool call arguments are small)
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+def claim_socket_path(path: str):
+    """Remove a stale socket file at path, or fail if a daemon is listening on it."""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+    raise RuntimeError(f"A server is already listening on {path}")
+
+
+@asynccontextmanager
+async def socket_session(stream: SocketStream):
+    """Bridge a connected socket to the memory streams a Server.run() expects."""
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    buffered = BufferedByteReceiveStream(stream)
+
+    async def socket_reader():
+        async with read_stream_writer:
+            while True:
+                try:
+                    line = await buffered.receive_until(b"\n", MAX_MESSAGE_BYTES)
+                except (anyio.EndOfStream, anyio.IncompleteRead, anyio.BrokenResourceError):
+                    return
+                if not line.strip():
+                    continue
+                try:
+                    message = types.JSONRPCMessage.model_validate_json(line)
+                except Exception as exc:
+                    await read_stream_writer.send(exc)
+                    continue
+                await read_stream_writer.send(SessionMessage(message))
+
+    async def socket_writer():
+        async with write_stream_reader:
+            async for session_message in write_stream_reader:
+                data = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                try:
+                    await stream.send(data.encode() + b"\n")
+                except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                    return  # client went away mid-response
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(socket_reader)
+        tg.start_soon(socket_writer)
+        try:
+            yield read_stream, write_stream
+        finally:
+            tg.cancel_scope.cancel()
+
+
+async def serve_unix_socket(path: str, run_session: Callable[..., Awaitable[None]]):
+    """Accept connections on path, running run_session(read, write) for each."""
+    make_socket_dir(path)
+    claim_socket_path(path)
+    umask = os.umask(0o077)
+    try:
+        listener = await anyio.create_unix_listener(path)
+    finally:
+        os.umask(umask)
+
+    async def handle(stream: SocketStream):
+        async with stream:
+            try:
+                async with socket_session(stream) as (read_stream, write_stream):
+                    await run_session(read_stream, write_stream)
+            except Exception as e:
+                logger.error(f"Session on {path} failed: {e}")
+
+    async def stop_on_sigterm(scope: anyio.CancelScope):
+        with anyio.open_signal_receiver(signal.SIGTERM) as signals:
+            async for _ in signals:
+                logger.info("Received SIGTERM, stopping")
+                scope.cancel()
+                return
+
+    try:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(stop_on_sigterm, tg.cancel_scope)
+            async with listener:
+                await listener.serve(handle)
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
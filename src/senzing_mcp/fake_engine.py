@@ -0,0 +1,347 @@
+"""Stand-in Senzing engine for measuring the server without a repository.
+
+FakeEngine implements the SzEngine methods the server calls and returns
+Senzing-shaped JSON. Per-method latency distributions, payload sizes and
+error rates (including stale config codes such as SENZ2062) come from a
+spec, so benchmarks can reproduce production-like load offline. Enable it
+with SENZING_MCP_FAKE_ENGINE, set to "1" for the defaults, a JSON spec, or
+the path of a JSON spec file:
+
+    {
+      "seed": 1,
+      "entities": 100000,
+      "records_per_entity": 3,
+      "related_per_entity": 5,
+      "search_results": 5,
+      "network_entities": 40,
+      "default": {"latency_ms": {"dist": "lognormal", "median": 5, "sigma": 0.5}},
+      "methods": {
+        "search_by_attributes": {"latency_ms": {"dist": "uniform", "min": 20, "max": 80},
+                                 "errors": {"SENZ2062": 0.001}},
+        "get_entity_by_entity_id": {"payload_bytes": 20000}
+      }
+    }
+
+Latency distributions are "fixed" (ms), "uniform" (min, max), "lognormal"
+(median, sigma) and "exponential" (mean). Errors map SENZ codes to
+per-call probabilities; SENZ0037 is raised as SzNotFoundError, anything
+else as SzError. Payloads are memoized per call, so the fake adds sleep
+time but little CPU of its own.
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+import zlib
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    from senzing import SzError, SzNotFoundError
+except ImportError:
+    # No SDK installed (offline benchmarks): plain exception types, which the
+    # benchmark harness's stand-in senzing module re-exports
+    class SzError(Exception):
+        """Stand-in for senzing.SzError."""
+
+    class SzNotFoundError(SzError):
+        """Stand-in for senzing.SzNotFoundError."""
+
+DEFAULT_SPEC = {
+    "seed": 1,
+    "entities": 100000,
+    "records_per_entity": 3,
+    "related_per_entity": 5,
+    "search_results": 5,
+    "network_entities": 40,
+    "config_id": 1,
+    "default": {"latency_ms": {"dist": "lognormal", "median": 5, "sigma": 0.5}},
+    "methods": {
+        "search_by_attributes": {"latency_ms": {"dist": "lognormal", "median": 25, "sigma": 0.6}},
+        "find_network_by_entity_id": {"latency_ms": {"dist": "lognormal", "median": 60, "sigma": 0.7}},
+        "find_path_by_entity_id": {"latency_ms": {"dist": "lognormal", "median": 30, "sigma": 0.7}},
+        "why_entities": {"latency_ms": {"dist": "lognormal", "median": 15, "sigma": 0.5}},
+        "how_entity_by_entity_id": {"latency_ms": {"dist": "lognormal", "median": 15, "sigma": 0.5}},
+    },
+}
+
+NOT_FOUND_CODE = "SENZ0037"
+_DATA_SOURCES = ("CUSTOMERS", "WATCHLIST", "REFERENCE")
+
+
+def load_spec(value: str) -> dict:
+    """Return the fake engine spec for a SENZING_MCP_FAKE_ENGINE value."""
+    if value.strip() in ("1", "true", "default"):
+        overrides = {}
+    elif value.lstrip().startswith("{"):
+        overrides = json.loads(value)
+    else:
+        with open(value, encoding="utf-8") as f:
+            overrides = json.load(f)
+    spec = {**DEFAULT_SPEC, **overrides}
+    spec["methods"] = {**DEFAULT_SPEC["methods"], **overrides.get("methods", {})}
+    return spec
+
+
+def build_fake_engine(spec_value: str):
+    """Engine builder (factory, engine) for in-process use and engine worker processes."""
+    spec = load_spec(spec_value)
+    # Each worker process gets its own random stream
+    spec["seed"] = spec.get("seed", 1) + os.getpid()
+    return None, FakeEngine(spec)
+
+
+def _check_list(value: Any, item_type: type, name: str):
+    """Reject arguments the SDK would not serialize (it raises TypeError too)."""
+    if value is None:
+        return
+    if not isinstance(value, list) or not all(isinstance(item, item_type) for item in value):
+        raise TypeError(f"value {value!r} for {name} should be a list of {item_type.__name__}(s)")
+
+
+class FakeEngine:
+    """SzEngine stand-in driven by a spec (see module docstring)."""
+
+    def __init__(self, spec: Optional[dict] = None, error_cls=None, not_found_cls=None):
+        self.spec = spec or load_spec("1")
+        self.error_cls = error_cls or SzError
+        self.not_found_cls = not_found_cls or SzNotFoundError
+        self.entities = int(self.spec["entities"])
+        self.calls: dict[str, int] = {}
+        self._random = random.Random(self.spec.get("seed"))
+        self._lock = threading.Lock()
+        self._payload = lru_cache(maxsize=4096)(self._build_payload)
+
+    # -- behaviour from the spec -------------------------------------------
+
+    def _method_spec(self, method: str) -> dict:
+        return {**self.spec.get("default", {}), **self.spec["methods"].get(method, {})}
+
+    def _latency(self, dist: Optional[dict]) -> float:
+        """Draw one latency in seconds."""
+        if not dist:
+            return 0.0
+        kind = dist.get("dist", "fixed")
+        with self._lock:
+            if kind == "fixed":
+                ms = dist.get("ms", 0)
+            elif kind == "uniform":
+                ms = self._random.uniform(dist["min"], dist["max"])
+            elif kind == "lognormal":
+                ms = self._random.lognormvariate(math.log(dist["median"]), dist.get("sigma", 0.5))
+            elif kind == "exponential":
+                ms = self._random.expovariate(1 / dist["mean"])
+            else:
+                raise ValueError(f"Unknown latency distribution: {kind}")
+        return ms / 1000
+
+    def _injected_error(self, errors: dict) -> Optional[str]:
+        with self._lock:
+            roll = self._random.random()
+        for code, probability in errors.items():
+            if roll < probability:
+                return code
+            roll -= probability
+        return None
+
+    def _call(self, method: str, *key) -> str:
+        """Simulate one engine call: sleep, maybe fail, then return the payload."""
+        method_spec = self._method_spec(method)
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+        delay = self._latency(method_spec.get("latency_ms"))
+        if delay:
+            time.sleep(delay)
+        code = self._injected_error(method_spec.get("errors", {}))
+        if code == NOT_FOUND_CODE:
+            raise self.not_found_cls(f"{code}|Injected fake engine not-found error")
+        if code:
+            raise self.error_cls(f"{code}|Injected fake engine error")
+        return self._payload(method, key)
+
+    # -- payloads -----------------------------------------------------------
+
+    def _check_entity(self, entity_id: int):
+        if not 0 < int(entity_id) <= self.entities:
+            raise self.not_found_cls(f"{NOT_FOUND_CODE}|Unknown resolved entity value '{entity_id}'")
+
+    def _entity_id_for(self, text: str) -> int:
+        return zlib.crc32(text.encode()) % self.entities + 1
+
+    def _record(self, entity_id: int, index: int) -> dict:
+        data_source = _DATA_SOURCES[index % len(_DATA_SOURCES)]
+        return {
+            "DATA_SOURCE": data_source,
+            "RECORD_ID": f"{entity_id}-{index}",
+            "MATCH_KEY": "+NAME+DOB" if index else "",
+            "ERRULE_CODE": "SF1_PNAME_CSTAB" if index else "",
+            "FEATURES": [{"LIB_FEAT_ID": entity_id * 100 + index, "USAGE_TYPE": ""}],
+            "JSON_DATA": {
+                "NAME_FULL": f"Entity {entity_id}",
+                "DATE_OF_BIRTH": "1980-01-01",
+                "ADDR_FULL": f"{entity_id} Main Street, Springfield",
+                "PHONE_NUMBER": f"555-{entity_id % 10000:04d}",
+            },
+        }
+
+    def _records_for(self, method: str) -> int:
+        method_spec = self._method_spec(method)
+        records = int(self.spec["records_per_entity"])
+        payload_bytes = method_spec.get("payload_bytes")
+        if payload_bytes:
+            record_size = len(json.dumps(self._record(1, 1)))
+            records = max(records, int(payload_bytes) // record_size)
+        return records
+
+    def _resolved_entity(self, entity_id: int, records: int, related: bool = True) -> dict:
+        entity = {
+            "ENTITY_ID": entity_id,
+            "ENTITY_NAME": f"Entity {entity_id}",
+            "FEATURES": {
+                "NAME": [{"FEAT_DESC": f"Entity {entity_id}", "LIB_FEAT_ID": entity_id * 10 + 1}],
+                "DOB": [{"FEAT_DESC": "1980-01-01", "LIB_FEAT_ID": entity_id * 10 + 2}],
+                "ADDRESS": [{"FEAT_DESC": f"{entity_id} Main Street, Springfield", "LIB_FEAT_ID": entity_id * 10 + 3}],
+            },
+            "RECORD_SUMMARY": [{"DATA_SOURCE": ds, "RECORD_COUNT": 1} for ds in _DATA_SOURCES[:records]],
+            "RECORDS": [self._record(entity_id, index) for index in range(records)],
+        }
+        result = {"RESOLVED_ENTITY": entity}
+        if related:
+            result["RELATED_ENTITIES"] = [
+                {
+                    "ENTITY_ID": self._related_id(entity_id, n),
+                    "ENTITY_NAME": f"Entity {self._related_id(entity_id, n)}",
+                    "MATCH_LEVEL_CODE": "POSSIBLY_RELATED",
+                    "MATCH_KEY": "+ADDRESS",
+                }
+                for n in range(int(self.spec["related_per_entity"]))
+            ]
+        return result
+
+    def _related_id(self, entity_id: int, n: int) -> int:
+        return (entity_id + (n + 1) * 7919) % self.entities + 1
+
+    def _build_payload(self, method: str, key: tuple) -> str:
+        records = self._records_for(method)
+        if method == "get_entity_by_entity_id":
+            data = self._resolved_entity(key[0], records)
+        elif method == "get_entity_by_record_id":
+            data = self._resolved_entity(self._entity_id_for(key[1]), records)
+        elif method == "search_by_attributes":
+            first = self._entity_id_for(key[0])
+            data = {"RESOLVED_ENTITIES": [
+                {
+                    "MATCH_INFO": {"MATCH_LEVEL_CODE": "RESOLVED", "MATCH_KEY": "+NAME+DOB",
+                                   "FEATURE_SCORES": {"NAME": [{"SCORE": 100 - n}]}},
+                    "ENTITY": self._resolved_entity((first + n) % self.entities + 1, records, related=False),
+                }
+                for n in range(int(self.spec["search_results"]))
+            ]}
+        elif method == "find_path_by_entity_id":
+            start, end, max_degrees = key
+            path = [start] + [self._related_id(start, n) for n in range(max(0, max_degrees - 1))] + [end]
+            data = {
+                "ENTITY_PATHS": [{"START_ENTITY_ID": start, "END_ENTITY_ID": end, "ENTITIES": path}],
+                "ENTITIES": [self._resolved_entity(eid, 1) for eid in path],
+            }
+        elif method == "find_network_by_entity_id":
+            entity_list, max_degrees, build_out, max_entities = key
+            seeds = [item["ENTITY_ID"] for item in json.loads(entity_list).get("ENTITIES", [])]
+            count = min(int(self.spec["network_entities"]) * max_degrees, max_entities)
+            members = seeds + [self._related_id(seeds[n % len(seeds)], n) for n in range(max(0, count - len(seeds)))]
+            data = {
+                "ENTITY_PATHS": [],
+                "ENTITY_NETWORK_LINKS": [
+                    {"MIN_ENTITY_ID": members[0], "MAX_ENTITY_ID": eid, "MATCH_KEY": "+ADDRESS"}
+                    for eid in members[1:]
+                ],
+                "ENTITIES": [self._resolved_entity(eid, 1) for eid in members],
+            }
+        elif method == "why_entities":
+            entity_1, entity_2 = key
+            data = {
+                "WHY_RESULTS": [{
+                    "ENTITY_ID": entity_1,
+                    "ENTITY_ID_2": entity_2,
+                    "MATCH_INFO": {
+                        "WHY_KEY": "+ADDRESS-DOB",
+                        "WHY_ERRULE_CODE": "SF1",
+                        "MATCH_LEVEL_CODE": "POSSIBLY_RELATED",
+                        "CANDIDATE_KEYS": {"ADDR_KEY": [{"FEAT_ID": entity_1, "FEAT_DESC": "MAIN|SPRINGFIELD"}]},
+                        "FEATURE_SCORES": {"ADDRESS": [{"SCORE": 95, "SCORE_BUCKET": "CLOSE"}]},
+                    },
+                }],
+                "ENTITIES": [self._resolved_entity(entity_1, records), self._resolved_entity(entity_2, records)],
+            }
+        elif method == "how_entity_by_entity_id":
+            (entity_id,) = key
+            members = [
+                {"INTERNAL_ID": entity_id * 1000 + index, "RECORDS": [
+                    {"DATA_SOURCE": record["DATA_SOURCE"], "RECORD_ID": record["RECORD_ID"]}
+                ]}
+                for index, record in enumerate(self._record(entity_id, n) for n in range(records))
+            ]
+            # Step n merges record n+1 into the virtual entity built from the first n
+            data = {"HOW_RESULTS": {
+                "RESOLUTION_STEPS": [
+                    {
+                        "STEP": step + 1,
+                        "VIRTUAL_ENTITY_1": {"VIRTUAL_ENTITY_ID": f"V{entity_id}-{step}",
+                                             "MEMBER_RECORDS": members[:step + 1]},
+                        "VIRTUAL_ENTITY_2": {"VIRTUAL_ENTITY_ID": f"V{entity_id}-{step + 1}",
+                                             "MEMBER_RECORDS": members[step + 1:step + 2]},
+                        "MATCH_INFO": {"MATCH_KEY": "+NAME+DOB", "ERRULE_CODE": "SF1_PNAME_CSTAB"},
+                    }
+                    for step in range(max(0, records - 1))
+                ],
+                "FINAL_STATE": {"NEED_REEVALUATION": 0, "VIRTUAL_ENTITIES": [{"VIRTUAL_ENTITY_ID": f"V{entity_id}"}]},
+            }}
+        else:
+            raise AttributeError(method)
+        return json.dumps(data)
+
+    # -- SzEngine methods ---------------------------------------------------
+
+    def get_entity_by_entity_id(self, entity_id: int, flags: int = 0) -> str:
+        self._check_entity(entity_id)
+        return self._call("get_entity_by_entity_id", int(entity_id))
+
+    def get_entity_by_record_id(self, data_source: str, record_id: str, flags: int = 0) -> str:
+        return self._call("get_entity_by_record_id", data_source, str(record_id))
+
+    def search_by_attributes(self, attributes: str, flags: int = 0, search_profile: str = "") -> str:
+        return self._call("search_by_attributes", attributes)
+
+    def find_path_by_entity_id(self, start_entity_id: int, end_entity_id: int, max_degrees: int,
+                               avoid_entity_ids: Any = None, required_data_sources: Any = None,
+                               flags: int = 0) -> str:
+        _check_list(avoid_entity_ids, int, "avoid_entity_ids")
+        _check_list(required_data_sources, str, "required_data_sources")
+        self._check_entity(start_entity_id)
+        self._check_entity(end_entity_id)
+        return self._call("find_path_by_entity_id", int(start_entity_id), int(end_entity_id), int(max_degrees))
+
+    def find_network_by_entity_id(self, entity_list: str, max_degrees: int, build_out_degrees: int,
+                                  build_out_max_entities: int, flags: int = 0) -> str:
+        return self._call(
+            "find_network_by_entity_id", entity_list, int(max_degrees), int(build_out_degrees),
+            int(build_out_max_entities),
+        )
+
+    def why_entities(self, entity_id_1: int, entity_id_2: int, flags: int = 0) -> str:
+        self._check_entity(entity_id_1)
+        self._check_entity(entity_id_2)
+        return self._call("why_entities", int(entity_id_1), int(entity_id_2))
+
+    def how_entity_by_entity_id(self, entity_id: int, flags: int = 0) -> str:
+        self._check_entity(entity_id)
+        return self._call("how_entity_by_entity_id", int(entity_id))
+
+    def get_active_config_id(self) -> int:
+        return int(self.spec.get("config_id", 1))
+
+    def prime_engine(self):
+        pass
@@ -0,0 +1,178 @@
+"""Formatting notes: how an assistant should present each tool's results.
+
+The notes are built once at import. Tool responses carry them according to
+the --formatting-notes mode (NoteTracker), and the server also offers them
+as MCP prompts and resources, so clients can load them once instead of
+receiving them with every call.
+"""
+
+import weakref
+from typing import Any, Optional
+
+NOTE_MODES = ("always", "first-call", "never")
+
+RAW_JSON_MARKER = "[RAW JSON DATA FOLLOWS]"
+
+# Presentation instructions per tool
+FORMATTING_NOTES = {
+    "search_entities": """[FORMATTING INSTRUCTIONS FOR SEARCH RESULTS]
+Present as clear search results:
+1. Search Summary:
+   - Number of entities found
+   - Search criteria used
+   - Score range
+2. Results Table grouped by score ranges:
+   - Strong Matches (90-100%)
+   - Good Matches (70-89%)
+   - Possible Matches (below 70%)
+   Columns: Entity ID | Name | Score | Data Sources | Key Matches
+3. Analysis:
+   - Explain what scores mean
+   - Why certain entities scored higher
+   - Notable patterns in results""",
+    "get_entity": """[FORMATTING INSTRUCTIONS FOR ENTITY DETAILS]
+Present as comprehensive entity profile:
+1. Entity Overview:
+   - Entity ID and resolved name
+   - Number of source records and data sources
+2. Source Records Section:
+   - Group by data source
+   - Show record IDs with key info and dates
+3. Resolved Features Section:
+   - Names (primary and variants)
+   - Contact Information (email, phone, address)
+   - Identifiers (DOB, SSN, employee IDs, etc.)
+4. Relationships Section (if present):
+   - Group by relationship type (Possibly Related, Possibly Same)
+   - Show entity ID, name, and connection reason
+Keep organized with clear section headers.""",
+    "get_entities": """[FORMATTING INSTRUCTIONS FOR MULTIPLE ENTITIES]
+Present as a set of entity profiles:
+1. Overview Table:
+   Columns: Entity ID | Name | Records | Data Sources | Relationships
+2. For each entity (ordered as requested):
+   - Resolved name, source records grouped by data source
+   - Key features (names, contact info, identifiers)
+   - Relationships, noting links to other entities in this set
+3. Errors: list any IDs whose value contains "error" (e.g. not found)
+Keep organized with clear section headers.""",
+    "get_source_record": """[FORMATTING INSTRUCTIONS FOR SOURCE RECORD LOOKUP]
+Present as entity profile (same format as get_entity):
+1. Start by noting which source record was queried
+2. Entity Overview:
+   - Entity ID and resolved name
+   - Number of source records and data sources
+3. Source Records Section:
+   - Highlight the queried record
+   - Group by data source
+   - Show record IDs with key info
+4. Resolved Features Section:
+   - Names, Contact Information, Identifiers
+5. Relationships Section (if present)
+Keep organized with clear section headers.""",
+    "get_source_records": """[FORMATTING INSTRUCTIONS FOR MULTIPLE SOURCE RECORDS]
+Present as a record-to-entity review:
+1. Record Mapping Table:
+   Columns: Source Record | Entity ID | Entity Name
+   - Group rows that resolved to the same entity and call them out
+   - List records that were not found or failed separately
+2. Entity Profiles (one per distinct entity):
+   - Resolved name, source records grouped by data source
+   - Key features and relationships
+3. Observations: duplicates, unexpected merges, missing records
+Keep organized with clear section headers.""",
+    "find_path": """[FORMATTING INSTRUCTIONS FOR RELATIONSHIP PATH]
+Present as connection path visualization:
+1. Path Summary:
+   - Degrees of separation
+   - Total entities in path
+   - Primary connection types
+2. Path Visualization with arrows:
+   Entity A (Name)
+       ↓ [Connection Type: details]
+   Entity B (Name)
+       ↓ [Connection Type: details]
+   Entity C (Name)
+3. Analysis:
+   - Explain what the connections mean
+   - Relationship strength/confidence
+   - Notable patterns or concerns
+Alternative: Use table format for complex paths.""",
+    "expand_network": """[FORMATTING INSTRUCTIONS FOR NETWORK EXPANSION]
+Present as organized network analysis:
+1. Network Summary:
+   - Number of entities and relationships
+   - Degrees explored
+   - Key clusters identified
+2. Organize by connection strength:
+   - Core Entities (starting points)
+   - Direct Connections (1 degree)
+   - Secondary Connections (2 degrees)
+   - For each: show entity, data sources, connection type
+3. Highlight Clusters:
+   - Group related entities (e.g., Household, Business)
+   - Explain common attributes
+Optional: Include table showing entity connections and relationship types.""",
+    "get_network_page": """[FORMATTING INSTRUCTIONS FOR NETWORK PAGE]
+Present as a continuation of the network analysis:
+1. Page position: page N of PAGES (and the degree, if filtered)
+2. Entities on this page, grouped by degree of separation:
+   - For each: entity, data sources, connection type
+3. Links to entities shown on earlier pages
+Offer the next page while NEXT_PAGE is set.""",
+    "explain_why_related": """[FORMATTING INSTRUCTIONS FOR WHY ANALYSIS]
+Present as relationship analysis:
+1. Summary:
+   - ✅ Confirmations: features that matched
+   - ❌ Denials: features that conflicted
+   - Match key used
+   - ➡️ Bottom line: final decision statement
+2. Side-by-side comparison table:
+   - Columns: Feature | Entity 1 | Entity 2 | Result
+   - Always include DATA_SOURCE row showing record counts (e.g., "CUSTOMERS:4, WATCHLIST:1")
+   - Mark matching features with ✅, conflicts with ❌
+   - Do NOT show or explain ERRULE_CODE
+Keep tone professional and concise.""",
+    "explain_how_resolved": """[FORMATTING INSTRUCTIONS FOR HOW ANALYSIS]
+Present as step-by-step resolution timeline:
+1. Summary: Which records merged, how many steps, match drivers, any conflicts
+2. Resolution Steps: For each step show:
+   - Step header with verb rules: "with" for single-to-single, "into" for single-to-group
+   - Group notation: "CUSTOMERS:1002 +3 more" not full lists
+   - Confirming features with ✅ and scores
+   - Denying features with ❌
+   - Match keys used
+3. Bottom line: Concise final decision statement with ➡️
+Keep tone professional and clear.""",
+}
+
+# Note blocks as sent ahead of a tool's raw JSON
+TOOL_NOTES = {tool: f"{note}\n\n{RAW_JSON_MARKER}\n" for tool, note in FORMATTING_NOTES.items()}
+
+
+class NoteTracker:
+    """Decides whether a tool response carries its formatting note.
+
+    "always" sends the note with every response, "first-call" only with the
+    first successful response of each tool in a session, and "never" leaves
+    notes to the prompts and resources.
+    """
+
+    def __init__(self, mode: str = "always"):
+        if mode not in NOTE_MODES:
+            raise ValueError(f"Unknown formatting notes mode '{mode}' (expected one of {', '.join(NOTE_MODES)})")
+        self.mode = mode
+        # Tools whose note each live session has received
+        self._sent: "weakref.WeakKeyDictionary[Any, set[str]]" = weakref.WeakKeyDictionary()
+
+    def note_for(self, session: Any, tool: str) -> Optional[str]:
+        """Return the note block to send with this response, or None."""
+        if self.mode == "never":
+            return None
+        if self.mode == "first-call" and session is not None and tool in self._sent.get(session, ()):
+            return None
+        return TOOL_NOTES.get(tool)
+
+    def mark_sent(self, session: Any, tool: str):
+        if self.mode == "first-call" and session is not None:
+            self._sent.setdefault(session, set()).add(tool)
@@ -0,0 +1,52 @@
+"""JSON encoding/decoding with an optional fast backend.
+
+Uses orjson when it is installed (``pip install senzing-mcp-server[fast]``)
+and falls back to the standard library otherwise. ``dumps`` always returns
+``str``, with non-ASCII characters left unescaped, so callers do not depend on
+which backend is active. Calls are
+recorded as "parse" / "serialize" spans when a tool call is being traced.
+"""
+
+import json
+from typing import Any
+
+from senzing_mcp import tracing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Raised by loads() for invalid input with either backend
+# (orjson.JSONDecodeError is a subclass of json.JSONDecodeError)
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    def loads(data: Any) -> Any:
+        """Parse JSON text (str or bytes)."""
+        if type(data) is not str and isinstance(data, str):
+            # orjson only accepts exact str, not subclasses such as SzResult;
+            # encode once rather than copying it into a new str
+            data = data.encode()
+        with tracing.span("parse"):
+            return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to compact JSON text."""
+        with tracing.span("serialize"):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+else:
+    BACKEND = "json"
+
+    def loads(data: Any) -> Any:
+        """Parse JSON text (str or bytes)."""
+        with tracing.span("parse"):
+            return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to compact JSON text."""
+        with tracing.span("serialize"):
+            return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,202 @@
+"""Lightweight Prometheus-style metrics for the MCP server.
+
+Counters and histograms are plain dicts keyed by label values and guarded by
+a lock, so recording a tool call costs a few dict updates. render() produces
+the Prometheus text exposition format; values owned by the SDK wrapper
+(executor, bulkheads, caches, SDK errors) are read at scrape time through
+collectors instead of being tracked twice.
+"""
+
+import bisect
+import threading
+from typing import Callable, Iterable
+
+# Tool latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Response size buckets in characters (256 chars .. 16M chars)
+SIZE_BUCKETS = tuple(256 * 4 ** i for i in range(9))
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# A collector returns (name, type, help, [(labels, value), ...]) families
+Family = tuple[str, str, str, list[tuple[dict, float]]]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _family_lines(name: str, kind: str, help_text: str, samples: Iterable[tuple[dict, float]]) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples)
+    return lines
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return _family_lines(self.name, "counter", self.help_text, [
+            (dict(zip(self.label_names, label_values)), value) for label_values, value in items
+        ])
+
+
+class Histogram:
+    """Fixed-bucket histogram with optional labels."""
+
+    def __init__(self, name: str, help_text: str, buckets: tuple, label_names: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.label_names = label_names
+        # label values -> [per-bucket counts (last is +Inf), sum]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, *label_values) -> int:
+        entry = self._values.get(label_values)
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._values.items())
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total) in items:
+            labels = dict(zip(self.label_names, label_values))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors and renders them as text."""
+
+    def __init__(self):
+        self._metrics: list = []
+        self._collectors: list[Callable[[], Iterable[Family]]] = []
+
+    def counter(self, name: str, help_text: str, label_names: tuple = ()) -> Counter:
+        metric = Counter(name, help_text, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, buckets: tuple, label_names: tuple = ()) -> Histogram:
+        metric = Histogram(name, help_text, buckets, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]):
+        """Register a callable returning metric families to read at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                lines.extend(_family_lines(name, kind, help_text, samples))
+        return "\n".join(lines) + "\n"
+
+
+class ToolMetrics:
+    """Per-tool call counts, latency and response size."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.calls = registry.counter(
+            "senzing_mcp_tool_calls_total", "MCP tool calls by tool and outcome", ("tool", "outcome")
+        )
+        self.latency = registry.histogram(
+            "senzing_mcp_tool_latency_seconds", "MCP tool call latency", LATENCY_BUCKETS, ("tool",)
+        )
+        self.response_size = registry.histogram(
+            "senzing_mcp_tool_response_chars", "MCP tool response size in characters", SIZE_BUCKETS, ("tool",)
+        )
+
+    def observe(self, tool: str, seconds: float, response_chars: int, error: bool):
+        self.calls.inc(tool, "error" if error else "ok")
+        self.latency.observe(seconds, tool)
+        self.response_size.observe(response_chars, tool)
+
+
+def sdk_wrapper_collector(wrapper) -> Callable[[], list[Family]]:
+    """Return a collector exporting a SenzingSDKWrapper's runtime state."""
+
+    def collect() -> list[Family]:
+        concurrency = wrapper.concurrency_stats()
+        executor = concurrency["executor"]
+        bulkheads = concurrency["bulkheads"]
+        caches = wrapper.cache_stats()
+        return [
+            ("senzing_mcp_sdk_errors_total", "counter", "Senzing SDK errors by SENZ code",
+             [({"code": code}, count) for code, count in sorted(wrapper.sdk_errors.items())]),
+            ("senzing_mcp_reinitializations_total", "counter", "Engine rebuilds after config changes",
+             [({}, wrapper.reinit_count)]),
+            ("senzing_mcp_coalesced_calls_total", "counter", "Engine calls served by an identical call in flight",
+             [({}, concurrency["coalesced_calls"])]),
+            ("senzing_mcp_executor_max_workers", "gauge", "SDK executor thread limit",
+             [({}, executor["max_workers"])]),
+            ("senzing_mcp_executor_active", "gauge", "SDK calls running or queued on the executor",
+             [({}, executor["active"])]),
+            ("senzing_mcp_executor_queued", "gauge", "SDK calls waiting for an executor thread",
+             [({}, executor["queued"])]),
+            ("senzing_mcp_bulkhead_active", "gauge", "Engine calls running per operation class",
+             [({"class": name}, stats["active"]) for name, stats in bulkheads.items()]),
+            ("senzing_mcp_bulkhead_waiting", "gauge", "Engine calls waiting per operation class",
+             [({"class": name}, stats["waiting"]) for name, stats in bulkheads.items()]),
+            ("senzing_mcp_cache_entries", "gauge", "Entries held per result cache",
+             [({"cache": name}, stats["size"]) for name, stats in caches.items()]),
+            ("senzing_mcp_cache_hits_total", "counter", "Result cache hits",
+             [({"cache": name}, stats["hits"]) for name, stats in caches.items()]),
+            ("senzing_mcp_cache_misses_total", "counter", "Result cache misses",
+             [({"cache": name}, stats["misses"]) for name, stats in caches.items()]),
+            ("senzing_mcp_cache_hit_ratio", "gauge", "Result cache hit ratio since start",
+             [({"cache": name}, stats["hit_ratio"]) for name, stats in caches.items()]),
+        ]
+
+    return collect
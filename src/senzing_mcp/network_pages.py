@@ -0,0 +1,151 @@
+"""Cursor-based paging of expand_network results.
+
+A network expansion larger than one page is run once and held in a
+bounded, expiring store. The tool returns the first page with a PAGE_INFO
+block carrying a cursor, and get_network_page serves later pages, either
+in order or restricted to one degree of separation. Entities are ordered
+by degree (seed entities first) and pre-serialized when stored, so a page
+is built by joining strings.
+
+The store lives in the server process, so a cursor is only valid there.
+Stateless HTTP (including --workers) turns paging off and returns whole
+networks, since the next request may be served by another process.
+"""
+
+import os
+import secrets
+from collections import deque
+from typing import Optional
+
+from senzing_mcp import jsonutil
+from senzing_mcp.cache import TTLCache
+from senzing_mcp.results import SzResult
+
+
+class PagedNetwork:
+    """One stored network: entities in degree order and the links touching each."""
+
+    def __init__(self, data: dict, seeds: list[int], page_size: int):
+        self.page_size = page_size
+        links = data.get("ENTITY_NETWORK_LINKS", [])
+        entities = data.get("ENTITIES", [])
+        ids = [entity.get("RESOLVED_ENTITY", {}).get("ENTITY_ID") for entity in entities]
+        degrees = _degrees(seeds, links)
+        order = sorted(range(len(entities)), key=lambda i: (degrees.get(ids[i]) is None, degrees.get(ids[i], 0), i))
+
+        self.ids = [ids[i] for i in order]
+        self.degrees = [degrees.get(entity_id) for entity_id in self.ids]
+        self.entities = [jsonutil.dumps(entities[i]) for i in order]
+        self.links = [jsonutil.dumps(link) for link in links]
+        self.paths = jsonutil.dumps(data.get("ENTITY_PATHS", []))
+        # Links touching each entity, by index into self.links
+        self.entity_links: dict[int, list[int]] = {}
+        for index, link in enumerate(links):
+            for entity_id in {link.get("MIN_ENTITY_ID"), link.get("MAX_ENTITY_ID")}:
+                self.entity_links.setdefault(entity_id, []).append(index)
+
+        self.by_degree: dict[str, int] = {}
+        for degree in self.degrees:
+            key = "unknown" if degree is None else str(degree)
+            self.by_degree[key] = self.by_degree.get(key, 0) + 1
+
+    def page(self, cursor: str, page: int, degree: Optional[int] = None) -> SzResult:
+        """Build page (1-based), optionally of the entities at one degree only."""
+        if degree is None:
+            selected = range(len(self.entities))
+        else:
+            selected = [index for index, value in enumerate(self.degrees) if value == degree]
+            if not selected:
+                return SzResult.from_error(f"No entities at degree {degree}", cursor=cursor,
+                                           entities_by_degree=self.by_degree)
+        pages = max(1, -(-len(selected) // self.page_size))
+        if not 1 <= page <= pages:
+            return SzResult.from_error(f"Page {page} out of range (1-{pages})", cursor=cursor)
+
+        indexes = selected[(page - 1) * self.page_size:page * self.page_size]
+        link_indexes = sorted({link for index in indexes for link in self.entity_links.get(self.ids[index], ())})
+        info = {
+            "CURSOR": cursor,
+            "PAGE": page,
+            "PAGES": pages,
+            "PAGE_SIZE": self.page_size,
+            "DEGREE": degree,
+            "TOTAL_ENTITIES": len(selected),
+            "ENTITIES_BY_DEGREE": self.by_degree,
+            "NEXT_PAGE": page + 1 if page < pages else None,
+        }
+        return SzResult(
+            '{"ENTITY_PATHS":' + (self.paths if page == 1 and degree is None else "[]")
+            + ',"ENTITY_NETWORK_LINKS":[' + ",".join(self.links[i] for i in link_indexes)
+            + '],"ENTITIES":[' + ",".join(self.entities[i] for i in indexes)
+            + '],"PAGE_INFO":' + jsonutil.dumps(info) + '}'
+        )
+
+
+def _degrees(seeds: list[int], links: list[dict]) -> dict[int, int]:
+    """Degree of separation of each linked entity from the nearest seed."""
+    neighbours: dict[int, list[int]] = {}
+    for link in links:
+        a, b = link.get("MIN_ENTITY_ID"), link.get("MAX_ENTITY_ID")
+        neighbours.setdefault(a, []).append(b)
+        neighbours.setdefault(b, []).append(a)
+    degrees = {seed: 0 for seed in seeds}
+    queue = deque(seeds)
+    while queue:
+        entity_id = queue.popleft()
+        for neighbour in neighbours.get(entity_id, ()):
+            if neighbour not in degrees:
+                degrees[neighbour] = degrees[entity_id] + 1
+                queue.append(neighbour)
+    return degrees
+
+
+class NetworkPages:
+    """Bounded, expiring store of paged networks keyed by cursor."""
+
+    def __init__(self):
+        # Networks with more entities than this are paged (0 = never page)
+        self.page_size = int(os.getenv("SENZING_MCP_NETWORK_PAGE_SIZE", "50"))
+        self.store = TTLCache(
+            max_size=int(os.getenv("SENZING_MCP_NETWORK_STORE_SIZE", "32")),
+            ttl=float(os.getenv("SENZING_MCP_NETWORK_STORE_TTL", "600")),
+        )
+
+    def disable(self):
+        """Turn paging off, including per-call page sizes: networks are returned whole."""
+        self.page_size = 0
+        self.store.max_size = 0
+
+    def first_page(
+        self, result: str, seeds: list[int], page_size: Optional[int] = None, max_entities: Optional[int] = None
+    ) -> str:
+        """Store a network larger than one page and return its first page.
+
+        Errors, small networks and a page_size of 0 return result unchanged.
+        Networks that cannot exceed a page (max_entities, the call's own
+        limit, or the count of entities in the raw text) are not parsed.
+        """
+        page_size = self.page_size if page_size is None else page_size
+        if page_size <= 0 or not self.store.enabled or getattr(result, "is_error", False):
+            return result
+        if max_entities is not None and max_entities <= page_size:
+            return result
+        # Every network entity has one RESOLVED_ENTITY; a scan is far cheaper than a parse
+        if result.count('"RESOLVED_ENTITY"') <= page_size:
+            return result
+        data = jsonutil.loads(result)
+        if len(data.get("ENTITIES", [])) <= page_size:
+            return result
+        network = PagedNetwork(data, seeds, page_size)
+        cursor = secrets.token_urlsafe(12)
+        self.store.put(cursor, network)
+        return network.page(cursor, 1)
+
+    def page(self, cursor: str, page: int = 1, degree: Optional[int] = None) -> SzResult:
+        """Return a page of a stored network, or an error for an unknown or expired cursor."""
+        network = self.store.get(cursor)
+        if network is None:
+            return SzResult.from_error("Unknown or expired cursor; run expand_network again", cursor=cursor)
+        # Storing it again restarts its expiry, so a network expires after inactivity
+        self.store.put(cursor, network)
+        return network.page(cursor, page, degree)
@@ -0,0 +1,201 @@
+"""Include/exclude projection of engine responses.
+
+Paths are dot-separated key names matched from the top of the response;
+lists are transparent (a path applies to every element), "*" matches any
+key and, in exclude paths only, "**" matches any depth:
+
+    RESOLVED_ENTITY.RECORDS.UNMAPPED_DATA     one section of every record
+    RESOLVED_ENTITY.FEATURES.*                every feature type
+    **.FEATURE_SCORES                         wherever it appears
+
+Include paths keep only the named sections (a path keeps its whole
+subtree), plus the top-level PAGE_INFO of paged responses; exclude paths
+then drop sections. The response is parsed once
+and pruned in place, then serialized, so no second copy of the tree is
+built. An exclude-only projection first checks the raw payload for the
+excluded key names and returns it untouched (without parsing) when none
+occur.
+
+Projections are configured per tool with SENZING_MCP_PROJECTION (inline
+JSON or a file path), keyed by tool name, "*" applying to tools without
+their own entry:
+
+    {"*": {"exclude": ["**.UNMAPPED_DATA"]},
+     "get_entity": {"exclude": ["**.RECORD_FEATURES", "**.UNMAPPED_DATA"]}}
+
+Tool calls can pass their own include/exclude lists instead.
+"""
+
+import json
+import os
+from typing import Any, Iterable, Optional
+
+from senzing_mcp import jsonutil, tracing
+from senzing_mcp.results import SzResult
+
+# Marks an include-trie node whose whole subtree is kept
+_KEEP = True
+
+# Top-level sections every include keeps (paging state must survive a projection)
+_ALWAYS_INCLUDED = ("PAGE_INFO",)
+
+
+def _check_paths(paths: Any, name: str) -> Iterable[str]:
+    """Return paths if it is a list of strings (a bare string would be read one character at a time)."""
+    if not isinstance(paths, (list, tuple)) or not all(isinstance(path, str) for path in paths):
+        raise ValueError(f"Projection '{name}' must be a list of key path strings, got {paths!r}")
+    return paths
+
+
+def _split(path: str) -> tuple[str, ...]:
+    segments = tuple(segment for segment in path.strip().split(".") if segment)
+    if not segments:
+        raise ValueError(f"Empty projection path: {path!r}")
+    return segments
+
+
+class Projection:
+    """A compiled include/exclude spec."""
+
+    def __init__(self, include: Iterable[str] = (), exclude: Iterable[str] = ()):
+        self.include = [_split(path) for path in _check_paths(include, "include")]
+        self.exclude = [_split(path) for path in _check_paths(exclude, "exclude")]
+        # "**.NAME" paths are dropped together in one walk over the tree
+        self._anywhere = frozenset(path[1] for path in self.exclude if len(path) == 2 and path[0] == "**")
+        self._paths = [path for path in self.exclude if not (len(path) == 2 and path[0] == "**")]
+        if any("**" in path for path in self.include):
+            raise ValueError("'**' is only supported in exclude paths")
+        self._trie = self._build_trie(self.include + [(key,) for key in _ALWAYS_INCLUDED]) if self.include else None
+        # Exclude-only projections can skip responses that lack every excluded key
+        self._markers = None
+        if not self.include:
+            names = [next((s for s in reversed(path) if s not in ("*", "**")), None) for path in self.exclude]
+            if None not in names:
+                self._markers = [f'"{name}"' for name in set(names)]
+
+    def __bool__(self):
+        return bool(self.include or self.exclude)
+
+    @staticmethod
+    def _build_trie(paths: list[tuple[str, ...]]) -> dict:
+        trie: dict = {}
+        for path in paths:
+            node = trie
+            for segment in path[:-1]:
+                child = node.get(segment)
+                if child is _KEEP:
+                    break
+                node = node.setdefault(segment, {})
+            else:
+                node[path[-1]] = _KEEP
+        return trie
+
+    def apply(self, result: str) -> str:
+        """Return result with the projection applied (errors pass through)."""
+        if not self or getattr(result, "is_error", False):
+            return result
+        if self._markers is not None and not any(marker in result for marker in self._markers):
+            return result
+        with tracing.span("project"):
+            data = jsonutil.loads(result)
+            self.prune(data)
+            projected = jsonutil.dumps(data)
+        return SzResult(projected) if isinstance(result, SzResult) else projected
+
+    def prune(self, data: Any) -> Any:
+        """Apply the projection to a parsed response in place."""
+        if self._trie is not None:
+            _keep_only(data, self._trie)
+        if self._anywhere:
+            _drop_anywhere(data, self._anywhere)
+        for path in self._paths:
+            _drop(data, path)
+        return data
+
+
+def _keep_only(node: Any, trie: dict):
+    if isinstance(node, list):
+        for item in node:
+            _keep_only(item, trie)
+        return
+    if not isinstance(node, dict):
+        return
+    star = trie.get("*")
+    for key in list(node):
+        sub = trie.get(key)
+        if sub is _KEEP or star is _KEEP:
+            continue
+        if sub is None and star is None:
+            del node[key]
+        elif sub is None or star is None:
+            _keep_only(node[key], sub if star is None else star)
+        else:
+            _keep_only(node[key], {**star, **sub})
+
+
+def _drop_anywhere(root: Any, names: frozenset):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            for name in names.intersection(node):
+                del node[name]
+            stack.extend(value for value in node.values() if type(value) is dict or type(value) is list)
+        elif type(node) is list:
+            stack.extend(value for value in node if type(value) is dict or type(value) is list)
+
+
+def _drop(node: Any, path: tuple[str, ...]):
+    if isinstance(node, list):
+        for item in node:
+            _drop(item, path)
+        return
+    if not isinstance(node, dict):
+        return
+    head, rest = path[0], path[1:]
+    if head == "**":
+        if rest:
+            _drop(node, rest)
+        for value in list(node.values()):
+            _drop(value, path)
+        return
+    keys = list(node) if head == "*" else ([head] if head in node else [])
+    for key in keys:
+        if rest:
+            _drop(node[key], rest)
+        else:
+            del node[key]
+
+
+class ProjectionConfig:
+    """Per-tool projections, with "*" as the default for other tools."""
+
+    def __init__(self, specs: Optional[dict] = None):
+        self.projections: dict[str, Projection] = {}
+        self.set_specs(specs or {})
+
+    def set_specs(self, specs: dict):
+        """Replace the projections with {tool: {"include": [...], "exclude": [...]}}."""
+        self.projections = {
+            tool: Projection(spec.get("include", ()), spec.get("exclude", ()))
+            for tool, spec in specs.items()
+        }
+
+    def load(self, value: str):
+        """Load a SENZING_MCP_PROJECTION value: inline JSON, a file path or empty (off)."""
+        value = value.strip()
+        if not value:
+            self.set_specs({})
+        elif value.startswith("{"):
+            self.set_specs(json.loads(value))
+        else:
+            with open(os.path.expanduser(value)) as f:
+                self.set_specs(json.load(f))
+
+    def for_call(self, tool: str, arguments: dict) -> Projection:
+        """Return the projection for a call: its include/exclude arguments, else the tool's."""
+        include = arguments.get("include")
+        exclude = arguments.get("exclude")
+        if include or exclude:
+            return Projection(include or (), exclude or ())
+        return self.projections.get(tool) or self.projections.get("*") or Projection()
@@ -0,0 +1,177 @@
+"""Record real SDK calls and replay them without Senzing.
+
+RecordingEngine wraps an engine and appends every call (method, arguments,
+raw response or error, duration) to a JSON Lines fixture store.
+ReplayEngine serves those responses back, sleeping for the recorded
+duration, so traffic captured once against a real repository can be
+replayed in CI to catch latency and memory regressions in the server layer.
+
+Enable recording with SENZING_MCP_RECORD_FILE=PATH and replay with
+SENZING_MCP_REPLAY_FILE=PATH (SENZING_MCP_REPLAY_SPEED scales the recorded
+timings: 1 = original, 0 = no delay). Paths ending in .gz are gzipped.
+"""
+
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from functools import update_wrapper
+from typing import Any, Callable, Optional, TextIO
+
+try:
+    from senzing import SzError, SzNotFoundError
+except ImportError:
+    from senzing_mcp.fake_engine import SzError, SzNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed call has no recorded response."""
+
+
+def _open(path: str, mode: str) -> TextIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def call_key(method: str, args: tuple, kwargs: Optional[dict] = None) -> str:
+    """Return the fixture lookup key for a call."""
+    key = method + json.dumps(list(args), separators=(",", ":"), default=str)
+    if kwargs:
+        key += json.dumps(kwargs, separators=(",", ":"), sort_keys=True, default=str)
+    return key
+
+
+class FixtureWriter:
+    """Thread-safe appender for a fixture store, shared across engine rebuilds."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = _open(path, "a")
+        self._lock = threading.Lock()
+
+    def write(self, method: str, args: tuple, kwargs: dict, duration: float, **outcome):
+        entry = {
+            "method": method,
+            "args": list(args),
+            **({"kwargs": kwargs} if kwargs else {}),
+            "duration_ms": round(duration * 1000, 3),
+            "timestamp": time.time(),
+            **outcome,
+        }
+        line = json.dumps(entry, separators=(",", ":"), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class RecordingEngine:
+    """Engine proxy that records each call to a fixture store."""
+
+    def __init__(self, engine: Any, writer: FixtureWriter):
+        self._engine = engine
+        self._writer = writer
+        # One wrapper per method, so equal calls still coalesce in _run_async
+        self._methods: dict[str, Callable] = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = self._methods.get(name)
+        if method is None:
+            target = getattr(self._engine, name)
+            if not callable(target):
+                return target
+            method = self._methods[name] = self._recorder(name, target)
+        return method
+
+    def _recorder(self, name: str, target: Callable) -> Callable:
+        def record(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = target(*args, **kwargs)
+            except Exception as e:
+                self._writer.write(name, args, kwargs, time.perf_counter() - start, error={
+                    "type": type(e).__name__,
+                    "message": str(e),
+                    "not_found": isinstance(e, SzNotFoundError),
+                })
+                raise
+            self._writer.write(name, args, kwargs, time.perf_counter() - start, result=result)
+            return result
+
+        return update_wrapper(record, target)
+
+
+class ReplayEngine:
+    """Engine stand-in that serves responses from a fixture store.
+
+    Repeated identical calls are answered with the recorded responses in
+    order, cycling when they run out. speed scales the recorded durations
+    (1 = original timing, 0 = no delay).
+    """
+
+    def __init__(self, path: str, speed: float = 1.0):
+        self.path = path
+        self.speed = speed
+        self._entries: dict[str, list[dict]] = defaultdict(list)
+        self._next: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        with _open(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    key = call_key(entry["method"], tuple(entry["args"]), entry.get("kwargs"))
+                    self._entries[key].append(entry)
+        self._methods = {key.split("[", 1)[0] for key in self._entries}
+        logger.info(f"Loaded {sum(map(len, self._entries.values()))} recorded SDK calls from {path}")
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name == "prime_engine" and name not in self._methods:
+            return lambda: None
+        if name not in self._methods:
+            raise AttributeError(f"No recorded calls for {name}")
+        replay = _ReplayMethod(self, name)
+        # Cache per method, so equal calls still coalesce in _run_async
+        setattr(self, name, replay)
+        return replay
+
+    def replay(self, method: str, args: tuple, kwargs: Optional[dict] = None) -> Any:
+        key = call_key(method, args, kwargs)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise ReplayMissError(f"No recorded response for {method}{list(args)}{kwargs or ''}")
+            entry = entries[self._next[key] % len(entries)]
+            self._next[key] += 1
+        if self.speed > 0:
+            time.sleep(entry["duration_ms"] / 1000 / self.speed)
+        error = entry.get("error")
+        if error is not None:
+            raise (SzNotFoundError if error.get("not_found") else SzError)(error["message"])
+        return entry["result"]
+
+
+class _ReplayMethod:
+    """Bound replay of one engine method (named like the real method)."""
+
+    def __init__(self, engine: ReplayEngine, name: str):
+        self._engine = engine
+        self.__name__ = name
+
+    def __call__(self, *args, **kwargs):
+        return self._engine.replay(self.__name__, args, kwargs)
+
+
+def build_replay_engine(path: str, speed: float = 1.0):
+    """Engine builder (factory, engine) for in-process use and engine worker processes."""
+    return None, ReplayEngine(path, speed)
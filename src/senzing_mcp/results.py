@@ -0,0 +1,30 @@
+"""Typed results returned by the SDK wrapper."""
+
+from typing import Any, Optional
+
+from senzing_mcp import jsonutil
+
+
+class SzResult(str):
+    """JSON text returned by a wrapper call, flagged as success or error.
+
+    Subclasses ``str`` so results can be used anywhere the raw engine JSON
+    was used before, while letting the server check ``is_error`` instead of
+    re-parsing (potentially multi-megabyte) success payloads.
+    """
+
+    error: Optional[str]
+
+    def __new__(cls, payload: str, error: Optional[str] = None):
+        result = super().__new__(cls, payload)
+        result.error = error
+        return result
+
+    @property
+    def is_error(self) -> bool:
+        return self.error is not None
+
+    @classmethod
+    def from_error(cls, error: str, **details: Any) -> "SzResult":
+        """Build an error result whose payload is {"error": error, **details}."""
+        return cls(jsonutil.dumps({"error": error, **details}), error=error)
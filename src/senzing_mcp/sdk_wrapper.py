@@ -1,12 +1,25 @@
 """Wrapper for Senzing SDK to provide async interface and initialization."""
 
 import asyncio
-import json
 import logging
 import os
+import re
+import threading
+import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from senzing_mcp import jsonutil, tracing
+from senzing_mcp.cache import TTLCache, canonical_search_key
+from senzing_mcp.concurrency import Bulkhead, SingleFlight
+from senzing_mcp.results import SzResult
+
+if TYPE_CHECKING:
+    # Imported where used, so a plain in-process engine does not load them
+    from senzing_mcp.replay import FixtureWriter
+    from senzing_mcp.worker_pool import EngineWorkerPool
 
 # Import Senzing SDK modules
 # Note: Senzing environment must be initialized before running this module
@@ -31,6 +44,159 @@ logger = logging.getLogger(__name__)
 # Error codes that indicate stale configuration requiring reinit
 STALE_CONFIG_ERROR_CODES = ["SENZ2062", "SENZ0033"]
 
+# SENZ error code at the start of an SzError message, e.g. "SENZ2062|..."
+SENZ_CODE_PATTERN = re.compile(r"SENZ\d+")
+
+# Engine methods grouped into operation classes, each with its own bulkhead
+OPERATION_CLASSES = {
+    "get_entity_by_entity_id": "lookup",
+    "get_entity_by_record_id": "lookup",
+    "search_by_attributes": "search",
+    "find_path_by_entity_id": "network",
+    "find_network_by_entity_id": "network",
+    "why_entities": "explain",
+    "how_entity_by_entity_id": "explain",
+}
+
+# Default per-class concurrency limits (0 = bounded only by the executor).
+# Heavy classes together stay below the default pool size, so cheap lookups
+# always have threads available.
+DEFAULT_BULKHEAD_LIMITS = {"lookup": 0, "search": 3, "network": 2, "explain": 2}
+
+# Response detail levels, cheapest first; "full" is what sz_explorer requests
+DETAIL_LEVELS = ("summary", "standard", "full")
+
+
+def _detail_flag_sets() -> dict[str, dict[str, int]]:
+    """Engine flags per method and detail level."""
+    F = SzEngineFlags
+    entity_standard = (
+        F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+        F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY |
+        F.SZ_ENTITY_INCLUDE_RECORD_DATA |
+        F.SZ_ENTITY_INCLUDE_RECORD_MATCHING_INFO |
+        F.SZ_ENTITY_INCLUDE_REPRESENTATIVE_FEATURES |
+        F.SZ_ENTITY_INCLUDE_ALL_RELATIONS |
+        F.SZ_ENTITY_INCLUDE_RELATED_ENTITY_NAME |
+        F.SZ_ENTITY_INCLUDE_RELATED_MATCHING_INFO |
+        F.SZ_ENTITY_INCLUDE_RELATED_RECORD_SUMMARY
+    )
+    path_standard = (
+        F.SZ_FIND_PATH_INCLUDE_MATCHING_INFO |
+        F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+        F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY
+    )
+    network_standard = (
+        F.SZ_FIND_NETWORK_INCLUDE_MATCHING_INFO |
+        F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+        F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY
+    )
+    return {
+        "get_entity_by_entity_id": {
+            "summary": F.SZ_ENTITY_INCLUDE_ENTITY_NAME | F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY,
+            "standard": entity_standard,
+            # Same as sz_explorer's get command
+            "full": (
+                F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+                F.SZ_ENTITY_INCLUDE_RECORD_DATA |
+                F.SZ_ENTITY_INCLUDE_RECORD_MATCHING_INFO |
+                F.SZ_ENTITY_INCLUDE_ALL_RELATIONS |
+                F.SZ_ENTITY_INCLUDE_RELATED_ENTITY_NAME |
+                F.SZ_ENTITY_INCLUDE_RELATED_MATCHING_INFO |
+                F.SZ_ENTITY_INCLUDE_RELATED_RECORD_SUMMARY |
+                F.SZ_ENTITY_INCLUDE_RECORD_FEATURES |
+                F.SZ_ENTITY_INCLUDE_ALL_FEATURES |
+                F.SZ_ENTITY_INCLUDE_RECORD_UNMAPPED_DATA
+            ),
+        },
+        "search_by_attributes": {
+            "summary": (
+                F.SZ_SEARCH_INCLUDE_ALL_ENTITIES |
+                F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+                F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY
+            ),
+            "standard": (
+                F.SZ_SEARCH_INCLUDE_ALL_ENTITIES |
+                F.SZ_INCLUDE_FEATURE_SCORES |
+                F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+                F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY |
+                F.SZ_ENTITY_INCLUDE_RECORD_DATA |
+                F.SZ_ENTITY_INCLUDE_REPRESENTATIVE_FEATURES
+            ),
+            # Same as sz_explorer's search command
+            "full": (
+                F.SZ_SEARCH_INCLUDE_ALL_ENTITIES |
+                F.SZ_INCLUDE_FEATURE_SCORES |
+                F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+                F.SZ_ENTITY_INCLUDE_RECORD_DATA |
+                F.SZ_INCLUDE_MATCH_KEY_DETAILS |
+                F.SZ_SEARCH_INCLUDE_STATS |
+                F.SZ_ENTITY_INCLUDE_ALL_RELATIONS |
+                F.SZ_ENTITY_INCLUDE_RELATED_MATCHING_INFO
+            ),
+        },
+        "find_path_by_entity_id": {
+            "summary": F.SZ_ENTITY_INCLUDE_ENTITY_NAME | F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY,
+            "standard": path_standard,
+            "full": path_standard | F.SZ_ENTITY_INCLUDE_RECORD_DATA | F.SZ_ENTITY_INCLUDE_REPRESENTATIVE_FEATURES,
+        },
+        # Every level keeps the network links: paging orders entities by degree from them
+        "find_network_by_entity_id": {
+            "summary": (
+                F.SZ_FIND_NETWORK_INCLUDE_MATCHING_INFO |
+                F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+                F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY
+            ),
+            "standard": network_standard,
+            "full": network_standard | F.SZ_ENTITY_INCLUDE_RECORD_DATA | F.SZ_ENTITY_INCLUDE_REPRESENTATIVE_FEATURES,
+        },
+        "why_entities": {
+            "summary": F.SZ_ENTITY_INCLUDE_ENTITY_NAME | F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY,
+            "standard": F.SZ_ENTITY_DEFAULT_FLAGS | F.SZ_INCLUDE_FEATURE_SCORES,
+            # Same as sz_explorer's why command (why_not)
+            "full": (
+                F.SZ_ENTITY_DEFAULT_FLAGS |
+                F.SZ_ENTITY_INCLUDE_INTERNAL_FEATURES |
+                F.SZ_ENTITY_INCLUDE_FEATURE_STATS |
+                F.SZ_INCLUDE_FEATURE_SCORES |
+                F.SZ_INCLUDE_MATCH_KEY_DETAILS
+            ),
+        },
+        "how_entity_by_entity_id": {
+            "summary": F.SZ_ENTITY_INCLUDE_ENTITY_NAME | F.SZ_ENTITY_INCLUDE_RECORD_SUMMARY,
+            "standard": F.SZ_ENTITY_INCLUDE_ENTITY_NAME | F.SZ_INCLUDE_MATCH_KEY_DETAILS,
+            # Same as sz_explorer's how command (get_how_data)
+            "full": (
+                F.SZ_ENTITY_INCLUDE_ENTITY_NAME |
+                F.SZ_ENTITY_INCLUDE_ALL_FEATURES |
+                F.SZ_ENTITY_INCLUDE_INTERNAL_FEATURES |
+                F.SZ_ENTITY_INCLUDE_FEATURE_STATS |
+                F.SZ_ENTITY_INCLUDE_RECORD_DATA |
+                F.SZ_ENTITY_INCLUDE_RECORD_FEATURES |
+                F.SZ_INCLUDE_MATCH_KEY_DETAILS
+            ),
+        },
+    }
+
+
+DETAIL_FLAGS = _detail_flag_sets()
+
+
+def detail_flags(method: str, detail: str) -> int:
+    """Return the engine flags for method at a detail level."""
+    try:
+        return DETAIL_FLAGS[method][detail]
+    except KeyError:
+        raise ValueError(
+            f"Unknown detail level {detail!r}, expected one of: {', '.join(DETAIL_LEVELS)}"
+        ) from None
+
+
+def _log_destroy_error(future):
+    """Log a failure to destroy a retired engine."""
+    if not future.cancelled() and future.exception():
+        logger.warning(f"Error destroying retired Senzing engine: {future.exception()}")
+
 
 class SenzingSDKWrapper:
     """Async wrapper for Senzing SDK."""
@@ -38,44 +204,203 @@ class SenzingSDKWrapper:
     def __init__(self):
         self.factory: Optional[SzAbstractFactoryCore] = None
         self.engine: Optional[SzEngine] = None
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.bulkheads: dict[str, Bulkhead] = {}
+        # SDK calls submitted to the executor and not yet returned, and those
+        # of them still waiting for a thread (updated from executor threads)
+        self.executor_active = 0
+        self.executor_queued = 0
+        self._executor_lock = threading.Lock()
+        self.configure_concurrency()
+        # With engine_workers > 0, engine calls run in that many worker
+        # processes (each with its own factory/engine) instead of in-process
+        self.engine_workers = int(os.getenv("SENZING_MCP_ENGINE_WORKERS", "0"))
+        self.worker_pool: Optional["EngineWorkerPool"] = None
+        # Fake engine spec ("1", JSON or a file path) to run without a
+        # Senzing repository, for benchmarks; see fake_engine.py
+        self.fake_engine = os.getenv("SENZING_MCP_FAKE_ENGINE", "")
+        # Record SDK calls to, or replay them from, a fixture store; see replay.py
+        self.record_file = os.getenv("SENZING_MCP_RECORD_FILE", "")
+        self.replay_file = os.getenv("SENZING_MCP_REPLAY_FILE", "")
+        self.replay_speed = float(os.getenv("SENZING_MCP_REPLAY_SPEED", "1"))
+        self._fixture_writer: Optional["FixtureWriter"] = None
         self._initialized = False
         self._reinit_lock = asyncio.Lock()
+        # Engine generation: bumped each time a rebuilt engine is swapped in.
+        # Calls in flight are counted per generation so a retired engine
+        # (kept in _retired) is destroyed only after its calls finish.
+        self._generation = 0
+        self._inflight: Counter = Counter()
+        self._retired: dict[int, tuple] = {}
+        # SDK error counts by SENZ code and engine rebuild count, for /metrics
+        self.sdk_errors: Counter = Counter()
+        self.reinit_count = 0
+        # Successful entity lookups keyed by (operation, ids..., flags);
+        # cleared on reinitialize() since a new config can change resolution
+        self.entity_cache = TTLCache(
+            max_size=int(os.getenv("SENZING_MCP_ENTITY_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("SENZING_MCP_ENTITY_CACHE_TTL", "300")),
+        )
+        # Search results keyed by the canonical attribute form and flags
+        self.search_cache = TTLCache(
+            max_size=int(os.getenv("SENZING_MCP_SEARCH_CACHE_SIZE", "256")),
+            ttl=float(os.getenv("SENZING_MCP_SEARCH_CACHE_TTL", "120")),
+        )
+        # Searches returning at most this many entities get full feature details
+        self.search_enrich_max = int(os.getenv("SENZING_MCP_SEARCH_ENRICH_MAX", "10"))
+        # Maximum concurrent engine calls per batch request
+        self.batch_concurrency = int(os.getenv("SENZING_MCP_BATCH_CONCURRENCY", "5"))
+        # Identical calls already in flight share one executor job
+        self.coalesce_calls = os.getenv("SENZING_MCP_COALESCE_CALLS", "1") != "0"
+        self._single_flight = SingleFlight()
+        # Seconds between default config ID checks (0 = only reinitialize on
+        # stale config errors); see start_config_monitor()
+        self.config_poll_interval = float(os.getenv("SENZING_MCP_CONFIG_POLL_INTERVAL", "0"))
+        self._config_monitor: Optional[asyncio.Task] = None
+        # (factory, config manager) reused by config polls until the factory changes
+        self._config_manager: Optional[tuple] = None
+
+    def configure_concurrency(self, max_workers: int = None, bulkhead_limits: dict = None):
+        """Size the executor and per-operation-class bulkheads.
+
+        Unset values come from SENZING_MCP_MAX_WORKERS (default: 10) and
+        SENZING_MCP_BULKHEAD_<CLASS> (see DEFAULT_BULKHEAD_LIMITS). Call before
+        initialize(); the previous executor is shut down.
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv("SENZING_MCP_MAX_WORKERS", "10"))
+        limits = {
+            op_class: int(os.getenv(f"SENZING_MCP_BULKHEAD_{op_class.upper()}", str(default)))
+            for op_class, default in DEFAULT_BULKHEAD_LIMITS.items()
+        }
+        limits.update(bulkhead_limits or {})
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_workers = max_workers
+        self.bulkheads = {op_class: Bulkhead(op_class, limit) for op_class, limit in limits.items()}
+
+    def concurrency_stats(self) -> dict:
+        """Return executor thread usage and per-bulkhead active/queued calls."""
+        return {
+            "executor": {
+                "max_workers": self.max_workers,
+                "active": self.executor_active,
+                "queued": self.executor_queued,
+            },
+            "bulkheads": {name: bulkhead.stats() for name, bulkhead in self.bulkheads.items()},
+            "coalesced_calls": self.coalesced_calls,
+            "engine_workers": self.worker_pool.stats() if self.worker_pool else [],
+        }
 
     def _is_stale_config_error(self, error: Exception) -> bool:
         """Check if error indicates stale configuration requiring reinit."""
         error_str = str(error)
         return any(code in error_str for code in STALE_CONFIG_ERROR_CODES)
 
-    async def reinitialize(self):
-        """Reinitialize SDK - cleanup existing and create fresh instance."""
+    async def reinitialize(self, generation: Optional[int] = None, warm: bool = False):
+        """Swap in a freshly built engine after the configuration changed.
+
+        Concurrent callers that hit the same stale engine share one rebuild:
+        a caller that finds a newer generation than the one it saw as stale
+        (default: the current one) returns without rebuilding. The new engine
+        is built, and primed if warm is set, while the old one keeps serving
+        calls, then swapped in atomically; the old one is destroyed once its
+        in-flight calls drain.
+        """
+        if generation is None:
+            generation = self._generation
         async with self._reinit_lock:
+            if self._generation != generation:
+                return
             logger.info("Reinitializing Senzing SDK due to stale configuration...")
 
-            # Cleanup existing
-            if self._initialized:
+            loop = asyncio.get_event_loop()
+            factory, engine, pool = await loop.run_in_executor(
+                self.executor, self._sync_initialize, *self._engine_settings()
+            )
+            if warm:
                 try:
-                    await asyncio.get_event_loop().run_in_executor(
-                        self.executor, self._sync_cleanup
+                    await loop.run_in_executor(self.executor, engine.prime_engine)
+                except Exception:
+                    await loop.run_in_executor(self.executor, self._destroy_engine, factory, pool)
+                    raise
+            self._install_engine(factory, engine, pool)
+            logger.info(f"Senzing SDK reinitialized successfully (generation {self._generation})")
+
+    def start_config_monitor(self, interval: Optional[float] = None):
+        """Start polling the repository's default config ID in the background.
+
+        When it no longer matches the engine's active config ID, a new engine
+        is built and primed off the request path and swapped in, so requests
+        do not pay for the rebuild. Does nothing if interval (default:
+        config_poll_interval) is 0.
+        """
+        if interval is None:
+            interval = self.config_poll_interval
+        if interval <= 0 or self._config_monitor is not None:
+            return
+        if self.factory is None:
+            logger.warning("Config monitor needs an in-process Senzing factory; relying on stale config errors")
+            return
+        self._config_monitor = asyncio.ensure_future(self._monitor_config(interval))
+
+    async def stop_config_monitor(self):
+        """Stop the background config monitor, if running."""
+        if self._config_monitor is None:
+            return
+        self._config_monitor.cancel()
+        try:
+            await self._config_monitor
+        except asyncio.CancelledError:
+            pass
+        self._config_monitor = None
+
+    async def _monitor_config(self, interval: float):
+        """Background loop: swap in a new engine when the default config changes."""
+        logger.info(f"Checking for Senzing config changes every {interval}s")
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                generation = self._generation
+                default_id, active_id = await self._run_on_generation(
+                    generation, self._read_config_ids, self.factory, self.engine
+                )
+                if default_id != active_id:
+                    logger.info(
+                        f"Default config changed from {active_id} to {default_id}; "
+                        "building new Senzing engine"
                     )
-                except Exception as e:
-                    logger.warning(f"Error during cleanup before reinit: {e}")
-                self._initialized = False
-                self.factory = None
-                self.engine = None
+                    await self.reinitialize(generation, warm=True)
+            except Exception as e:
+                logger.warning(f"Config monitor check failed: {str(e)}")
+
+    def _read_config_ids(self, factory, engine) -> tuple[int, int]:
+        """Return the repository's default config ID and the engine's active config ID.
 
-            # Reinitialize
-            await self.initialize()
-            logger.info("Senzing SDK reinitialized successfully")
+        The config manager is created once per factory and reused by later polls.
+        """
+        if self._config_manager is None or self._config_manager[0] is not factory:
+            self._config_manager = (factory, factory.create_configmanager())
+        config_manager = self._config_manager[1]
+        return config_manager.get_default_config_id(), engine.get_active_config_id()
 
     async def initialize(self):
         """Initialize Senzing SDK from environment variables."""
         if self._initialized:
             return
 
-        # Get configuration from environment
+        # Initialize in thread pool to avoid blocking
+        factory, engine, pool = await asyncio.get_event_loop().run_in_executor(
+            self.executor, self._sync_initialize, *self._engine_settings()
+        )
+        self._install_engine(factory, engine, pool)
+
+    def _engine_settings(self) -> tuple[str, str, str, int]:
+        """Read engine configuration from environment variables."""
         engine_config = os.getenv("SENZING_ENGINE_CONFIGURATION_JSON")
-        if not engine_config:
+        if not engine_config and not (self.fake_engine or self.replay_file):
             raise ValueError(
                 "SENZING_ENGINE_CONFIGURATION_JSON environment variable not set"
             )
@@ -83,251 +408,524 @@ class SenzingSDKWrapper:
         module_name = os.getenv("SENZING_MODULE_NAME", "senzing-mcp")
         instance_name = os.getenv("SENZING_INSTANCE_NAME", "senzing-mcp-server")
         verbose_logging = int(os.getenv("SENZING_LOG_LEVEL", "0"))
+        return engine_config, module_name, instance_name, verbose_logging
 
-        # Initialize in thread pool to avoid blocking
-        await asyncio.get_event_loop().run_in_executor(
-            self.executor, self._sync_initialize, engine_config, module_name, instance_name, verbose_logging
-        )
+    def _sync_initialize(self, engine_config: str, module_name: str, instance_name: str, verbose_logging: int):
+        """Synchronously build a Senzing factory and engine (or engine worker pool).
 
-        self._initialized = True
+        Returns (factory, engine, worker_pool) without installing them, so a
+        replacement can be built while the current engine is still in use.
+        """
+        # builder is None for a real Senzing engine
+        if self.replay_file:
+            from senzing_mcp.replay import build_replay_engine
+            builder, builder_args = build_replay_engine, (self.replay_file, self.replay_speed)
+        elif self.fake_engine:
+            from senzing_mcp.fake_engine import build_fake_engine
+            builder, builder_args = build_fake_engine, (self.fake_engine,)
+        else:
+            builder, builder_args = None, (instance_name, engine_config, verbose_logging)
+
+        if self.engine_workers > 0:
+            from senzing_mcp.worker_pool import EngineWorkerPool, build_senzing_engine
+            pool = EngineWorkerPool(
+                self.engine_workers, engine_builder=builder or build_senzing_engine, builder_args=builder_args
+            )
+            try:
+                pool.start()
+            except Exception as e:
+                pool.close()
+                raise RuntimeError(f"Failed to initialize Senzing SDK: {str(e)}")
+            return None, self._maybe_record(pool.engine), pool
+
+        if builder is not None:
+            logger.warning(f"Using {builder.__name__.split('_')[1]} Senzing engine instead of a repository")
+            factory, engine = builder(*builder_args)
+            return factory, self._maybe_record(engine), None
 
-    def _sync_initialize(self, engine_config: str, module_name: str, instance_name: str, verbose_logging: int):
-        """Synchronous initialization of Senzing SDK."""
         try:
             # Create factory with settings
             # The factory automatically initializes all components
-            self.factory = SzAbstractFactoryCore(
+            factory = SzAbstractFactoryCore(
                 instance_name=instance_name,
                 settings=engine_config,
                 verbose_logging=verbose_logging
             )
 
             # Create engine component (already initialized through factory)
-            self.engine = self.factory.create_engine()
+            return factory, self._maybe_record(factory.create_engine()), None
 
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Senzing SDK: {str(e)}")
 
+    def _maybe_record(self, engine):
+        """Wrap engine to record its calls if SENZING_MCP_RECORD_FILE is set."""
+        if not self.record_file:
+            return engine
+        from senzing_mcp.replay import FixtureWriter, RecordingEngine
+        if self._fixture_writer is None:
+            logger.info(f"Recording SDK calls to {self.record_file}")
+            self._fixture_writer = FixtureWriter(self.record_file)
+        return RecordingEngine(engine, self._fixture_writer)
+
+    def _install_engine(self, factory, engine, pool):
+        """Make a newly built engine current and retire the previous one.
+
+        Runs on the event loop without awaiting, so callers see either the
+        old engine or the new one, never a mix. Caches are cleared because
+        results from the old configuration may no longer be valid.
+        """
+        if self._initialized:
+            self._retired[self._generation] = (self.factory, self.worker_pool)
+            self._generation += 1
+            self.reinit_count += 1
+        self.factory, self.engine, self.worker_pool = factory, engine, pool
+        self._config_manager = None
+        self._initialized = True
+
+        self.entity_cache.clear()
+        self.search_cache.clear()
+        for generation in list(self._retired):
+            self._destroy_if_drained(generation)
+
+    def _release_generation(self, generation: int):
+        """Mark one engine call on generation finished."""
+        self._inflight[generation] -= 1
+        if not self._inflight[generation]:
+            del self._inflight[generation]
+        self._destroy_if_drained(generation)
+
+    def _destroy_if_drained(self, generation: int):
+        """Destroy a retired engine once no calls are running on it."""
+        if generation not in self._retired or self._inflight.get(generation):
+            return
+        factory, pool = self._retired.pop(generation)
+        logger.info(f"Destroying retired Senzing engine (generation {generation})")
+        future = asyncio.get_event_loop().run_in_executor(
+            self.executor, self._destroy_engine, factory, pool
+        )
+        future.add_done_callback(_log_destroy_error)
+
+    @staticmethod
+    def _destroy_engine(factory, pool):
+        """Synchronously destroy a factory and/or engine worker pool."""
+        if pool:
+            pool.close()
+        if factory:
+            factory.destroy()
+
     async def _run_async(self, func, *args, **kwargs):
-        """Run a synchronous SDK function asynchronously."""
+        """Run a synchronous SDK function asynchronously.
+
+        Concurrent calls with the same function and arguments are coalesced
+        onto one executor job (see SingleFlight); unhashable arguments opt out.
+        Engine methods listed in OPERATION_CLASSES wait for a slot in their
+        class's bulkhead before taking an executor thread.
+        """
         if not self._initialized:
             raise RuntimeError("SDK not initialized. Call initialize() first.")
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, partial(func, *args, **kwargs)
-        )
+        call = partial(func, *args, **kwargs)
+        bulkhead = self.bulkheads.get(OPERATION_CLASSES.get(getattr(func, "__name__", None)))
+        # Filled in by run() with queue-wait and engine timings for tracing;
+        # stays empty if this caller shares another caller's call
+        timing = {}
+        # Whether this call still counts toward executor_queued
+        in_queue = [True]
+
+        def dequeue():
+            # Once per call: when a thread picks it up, or when it is cancelled first
+            with self._executor_lock:
+                if in_queue[0]:
+                    in_queue[0] = False
+                    self.executor_queued -= 1
+
+        def timed_call():
+            dequeue()
+            timing["started"] = time.perf_counter()
+            try:
+                return call()
+            finally:
+                timing["finished"] = time.perf_counter()
+
+        async def start():
+            # Worker-process calls are awaited directly rather than parking
+            # an executor thread on the reply
+            if self.worker_pool is not None and self.worker_pool.is_remote(func):
+                timing["started"] = time.perf_counter()
+                try:
+                    return await asyncio.wrap_future(func.submit(*args, **kwargs))
+                finally:
+                    timing["finished"] = time.perf_counter()
+            self.executor_active += 1
+            with self._executor_lock:
+                self.executor_queued += 1
+            try:
+                return await loop.run_in_executor(self.executor, timed_call)
+            finally:
+                self.executor_active -= 1
+                dequeue()
+
+        async def run():
+            if bulkhead is None:
+                return await start()
+            async with bulkhead:
+                return await start()
+
+        if tracing.current() is None:
+            return await self._run_coalesced(func, args, kwargs, run)
+
+        method = getattr(func, "__name__", "call")
+        span_attrs = {"method": method}
+        if "flags" in kwargs:
+            span_attrs["flags"] = kwargs["flags"]
+        elif method in OPERATION_CLASSES and args:
+            # Engine methods otherwise take their flags as the last argument
+            span_attrs["flags"] = args[-1]
+        queued = time.perf_counter()
+        try:
+            return await self._run_coalesced(func, args, kwargs, run)
+        finally:
+            self._record_timing(queued, timing, span_attrs)
 
-    # Entity Operations
+    async def _run_coalesced(self, func, args: tuple, kwargs: dict, run):
+        """Await run(), sharing it with identical concurrent calls if enabled."""
+        if not self.coalesce_calls:
+            return await run()
 
-    async def get_entity_by_record_id(self, data_source: str, record_id: str, flags: int = None) -> str:
-        """Get entity details by data source and record ID (same flags as sz_explorer)."""
-        # Use the same comprehensive flags as get_entity_by_entity_id
-        if flags is None:
-            flags = (
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ENTITY_NAME |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_DATA |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_MATCHING_INFO |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_RELATIONS |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RELATED_ENTITY_NAME |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RELATED_MATCHING_INFO |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RELATED_RECORD_SUMMARY |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_FEATURES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_FEATURES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_UNMAPPED_DATA
-            )
+        key = (func, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return await run()
+        return await self._single_flight.run(key, run)
+
+    @staticmethod
+    def _record_timing(queued: float, timing: dict, attrs: dict):
+        """Record queue-wait and SDK spans for one engine call on the current trace."""
+        if "started" not in timing:
+            # Coalesced onto (or cancelled before) another call: all of it was waiting
+            tracing.record("sdk", queued, time.perf_counter() - queued, coalesced=True, **attrs)
+            return
+        tracing.record("queue_wait", queued, timing["started"] - queued, method=attrs["method"])
+        finished = timing.get("finished", time.perf_counter())
+        tracing.record("sdk", timing["started"], finished - timing["started"], **attrs)
+
+    @property
+    def coalesced_calls(self) -> int:
+        """Number of calls served by joining an identical in-flight call."""
+        return self._single_flight.coalesced
 
+    async def _call_engine(self, method: str, *args, not_found: Optional[dict] = None, **kwargs) -> SzResult:
+        """Call an engine method, retrying once after a stale config reinit.
+
+        SzError is never raised; failures are returned as error results.
+        not_found, if given, is the error payload returned for SzNotFoundError.
+        Other keyword arguments are passed to the engine method.
+        """
+        # Without a not_found payload, SzNotFoundError is handled as any SzError
+        not_found_errors = (SzNotFoundError,) if not_found is not None else ()
         for attempt in range(2):
+            generation = self._generation
             try:
-                result = await self._run_async(
-                    self.engine.get_entity_by_record_id, data_source, record_id, flags
-                )
-                return result
-            except SzNotFoundError:
-                return json.dumps({"error": "Record not found", "data_source": data_source, "record_id": record_id})
+                result = await self._run_on_generation(generation, getattr(self.engine, method), *args, **kwargs)
+                return SzResult(result)
+            except not_found_errors as e:
+                self._count_error(e)
+                return SzResult.from_error(**not_found)
             except SzError as e:
+                self._count_error(e)
                 if attempt == 0 and self._is_stale_config_error(e):
-                    await self.reinitialize()
+                    # If another caller already swapped in a new engine, just retry
+                    if generation == self._generation:
+                        await self.reinitialize()
                     continue
-                return json.dumps({"error": str(e)})
+                return SzResult.from_error(str(e))
+
+    def _count_error(self, error: Exception):
+        """Count an SDK error by its SENZ code (or exception type if it has none)."""
+        match = SENZ_CODE_PATTERN.search(str(error))
+        self.sdk_errors[match.group(0) if match else type(error).__name__] += 1
+
+    async def _run_on_generation(self, generation: int, func, *args, **kwargs):
+        """Run an engine call, counting it against the engine generation it uses.
+
+        The count is released when the underlying call finishes, even if this
+        caller is cancelled first, so a retired engine is never destroyed
+        while an executor thread is still using it.
+        """
+        self._inflight[generation] += 1
+        task = asyncio.ensure_future(self._run_async(func, *args, **kwargs))
+        task.add_done_callback(lambda done: self._call_finished(done, generation))
+        return await asyncio.shield(task)
+
+    def _call_finished(self, task: asyncio.Future, generation: int):
+        # Mark the exception as retrieved in case the caller was cancelled
+        if not task.cancelled():
+            task.exception()
+        self._release_generation(generation)
+
+    # Entity Operations
 
-    async def get_entity_by_entity_id(self, entity_id: int, flags: int = None) -> str:
-        """Get entity details by entity ID with comprehensive information (same flags as sz_explorer)."""
-        # Use the exact same flags as sz_explorer's get command
+    async def get_entity_by_record_id(
+        self, data_source: str, record_id: str, flags: int = None, detail: str = "full"
+    ) -> SzResult:
+        """Get entity details by data source and record ID.
+
+        Without explicit flags, detail picks the flag set (same as
+        get_entity_by_entity_id; "full" matches sz_explorer).
+        """
         if flags is None:
-            flags = (
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ENTITY_NAME |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_DATA |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_MATCHING_INFO |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_RELATIONS |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RELATED_ENTITY_NAME |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RELATED_MATCHING_INFO |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RELATED_RECORD_SUMMARY |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_FEATURES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_FEATURES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_UNMAPPED_DATA
-            )
+            flags = detail_flags("get_entity_by_entity_id", detail)
+
+        cache_key = ("record", data_source, record_id, flags)
+        cached = self.entity_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # A reinit during the call clears the cache; don't refill it with an old-engine result
+        generation = self._generation
+        result = await self._call_engine(
+            "get_entity_by_record_id", data_source, record_id, flags,
+            not_found={"error": "Record not found", "data_source": data_source, "record_id": record_id},
+        )
+        if not result.is_error and generation == self._generation:
+            self.entity_cache.put(cache_key, result)
+        return result
 
-        for attempt in range(2):
-            try:
-                result = await self._run_async(
-                    self.engine.get_entity_by_entity_id, entity_id, flags
-                )
-                return result
-            except SzNotFoundError:
-                return json.dumps({"error": "Entity not found", "entity_id": entity_id})
-            except SzError as e:
-                if attempt == 0 and self._is_stale_config_error(e):
-                    await self.reinitialize()
-                    continue
-                return json.dumps({"error": str(e)})
+    async def get_entity_by_entity_id(self, entity_id: int, flags: int = None, detail: str = "full") -> SzResult:
+        """Get entity details by entity ID.
+
+        Without explicit flags, detail picks the flag set: "summary" (name and
+        record summary), "standard" (records, representative features and
+        relationships) or "full" (everything sz_explorer's get command shows).
+        """
+        if flags is None:
+            flags = detail_flags("get_entity_by_entity_id", detail)
 
-    async def search_by_attributes(self, attributes: str, flags: int = None) -> str:
-        """Search for entities by attributes with comprehensive search information (same flags as sz_explorer).
+        cache_key = ("entity", entity_id, flags)
+        cached = self.entity_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        If fewer than 11 entities are found, automatically performs a second search with full feature details.
+        generation = self._generation
+        result = await self._call_engine(
+            "get_entity_by_entity_id", entity_id, flags,
+            not_found={"error": "Entity not found", "entity_id": entity_id},
+        )
+        if not result.is_error and generation == self._generation:
+            self.entity_cache.put(cache_key, result)
+        return result
+
+    async def get_entities_by_entity_ids(
+        self, entity_ids: list[int], flags: int = None, max_concurrency: int = None, detail: str = "full"
+    ) -> SzResult:
+        """Get several entities concurrently, keyed by entity ID.
+
+        Each ID is looked up exactly as get_entity_by_entity_id would (including
+        caching and per-ID "Entity not found"/error payloads), with at most
+        max_concurrency (default: batch_concurrency) lookups in flight.
+        Returns {"ENTITIES": {"<entity_id>": <entity or error>, ...}}.
+        """
+        entities = await self._fetch_entities(entity_ids, flags, max_concurrency, detail)
+        return SzResult('{"ENTITIES":' + entities + '}')
+
+    async def get_entities_by_record_ids(
+        self, records: list[tuple[str, str]], flags: int = None, max_concurrency: int = None, detail: str = "full"
+    ) -> SzResult:
+        """Resolve many (data_source, record_id) pairs, fetching each entity once.
+
+        Records are first resolved to entity IDs concurrently with a minimal
+        lookup; the distinct entities are then fetched with flags (default:
+        the detail level's flags, as for get_entity_by_entity_id). Returns
+        {"RECORDS": {"<DATA_SOURCE>:<RECORD_ID>": <entity_id or error>, ...},
+         "ENTITIES": {"<entity_id>": <entity or error>, ...}}.
         """
-        # Use the exact same flags as sz_explorer's search command
+        unique_records = list(dict.fromkeys((str(ds), str(rid)) for ds, rid in records))
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_concurrency)
+
+        async def resolve(data_source, record_id):
+            async with semaphore:
+                return await self.get_entity_by_record_id(data_source, record_id, 0)
+
+        lookups = await asyncio.gather(*(resolve(ds, rid) for ds, rid in unique_records))
+
+        record_map = {}
+        entity_ids = []
+        for (data_source, record_id), lookup in zip(unique_records, lookups):
+            key = f"{data_source}:{record_id}"
+            if lookup.is_error:
+                record_map[key] = jsonutil.loads(lookup)
+                continue
+            entity_id = jsonutil.loads(lookup)["RESOLVED_ENTITY"]["ENTITY_ID"]
+            record_map[key] = entity_id
+            entity_ids.append(entity_id)
+
+        entities = await self._fetch_entities(entity_ids, flags, max_concurrency, detail)
+        return SzResult('{"RECORDS":' + jsonutil.dumps(record_map) + ',"ENTITIES":' + entities + '}')
+
+    async def _fetch_entities(
+        self, entity_ids: list[int], flags: int, max_concurrency: Optional[int], detail: str = "full"
+    ) -> str:
+        """Fetch distinct entities concurrently and return them as a JSON object keyed by ID."""
         if flags is None:
-            base_flags = (
-                SzEngineFlags.SZ_SEARCH_INCLUDE_ALL_ENTITIES |
-                SzEngineFlags.SZ_INCLUDE_FEATURE_SCORES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ENTITY_NAME |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_DATA |
-                SzEngineFlags.SZ_INCLUDE_MATCH_KEY_DETAILS |
-                SzEngineFlags.SZ_SEARCH_INCLUDE_STATS |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_RELATIONS |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RELATED_MATCHING_INFO
-            )
-            flags = base_flags
+            flags = detail_flags("get_entity_by_entity_id", detail)
+        unique_ids = list(dict.fromkeys(entity_ids))
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_concurrency)
 
-        for attempt in range(2):
-            try:
-                # First search with base flags
-                result = await self._run_async(
-                    self.engine.search_by_attributes, attributes, flags
-                )
+        async def fetch(entity_id):
+            async with semaphore:
+                return await self.get_entity_by_entity_id(entity_id, flags)
 
-                # Parse result to check entity count
-                result_data = json.loads(result)
-                entity_count = len(result_data.get("RESOLVED_ENTITIES", []))
+        results = await asyncio.gather(*(fetch(entity_id) for entity_id in unique_ids))
 
-                # If fewer than 11 entities, redo search with full feature details
-                if entity_count < 11 and entity_count > 0:
-                    enhanced_flags = flags | SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_FEATURES | SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_FEATURES
-                    result = await self._run_async(
-                        self.engine.search_by_attributes, attributes, enhanced_flags
-                    )
+        # Splice the raw payloads together rather than parsing and re-serializing them
+        entries = ",".join(
+            f"{jsonutil.dumps(str(entity_id))}:{result}"
+            for entity_id, result in zip(unique_ids, results)
+        )
+        return "{" + entries + "}"
 
-                return result
-            except SzError as e:
-                if attempt == 0 and self._is_stale_config_error(e):
-                    await self.reinitialize()
-                    continue
-                return json.dumps({"error": str(e)})
+    async def search_by_attributes(self, attributes: str, flags: int = None, detail: str = "full") -> SzResult:
+        """Search for entities by attributes.
+
+        Without explicit flags, detail picks the flag set ("full" matches
+        sz_explorer's search command). At "full" detail, if 1 to
+        search_enrich_max entities are found, their feature details are
+        added by fetching just those entities concurrently, rather than
+        repeating the whole (scoring) search with feature flags.
+        """
+        if flags is None:
+            flags = detail_flags("search_by_attributes", detail)
+
+        cache_key = (canonical_search_key(attributes), flags)
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = self._generation
+        result = await self._call_engine("search_by_attributes", attributes, flags)
+        if result.is_error:
+            return result
+
+        # Parse once: the entity count decides whether to enrich, and the
+        # parsed tree is what gets enriched
+        result_data = jsonutil.loads(result)
+        entities = result_data.get("RESOLVED_ENTITIES", [])
+
+        # For small result sets, add full feature details per entity
+        if detail == "full" and 0 < len(entities) <= self.search_enrich_max:
+            await self._enrich_search_entities(entities)
+            result = SzResult(jsonutil.dumps(result_data))
+
+        if generation == self._generation:
+            self.search_cache.put(cache_key, result)
+        return result
+
+    async def _enrich_search_entities(self, entities: list):
+        """Merge entity and record features into search results in place.
+
+        Produces the same sections a search with SZ_ENTITY_INCLUDE_RECORD_FEATURES
+        and SZ_ENTITY_INCLUDE_ALL_FEATURES would, without re-scoring the search.
+        Entities that cannot be fetched are left as returned by the search.
+        """
+        feature_flags = (
+            SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_DATA |
+            SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_FEATURES |
+            SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_FEATURES
+        )
+        resolved = [
+            entry.get("ENTITY", {}).get("RESOLVED_ENTITY", {}) for entry in entities
+        ]
+        fetched = await asyncio.gather(*(
+            self.get_entity_by_entity_id(entity["ENTITY_ID"], feature_flags)
+            for entity in resolved
+        ))
+
+        for entity, details in zip(resolved, fetched):
+            if details.is_error:
+                logger.warning(
+                    f"Could not add features to search entity {entity.get('ENTITY_ID')}: {details.error}"
+                )
+                continue
+            detail_entity = jsonutil.loads(details).get("RESOLVED_ENTITY", {})
+            for key, value in detail_entity.items():
+                if key != "RECORDS":
+                    entity.setdefault(key, value)
+
+            detail_records = {
+                (record.get("DATA_SOURCE"), record.get("RECORD_ID")): record
+                for record in detail_entity.get("RECORDS", [])
+            }
+            for record in entity.get("RECORDS", []):
+                detail_record = detail_records.get((record.get("DATA_SOURCE"), record.get("RECORD_ID")))
+                if detail_record:
+                    for key, value in detail_record.items():
+                        record.setdefault(key, value)
 
     # Relationship Operations
 
     async def find_path_by_entity_id(
-        self, start_entity_id: int, end_entity_id: int, max_degrees: int, flags: int = 0
-    ) -> str:
+        self, start_entity_id: int, end_entity_id: int, max_degrees: int, flags: int = None,
+        detail: str = "summary",
+    ) -> SzResult:
         """Find relationship path between two entities."""
-        for attempt in range(2):
-            try:
-                result = await self._run_async(
-                    self.engine.find_path_by_entity_id,
-                    start_entity_id,
-                    end_entity_id,
-                    max_degrees,
-                    flags,
-                )
-                return result
-            except SzError as e:
-                if attempt == 0 and self._is_stale_config_error(e):
-                    await self.reinitialize()
-                    continue
-                return json.dumps({"error": str(e)})
+        if flags is None:
+            flags = detail_flags("find_path_by_entity_id", detail)
+        # Positionally, the fourth argument is avoid_entity_ids, not flags
+        return await self._call_engine(
+            "find_path_by_entity_id", start_entity_id, end_entity_id, max_degrees, flags=flags
+        )
 
     async def find_network_by_entity_id(
-        self, entity_list: str, max_degrees: int, build_out_degrees: int, max_entities: int, flags: int = 0
-    ) -> str:
+        self, entity_list: str, max_degrees: int, build_out_degrees: int, max_entities: int, flags: int = None,
+        detail: str = "summary",
+    ) -> SzResult:
         """Find network of related entities."""
-        for attempt in range(2):
-            try:
-                result = await self._run_async(
-                    self.engine.find_network_by_entity_id,
-                    entity_list,
-                    max_degrees,
-                    build_out_degrees,
-                    max_entities,
-                    flags,
-                )
-                return result
-            except SzError as e:
-                if attempt == 0 and self._is_stale_config_error(e):
-                    await self.reinitialize()
-                    continue
-                return json.dumps({"error": str(e)})
+        if flags is None:
+            flags = detail_flags("find_network_by_entity_id", detail)
+        return await self._call_engine(
+            "find_network_by_entity_id", entity_list, max_degrees, build_out_degrees, max_entities, flags
+        )
 
     async def why_entities(
-        self, entity_id_1: int, entity_id_2: int, flags: int = None
-    ) -> str:
-        """Explain why two entities are related (same flags as sz_explorer)."""
-        # Use the exact same flags as sz_explorer's why command (why_not)
+        self, entity_id_1: int, entity_id_2: int, flags: int = None, detail: str = "full"
+    ) -> SzResult:
+        """Explain why two entities are related ("full" detail matches sz_explorer)."""
         if flags is None:
-            flags = (
-                SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_INTERNAL_FEATURES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_FEATURE_STATS |
-                SzEngineFlags.SZ_INCLUDE_FEATURE_SCORES |
-                SzEngineFlags.SZ_INCLUDE_MATCH_KEY_DETAILS
-            )
+            flags = detail_flags("why_entities", detail)
 
-        for attempt in range(2):
-            try:
-                result = await self._run_async(
-                    self.engine.why_entities, entity_id_1, entity_id_2, flags
-                )
-                return result
-            except SzError as e:
-                if attempt == 0 and self._is_stale_config_error(e):
-                    await self.reinitialize()
-                    continue
-                return json.dumps({"error": str(e)})
+        return await self._call_engine("why_entities", entity_id_1, entity_id_2, flags)
 
-    async def how_entity_by_entity_id(self, entity_id: int, flags: int = None) -> str:
-        """Explain how an entity was resolved (same flags as sz_explorer)."""
-        # Use the exact same flags as sz_explorer's how command (get_how_data)
+    async def how_entity_by_entity_id(self, entity_id: int, flags: int = None, detail: str = "full") -> SzResult:
+        """Explain how an entity was resolved ("full" detail matches sz_explorer)."""
         if flags is None:
-            flags = (
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ENTITY_NAME |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_ALL_FEATURES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_INTERNAL_FEATURES |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_FEATURE_STATS |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_DATA |
-                SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_FEATURES |
-                SzEngineFlags.SZ_INCLUDE_MATCH_KEY_DETAILS
-            )
+            flags = detail_flags("how_entity_by_entity_id", detail)
 
-        for attempt in range(2):
-            try:
-                result = await self._run_async(
-                    self.engine.how_entity_by_entity_id, entity_id, flags
-                )
-                return result
-            except SzError as e:
-                if attempt == 0 and self._is_stale_config_error(e):
-                    await self.reinitialize()
-                    continue
-                return json.dumps({"error": str(e)})
+        return await self._call_engine("how_entity_by_entity_id", entity_id, flags)
+
+    def cache_stats(self) -> dict:
+        """Return hit/miss statistics for the result caches."""
+        return {
+            "entity": self.entity_cache.stats(),
+            "search": self.search_cache.stats(),
+        }
 
     async def cleanup(self):
         """Clean up resources."""
+        await self.stop_config_monitor()
         if self._initialized:
             await self._run_async(self._sync_cleanup)
             self.executor.shutdown(wait=True)
 
     def _sync_cleanup(self):
-        """Synchronous cleanup of Senzing SDK."""
-        if self.factory:
-            self.factory.destroy()
+        """Synchronous cleanup of Senzing SDK (current and retired engines)."""
+        retired, self._retired = self._retired, {}
+        for factory, pool in retired.values():
+            self._destroy_engine(factory, pool)
+        self._destroy_engine(self.factory, self.worker_pool)
+        self.worker_pool = None
+        if self._fixture_writer is not None:
+            self._fixture_writer.close()
+            self._fixture_writer = None
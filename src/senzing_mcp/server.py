@@ -5,13 +5,41 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any
+import time
+from typing import Any, Optional
 
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.stdio import stdio_server
-from mcp.types import TextContent, Tool
+from mcp.types import GetPromptResult, Prompt, PromptMessage, Resource, TextContent, Tool
+
+from senzing_mcp import jsonutil, tracing
+from senzing_mcp.formatting import FORMATTING_NOTES, NOTE_MODES, NoteTracker
+from senzing_mcp.metrics import CONTENT_TYPE, MetricsRegistry, ToolMetrics, sdk_wrapper_collector
+from senzing_mcp.network_pages import NetworkPages
+from senzing_mcp.projection import ProjectionConfig
+from senzing_mcp.results import SzResult
+from senzing_mcp.sdk_wrapper import DEFAULT_BULKHEAD_LIMITS, DETAIL_LEVELS, SenzingSDKWrapper
+from senzing_mcp.slow_calls import SlowCallLog, parse_thresholds
+from senzing_mcp.summaries import OUTPUT_MODES, RAW_HINT, SUMMARIZERS
+
+
+def bulkhead_limit(value: str) -> tuple[str, int]:
+    """Parse a CLASS=LIMIT bulkhead option."""
+    op_class, _, limit = value.partition("=")
+    if op_class not in DEFAULT_BULKHEAD_LIMITS or not limit.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"expected CLASS=LIMIT with CLASS one of {', '.join(DEFAULT_BULKHEAD_LIMITS)}"
+        )
+    return op_class, int(limit)
+
 
-from senzing_mcp.sdk_wrapper import SenzingSDKWrapper
+def slow_call_thresholds(value: str) -> tuple[float, dict[str, float]]:
+    """Parse a MS[,TOOL=MS...] slow-call threshold option."""
+    try:
+        return parse_thresholds(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected MS or TOOL=MS entries separated by commas")
 
 
 def parse_args():
@@ -24,6 +52,31 @@ def parse_args():
         action='store_true',
         help='Use HTTP/SSE transport instead of STDIO (default: STDIO)'
     )
+    parser.add_argument(
+        '--streamable-http',
+        action='store_true',
+        help='Use the streamable HTTP transport (endpoint /mcp) instead of STDIO'
+    )
+    parser.add_argument(
+        '--stateless',
+        action='store_true',
+        help='Streamable HTTP: handle each request independently, without sessions, '
+             'so any worker or replica can serve any request'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=int(os.getenv('SENZING_MCP_HTTP_WORKERS', '1')),
+        help='Streamable HTTP: serve from N processes, each with its own engine; '
+             'implies --stateless (default: $SENZING_MCP_HTTP_WORKERS or 1)'
+    )
+    parser.add_argument(
+        '--unix-socket',
+        default=None,
+        metavar='PATH',
+        help='Run as a local daemon serving MCP sessions on a Unix socket, shared by '
+             'senzing-mcp-shim clients (default: STDIO)'
+    )
     parser.add_argument(
         '--port',
         type=int,
@@ -35,7 +88,86 @@ def parse_args():
         default='127.0.0.1',
         help='HTTP server host (default: 127.0.0.1)'
     )
-    return parser.parse_args()
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=None,
+        help='SDK executor threads (default: $SENZING_MCP_MAX_WORKERS or 10)'
+    )
+    parser.add_argument(
+        '--bulkhead',
+        type=bulkhead_limit,
+        action='append',
+        default=[],
+        metavar='CLASS=LIMIT',
+        help='Concurrent call limit for an operation class (lookup, search, network, explain); '
+             '0 = unlimited. May be repeated (default: $SENZING_MCP_BULKHEAD_<CLASS>)'
+    )
+    parser.add_argument(
+        '--engine-workers',
+        type=int,
+        default=None,
+        help='Run engine calls in N worker processes, each with its own engine '
+             '(default: $SENZING_MCP_ENGINE_WORKERS or 0 = in-process)'
+    )
+    parser.add_argument(
+        '--config-poll-interval',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='Check for a new default Senzing config every SECONDS and swap in a '
+             'pre-warmed engine (default: $SENZING_MCP_CONFIG_POLL_INTERVAL or 0 = off)'
+    )
+    parser.add_argument(
+        '--trace-file',
+        default=os.getenv('SENZING_MCP_TRACE_FILE'),
+        metavar='PATH',
+        help='Append a JSON line per tool call with its stage timings to PATH '
+             '(default: $SENZING_MCP_TRACE_FILE, unset = tracing off)'
+    )
+    parser.add_argument(
+        '--slow-call-ms',
+        type=slow_call_thresholds,
+        default=None,
+        metavar='MS[,TOOL=MS...]',
+        help='Log tool calls slower than MS milliseconds, optionally per tool, e.g. '
+             '500,expand_network=5000 (default: $SENZING_MCP_SLOW_CALL_MS or 0 = off)'
+    )
+    parser.add_argument(
+        '--slow-call-log',
+        default=os.getenv('SENZING_MCP_SLOW_CALL_LOG'),
+        metavar='PATH',
+        help='Write the slow-call log to PATH instead of stderr '
+             '(default: $SENZING_MCP_SLOW_CALL_LOG)'
+    )
+    parser.add_argument(
+        '--formatting-notes',
+        choices=NOTE_MODES,
+        default=None,
+        help='When tool responses carry formatting instructions: always, first-call (first response '
+             'of each tool per session) or never (clients use the formatting prompts/resources) '
+             '(default: $SENZING_MCP_FORMATTING_NOTES or always)'
+    )
+    parser.add_argument(
+        '--output',
+        choices=OUTPUT_MODES,
+        default=None,
+        help='Default tool output: raw (formatting notes and engine JSON) or compact '
+             '(server-side summary tables) (default: $SENZING_MCP_OUTPUT or raw)'
+    )
+    parser.add_argument(
+        '--projection',
+        default=None,
+        metavar='JSON|PATH',
+        help='Per-tool include/exclude paths applied to responses, as inline JSON or a file, e.g. '
+             '\'{"get_entity": {"exclude": ["**.UNMAPPED_DATA"]}}\' (default: $SENZING_MCP_PROJECTION)'
+    )
+    args = parser.parse_args()
+    if args.workers > 1:
+        if not args.streamable_http:
+            parser.error('--workers requires --streamable-http (SSE sessions are pinned to one process)')
+        args.stateless = True
+    return args
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -47,28 +179,197 @@ app = Server("senzing-mcp-server")
 # Global SDK wrapper instance
 sdk_wrapper = SenzingSDKWrapper()
 
-
-def format_result(result: str, formatting_note: str) -> str:
+# Metrics exported on /metrics by the HTTP/SSE transport
+metrics = MetricsRegistry()
+tool_metrics = ToolMetrics(metrics)
+metrics.add_collector(sdk_wrapper_collector(sdk_wrapper))
+
+# Tool calls over their latency threshold are logged with a timing breakdown
+slow_calls = SlowCallLog(*parse_thresholds(os.getenv("SENZING_MCP_SLOW_CALL_MS", "0")))
+
+# Default response detail per tool: exploratory tools that can return many
+# entities start cheaper; single-entity and explanation tools return everything
+DEFAULT_DETAIL = {
+    "search_entities": "standard",
+    "get_entity": "full",
+    "get_entities": "standard",
+    "get_source_record": "full",
+    "get_source_records": "standard",
+    "find_path": "standard",
+    "expand_network": "summary",
+    "explain_why_related": "full",
+    "explain_how_resolved": "full",
+}
+
+# Every tool list_tools() offers; other names share one metrics label
+TOOL_NAMES = frozenset([*DEFAULT_DETAIL, "get_network_page"])
+
+
+def detail_property(tool: str) -> dict:
+    """JSON schema for a tool's optional detail argument."""
+    return {
+        "type": "string",
+        "enum": list(DETAIL_LEVELS),
+        "description": "How much detail to return: 'summary' (names and record counts, smallest), "
+                       "'standard' (adds records, key features and match info) or 'full' "
+                       f"(all features and record data, largest). Default: {DEFAULT_DETAIL[tool]}",
+    }
+
+
+# Large expand_network results, held for get_network_page
+network_pages = NetworkPages()
+
+# Per-tool include/exclude paths applied to responses before formatting
+projections = ProjectionConfig()
+projections.load(os.getenv("SENZING_MCP_PROJECTION", ""))
+
+
+def projection_properties() -> dict:
+    """JSON schema for the optional include/exclude arguments shared by all tools."""
+    paths = {"type": "array", "items": {"type": "string"}}
+    return {
+        "include": {
+            **paths,
+            "description": "Optional: keep only these response sections, as dot-separated key paths "
+                           "(lists are traversed, '*' matches any key), e.g. "
+                           "['RESOLVED_ENTITY.ENTITY_NAME', 'RESOLVED_ENTITY.RECORDS.DATA_SOURCE']",
+        },
+        "exclude": {
+            **paths,
+            "description": "Optional: drop these response sections; '**' matches any depth, e.g. "
+                           "['**.RECORD_FEATURES', '**.UNMAPPED_DATA', '**.FEATURE_SCORES']",
+        },
+    }
+
+
+# Which responses carry formatting notes (the notes are also MCP prompts/resources)
+formatting_notes = NoteTracker(os.getenv("SENZING_MCP_FORMATTING_NOTES", "always"))
+FORMATTING_NOTE_URI = "senzing://formatting-notes/{tool}"
+
+# Default output mode for calls without an output argument
+default_output = os.getenv("SENZING_MCP_OUTPUT", "raw")
+
+
+def output_property() -> dict:
+    """JSON schema for the optional output argument shared by all tools."""
+    return {
+        "type": "string",
+        "enum": list(OUTPUT_MODES),
+        "description": "'compact' returns a short server-computed summary (tables of IDs, names, "
+                       "scores and sources) instead of the raw engine JSON; 'raw' returns the full JSON. "
+                       "Use compact first and ask for raw only when details are needed.",
+    }
+
+
+SENZING_ERROR_BANNER = "⚠️ SENZING ERROR"
+# Tool responses starting with these are counted as errors
+ERROR_PREFIXES = (SENZING_ERROR_BANNER, "Error: ", "Unknown tool: ")
+
+
+def format_result(result: str, formatting_note: Optional[str], summarize=None) -> list[TextContent]:
     """Check result for errors and format appropriately.
 
     If the result contains an error, return a prominent error message.
-    Otherwise, return the formatting instructions + result.
+    Otherwise, return the formatting instructions and the result as separate
+    content blocks, so the (possibly multi-megabyte) payload is passed through
+    as-is. SzResult payloads are never parsed here; plain strings are parsed
+    only to look for an "error" key.
+
+    With a summarize function (compact output), a successful result is
+    parsed and replaced by summarize(data), a short Markdown digest. A
+    formatting_note of None sends the result alone.
     """
-    try:
-        data = json.loads(result)
-        if isinstance(data, dict) and "error" in data:
-            error_msg = data["error"]
-            return f"""⚠️ SENZING ERROR - DISPLAY THIS TO THE USER ⚠️
+    with tracing.span("format"):
+        return _format_result(result, formatting_note, summarize)
+
+
+def _format_result(result: str, formatting_note: Optional[str], summarize=None) -> list[TextContent]:
+    if isinstance(result, SzResult):
+        error_msg = result.error
+    else:
+        error_msg = None
+        try:
+            data = jsonutil.loads(result)
+            if isinstance(data, dict) and "error" in data:
+                error_msg = data["error"]
+        except jsonutil.JSONDecodeError:
+            pass
+
+    if error_msg is not None:
+        return [TextContent(type="text", text=f"""{SENZING_ERROR_BANNER} - DISPLAY THIS TO THE USER ⚠️
 
 The Senzing MCP tool returned an error:
 
 ERROR: {error_msg}
 
-Please inform the user about this error. Do not proceed as if the operation succeeded."""
-    except json.JSONDecodeError:
-        pass
+Please inform the user about this error. Do not proceed as if the operation succeeded.""")]
 
-    return formatting_note + result
+    if summarize is not None:
+        try:
+            with tracing.span("summarize"):
+                summary = summarize(jsonutil.loads(result))
+            return [TextContent(type="text", text=f"{summary}\n\n{RAW_HINT}")]
+        except Exception as e:
+            # An unexpected response shape falls back to the raw JSON
+            logger.warning(f"Could not summarize result, returning raw JSON: {e}")
+
+    if formatting_note is None:
+        return [TextContent(type="text", text=result)]
+    return [
+        TextContent(type="text", text=formatting_note),
+        TextContent(type="text", text=result),
+    ]
+
+
+def current_session():
+    """The MCP session of the request being handled, or None outside a request."""
+    try:
+        return app.request_context.session
+    except LookupError:
+        return None
+
+
+@app.list_prompts()
+async def list_prompts() -> list[Prompt]:
+    """Offer each tool's formatting instructions as a prompt."""
+    return [
+        Prompt(name=f"format_{tool}", description=f"How to present {tool} results")
+        for tool in FORMATTING_NOTES
+    ]
+
+
+@app.get_prompt()
+async def get_prompt(name: str, arguments: Optional[dict[str, str]]) -> GetPromptResult:
+    tool = name.removeprefix("format_")
+    if not name.startswith("format_") or tool not in FORMATTING_NOTES:
+        raise ValueError(f"Unknown prompt: {name}")
+    return GetPromptResult(
+        description=f"How to present {tool} results",
+        messages=[PromptMessage(role="user", content=TextContent(type="text", text=FORMATTING_NOTES[tool]))],
+    )
+
+
+@app.list_resources()
+async def list_resources() -> list[Resource]:
+    """Offer each tool's formatting instructions as a resource."""
+    return [
+        Resource(
+            uri=FORMATTING_NOTE_URI.format(tool=tool),
+            name=f"format_{tool}",
+            description=f"How to present {tool} results",
+            mimeType="text/plain",
+        )
+        for tool in FORMATTING_NOTES
+    ]
+
+
+@app.read_resource()
+async def read_resource(uri) -> list[ReadResourceContents]:
+    prefix = FORMATTING_NOTE_URI.format(tool="")
+    tool = str(uri).removeprefix(prefix)
+    if not str(uri).startswith(prefix) or tool not in FORMATTING_NOTES:
+        raise ValueError(f"Unknown resource: {uri}")
+    return [ReadResourceContents(content=FORMATTING_NOTES[tool], mime_type="text/plain")]
 
 
 @app.list_tools()
@@ -94,6 +395,9 @@ async def list_tools() -> list[Tool]:
                             "DATE_OF_BIRTH": {"type": "string", "description": "Birth date (YYYY-MM-DD format)"},
                         },
                     },
+                    "detail": detail_property("search_entities"),
+                    "output": output_property(),
+                    **projection_properties(),
                 },
                 "required": ["attributes"],
             },
@@ -108,10 +412,33 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "description": "Senzing's ENTITY_ID (small integer like 1, 2, 3..., NOT your source system's record ID)",
                     },
+                    "detail": detail_property("get_entity"),
+                    "output": output_property(),
+                    **projection_properties(),
                 },
                 "required": ["entity_id"],
             },
         ),
+        Tool(
+            name="get_entities",
+            description="Get full details for several resolved entities in one call using their ENTITY_IDs. USE WHEN: You need details for more than one entity, e.g. every member of a network, every search hit worth reviewing, or both sides of a relationship - prefer this over calling get_entity repeatedly. RETURNS: An ENTITIES object keyed by ENTITY_ID, where each value is the same complete entity profile get_entity returns, or an error (such as 'Entity not found') for that ID only. Lookups run concurrently on the server.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "entity_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "List of Senzing ENTITY_IDs (small integers like 1, 2, 3..., NOT source record IDs)",
+                        "minItems": 1,
+                        "maxItems": 100,
+                    },
+                    "detail": detail_property("get_entities"),
+                    "output": output_property(),
+                    **projection_properties(),
+                },
+                "required": ["entity_ids"],
+            },
+        ),
         Tool(
             name="get_source_record",
             description="Get entity details by looking up a specific source record using data source and record ID (e.g., 'CUSTOMERS:1001'). USE WHEN: You know the original source system record ID and want to find which resolved entity it belongs to. Common use case: 'Show me the entity for customer record 1001' or 'What entity contains vendor record ABC123'. This finds which entity the source record resolved into, then returns complete entity details (same as get_entity). Required parameters: data_source (e.g., 'CUSTOMERS', 'VENDORS') and record_id (e.g., '1001', 'ABC123'). Alternative to search when you have exact record identifiers.",
@@ -126,10 +453,40 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Record ID from the source system (e.g., '1001', '1002')",
                     },
+                    "detail": detail_property("get_source_record"),
+                    "output": output_property(),
+                    **projection_properties(),
                 },
                 "required": ["data_source", "record_id"],
             },
         ),
+        Tool(
+            name="get_source_records",
+            description="Look up many source records at once (e.g., CUSTOMERS:1001, CUSTOMERS:1002, VENDORS:ABC123) and get the resolved entities they belong to. USE WHEN: Reviewing a list of source record IDs, such as a data-quality review or checking which records resolved together - prefer this over calling get_source_record repeatedly. RETURNS: (1) RECORDS: a mapping from 'DATA_SOURCE:RECORD_ID' to the ENTITY_ID it resolved into (or an error such as 'Record not found'), and (2) ENTITIES: the complete profile of each distinct entity, keyed by ENTITY_ID. Records that resolved into the same entity share one entity profile, which makes duplicates easy to spot.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "records": {
+                        "type": "array",
+                        "description": "Source records to look up",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "data_source": {"type": "string", "description": "Data source code (e.g., 'CUSTOMERS')"},
+                                "record_id": {"type": "string", "description": "Record ID from the source system (e.g., '1001')"},
+                            },
+                            "required": ["data_source", "record_id"],
+                        },
+                        "minItems": 1,
+                        "maxItems": 100,
+                    },
+                    "detail": detail_property("get_source_records"),
+                    "output": output_property(),
+                    **projection_properties(),
+                },
+                "required": ["records"],
+            },
+        ),
         Tool(
             name="find_path",
             description="Find how two entities are connected through relationships and shared attributes. Discovers the chain of connections (path) between entity A and entity B, including any intermediate entities that link them. USE CASES: 'How is person X connected to person Y?', 'What's the relationship between these two companies?', 'Show me the connection path between these entities'. RETURNS: The shortest path showing (1) each entity in the connection chain, (2) what they share (common addresses, phone numbers, names, etc.), (3) relationship types at each step. Useful for investigating connections, fraud rings, or business relationships. Requires two ENTITY_IDs - use search_entities to find them first. Set max_degrees to control how many steps to search (default: 3).",
@@ -149,6 +506,9 @@ async def list_tools() -> list[Tool]:
                         "description": "Maximum degrees of separation to search (default: 3)",
                         "default": 3,
                     },
+                    "detail": detail_property("find_path"),
+                    "output": output_property(),
+                    **projection_properties(),
                 },
                 "required": ["start_entity_id", "end_entity_id"],
             },
@@ -181,10 +541,47 @@ async def list_tools() -> list[Tool]:
                         "description": "Maximum total entities to return (default: 100)",
                         "default": 100,
                     },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Entities per page; larger networks return the first page and a "
+                                       "PAGE_INFO cursor for get_network_page (default: server setting, "
+                                       "0 = return everything at once)",
+                        "minimum": 0,
+                    },
+                    "detail": detail_property("expand_network"),
+                    "output": output_property(),
+                    **projection_properties(),
                 },
                 "required": ["entity_ids"],
             },
         ),
+        Tool(
+            name="get_network_page",
+            description="Get another page of a large expand_network result. expand_network returns the first page of big networks with PAGE_INFO (CURSOR, PAGE, PAGES, NEXT_PAGE, ENTITIES_BY_DEGREE); pass that CURSOR here with a page number to continue, optionally with degree to page through only the entities at that degree of separation (0 = seed entities). Pages include the links touching their entities. Cursors expire after a few minutes of inactivity; run expand_network again if one has expired.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "cursor": {
+                        "type": "string",
+                        "description": "PAGE_INFO.CURSOR from expand_network",
+                    },
+                    "page": {
+                        "type": "integer",
+                        "description": "Page number, starting at 1 (default: 1)",
+                        "default": 1,
+                        "minimum": 1,
+                    },
+                    "degree": {
+                        "type": "integer",
+                        "description": "Optional: only entities at this degree of separation from the seeds",
+                        "minimum": 0,
+                    },
+                    "output": output_property(),
+                    **projection_properties(),
+                },
+                "required": ["cursor"],
+            },
+        ),
         Tool(
             name="explain_why_related",
             description="Explain WHY two entities are or are not related/resolved together using Senzing's scoring analysis. USE CASES: 'Why didn't these two records merge into one entity?', 'What attributes connect these entities?', 'Why are these considered related but not the same?'. RETURNS: Detailed analysis including (1) matching features (names, addresses, phones that match), (2) conflicting features (different values that prevented merge), (3) match scores and confidence levels, (4) feature-level scoring details, (5) resolution rules applied. This is the WHY analysis - explaining Senzing's decision about whether entities should be related, resolved together, or kept separate. Essential for understanding entity resolution decisions and investigating merge/non-merge reasons. Requires two ENTITY_IDs - use search_entities to find them first. For formatting guidelines, see RESPONSE_FORMATTING.md.",
@@ -199,6 +596,9 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "description": "Second ENTITY_ID (Senzing's internal identifier)",
                     },
+                    "detail": detail_property("explain_why_related"),
+                    "output": output_property(),
+                    **projection_properties(),
                 },
                 "required": ["entity_id_1", "entity_id_2"],
             },
@@ -213,6 +613,9 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "description": "ENTITY_ID to explain (Senzing's internal identifier)",
                     },
+                    "detail": detail_property("explain_how_resolved"),
+                    "output": output_property(),
+                    **projection_properties(),
                 },
                 "required": ["entity_id"],
             },
@@ -222,86 +625,64 @@ async def list_tools() -> list[Tool]:
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls."""
+    """Handle tool calls, recording per-tool metrics and traces."""
+    start = time.perf_counter()
+    with tracing.trace_call(name, force=slow_calls.enabled) as trace:
+        content = await dispatch_tool(name, arguments)
+        error = content[0].text.startswith(ERROR_PREFIXES)
+        if trace is not None:
+            trace.finish("error" if error else "ok")
+    elapsed = time.perf_counter() - start
+    # Client-supplied names must not create unbounded metric label series
+    label = name if name in TOOL_NAMES else "unknown"
+    tool_metrics.observe(label, elapsed, sum(len(block.text) for block in content), error=error)
+    slow_calls.observe(
+        name, arguments, elapsed,
+        lambda: sum(len(block.text.encode()) for block in content),
+        trace,
+    )
+    return content
+
+
+async def dispatch_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Run a tool and format its result."""
     try:
         # Ensure SDK is initialized
         if not sdk_wrapper._initialized:
             await sdk_wrapper.initialize()
 
+        detail = arguments.get("detail") or DEFAULT_DETAIL.get(name, "full")
+        projection = projections.for_call(name, arguments)
+        output = arguments.get("output") or default_output
+        if output not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode '{output}' (expected one of {', '.join(OUTPUT_MODES)})")
+        summarize = SUMMARIZERS.get(name) if output == "compact" else None
+
         # Entity Search and Retrieval
         if name == "search_entities":
             attributes_dict = arguments.get("attributes", {})
             attributes_json = json.dumps(attributes_dict)
-            result = await sdk_wrapper.search_by_attributes(attributes_json)
-
-            formatting_note = """[FORMATTING INSTRUCTIONS FOR SEARCH RESULTS]
-Present as clear search results:
-1. Search Summary:
-   - Number of entities found
-   - Search criteria used
-   - Score range
-2. Results Table grouped by score ranges:
-   - Strong Matches (90-100%)
-   - Good Matches (70-89%)
-   - Possible Matches (below 70%)
-   Columns: Entity ID | Name | Score | Data Sources | Key Matches
-3. Analysis:
-   - Explain what scores mean
-   - Why certain entities scored higher
-   - Notable patterns in results
-
-[RAW JSON DATA FOLLOWS]
-"""
-            return [TextContent(type="text", text=format_result(result, formatting_note))]
+            result = await sdk_wrapper.search_by_attributes(attributes_json, detail=detail)
 
         elif name == "get_entity":
             entity_id = arguments.get("entity_id")
-            result = await sdk_wrapper.get_entity_by_entity_id(entity_id)
-
-            formatting_note = """[FORMATTING INSTRUCTIONS FOR ENTITY DETAILS]
-Present as comprehensive entity profile:
-1. Entity Overview:
-   - Entity ID and resolved name
-   - Number of source records and data sources
-2. Source Records Section:
-   - Group by data source
-   - Show record IDs with key info and dates
-3. Resolved Features Section:
-   - Names (primary and variants)
-   - Contact Information (email, phone, address)
-   - Identifiers (DOB, SSN, employee IDs, etc.)
-4. Relationships Section (if present):
-   - Group by relationship type (Possibly Related, Possibly Same)
-   - Show entity ID, name, and connection reason
-Keep organized with clear section headers.
-
-[RAW JSON DATA FOLLOWS]
-"""
-            return [TextContent(type="text", text=format_result(result, formatting_note))]
+            result = await sdk_wrapper.get_entity_by_entity_id(entity_id, detail=detail)
+
+        elif name == "get_entities":
+            entity_ids = arguments.get("entity_ids", [])
+            result = await sdk_wrapper.get_entities_by_entity_ids(entity_ids, detail=detail)
 
         elif name == "get_source_record":
             data_source = arguments.get("data_source")
             record_id = arguments.get("record_id")
-            result = await sdk_wrapper.get_entity_by_record_id(data_source, record_id)
-
-            formatting_note = """[FORMATTING INSTRUCTIONS FOR SOURCE RECORD LOOKUP]
-Present as entity profile (same format as get_entity):
-1. Start by noting which source record was queried
-2. Entity Overview:
-   - Entity ID and resolved name
-   - Number of source records and data sources
-3. Source Records Section:
-   - Highlight the queried record
-   - Group by data source
-   - Show record IDs with key info
-4. Resolved Features Section:
-   - Names, Contact Information, Identifiers
-5. Relationships Section (if present)
-Keep organized with clear section headers.
-
-[RAW JSON DATA FOLLOWS]
-"""
-            return [TextContent(type="text", text=format_result(result, formatting_note))]
+            result = await sdk_wrapper.get_entity_by_record_id(data_source, record_id, detail=detail)
+
+        elif name == "get_source_records":
+            records = [
+                (record.get("data_source"), record.get("record_id"))
+                for record in arguments.get("records", [])
+            ]
+            result = await sdk_wrapper.get_entities_by_record_ids(records, detail=detail)
 
         # Relationship Analysis
         elif name == "find_path":
@@ -309,31 +690,9 @@ Keep organized with clear section headers.
             end_id = arguments.get("end_entity_id")
             max_degrees = arguments.get("max_degrees", 3)
             result = await sdk_wrapper.find_path_by_entity_id(
-                start_id, end_id, max_degrees
+                start_id, end_id, max_degrees, detail=detail
             )
 
-            formatting_note = """[FORMATTING INSTRUCTIONS FOR RELATIONSHIP PATH]
-Present as connection path visualization:
-1. Path Summary:
-   - Degrees of separation
-   - Total entities in path
-   - Primary connection types
-2. Path Visualization with arrows:
-   Entity A (Name)
-       ↓ [Connection Type: details]
-   Entity B (Name)
-       ↓ [Connection Type: details]
-   Entity C (Name)
-3. Analysis:
-   - Explain what the connections mean
-   - Relationship strength/confidence
-   - Notable patterns or concerns
-Alternative: Use table format for complex paths.
-
-[RAW JSON DATA FOLLOWS]
-"""
-            return [TextContent(type="text", text=format_result(result, formatting_note))]
-
         elif name == "expand_network":
             entity_ids = arguments.get("entity_ids", [])
             max_degrees = arguments.get("max_degrees", 2)
@@ -343,75 +702,37 @@ Alternative: Use table format for complex paths.
             max_entities = arguments.get("max_entities", 100)
             entity_list_json = json.dumps({"ENTITIES": [{"ENTITY_ID": eid} for eid in entity_ids]})
             result = await sdk_wrapper.find_network_by_entity_id(
-                entity_list_json, max_degrees, build_out, max_entities
+                entity_list_json, max_degrees, build_out, max_entities, detail=detail
+            )
+            # Large networks are stored and returned a page at a time
+            result = await asyncio.to_thread(
+                network_pages.first_page, result, entity_ids, arguments.get("page_size"), max_entities
             )
 
-            formatting_note = """[FORMATTING INSTRUCTIONS FOR NETWORK EXPANSION]
-Present as organized network analysis:
-1. Network Summary:
-   - Number of entities and relationships
-   - Degrees explored
-   - Key clusters identified
-2. Organize by connection strength:
-   - Core Entities (starting points)
-   - Direct Connections (1 degree)
-   - Secondary Connections (2 degrees)
-   - For each: show entity, data sources, connection type
-3. Highlight Clusters:
-   - Group related entities (e.g., Household, Business)
-   - Explain common attributes
-Optional: Include table showing entity connections and relationship types.
-
-[RAW JSON DATA FOLLOWS]
-"""
-            return [TextContent(type="text", text=format_result(result, formatting_note))]
+        elif name == "get_network_page":
+            result = network_pages.page(
+                arguments.get("cursor", ""), arguments.get("page", 1), arguments.get("degree")
+            )
 
         elif name == "explain_why_related":
             entity_id_1 = arguments.get("entity_id_1")
             entity_id_2 = arguments.get("entity_id_2")
-            result = await sdk_wrapper.why_entities(entity_id_1, entity_id_2)
-
-            formatting_note = """[FORMATTING INSTRUCTIONS FOR WHY ANALYSIS]
-Present as relationship analysis:
-1. Summary:
-   - ✅ Confirmations: features that matched
-   - ❌ Denials: features that conflicted
-   - Match key used
-   - ➡️ Bottom line: final decision statement
-2. Side-by-side comparison table:
-   - Columns: Feature | Entity 1 | Entity 2 | Result
-   - Always include DATA_SOURCE row showing record counts (e.g., "CUSTOMERS:4, WATCHLIST:1")
-   - Mark matching features with ✅, conflicts with ❌
-   - Do NOT show or explain ERRULE_CODE
-Keep tone professional and concise.
-
-[RAW JSON DATA FOLLOWS]
-"""
-            return [TextContent(type="text", text=format_result(result, formatting_note))]
+            result = await sdk_wrapper.why_entities(entity_id_1, entity_id_2, detail=detail)
 
         elif name == "explain_how_resolved":
             entity_id = arguments.get("entity_id")
-            result = await sdk_wrapper.how_entity_by_entity_id(entity_id)
-
-            formatting_note = """[FORMATTING INSTRUCTIONS FOR HOW ANALYSIS]
-Present as step-by-step resolution timeline:
-1. Summary: Which records merged, how many steps, match drivers, any conflicts
-2. Resolution Steps: For each step show:
-   - Step header with verb rules: "with" for single-to-single, "into" for single-to-group
-   - Group notation: "CUSTOMERS:1002 +3 more" not full lists
-   - Confirming features with ✅ and scores
-   - Denying features with ❌
-   - Match keys used
-3. Bottom line: Concise final decision statement with ➡️
-Keep tone professional and clear.
-
-[RAW JSON DATA FOLLOWS]
-"""
-            return [TextContent(type="text", text=format_result(result, formatting_note))]
+            result = await sdk_wrapper.how_entity_by_entity_id(entity_id, detail=detail)
 
         else:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
+        session = current_session()
+        note = formatting_notes.note_for(session, name)
+        content = format_result(projection.apply(result), note, summarize)
+        if note is not None and len(content) > 1:
+            formatting_notes.mark_sent(session, name)
+        return content
+
     except Exception as e:
         logger.error(f"Error executing tool {name}: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -427,6 +748,18 @@ async def run_stdio_server():
         )
 
 
+def metrics_route():
+    """Route serving metrics in Prometheus text format."""
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Route
+
+    async def handle_metrics(request: Request):
+        return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+    return Route("/metrics", endpoint=handle_metrics)
+
+
 async def run_http_server(host: str, port: int):
     """Run the MCP server with HTTP/SSE transport."""
     from mcp.server.sse import SseServerTransport
@@ -449,43 +782,198 @@ async def run_http_server(host: str, port: int):
                 app.create_initialization_options(),
             )
 
-    # Create Starlette app with SSE routes
+    # Create Starlette app with SSE and metrics routes
     starlette_app = Starlette(
         debug=False,
         routes=[
             Route("/sse", endpoint=handle_sse),
+            metrics_route(),
             Mount("/messages/", app=sse_transport.handle_post_message),
         ],
     )
 
     logger.info(f"Senzing MCP server (HTTP/SSE) running at http://{host}:{port}/sse")
     logger.info(f"Clients should connect to: http://{host}:{port}/sse")
+    logger.info(f"Metrics available at: http://{host}:{port}/metrics")
 
     config = uvicorn.Config(
         starlette_app,
         host=host,
         port=port,
         log_level="info",
+        # uvloop and httptools when installed (pip install senzing-mcp-server[fast])
+        loop="auto",
+        http="auto",
     )
     server = uvicorn.Server(config)
     await server.serve()
 
 
+async def run_unix_socket_server(path: str):
+    """Run the MCP server as a daemon serving one session per Unix socket connection.
+
+    All sessions share this process's engine and caches.
+    """
+    from senzing_mcp.daemon import serve_unix_socket
+
+    async def run_session(read_stream, write_stream):
+        await app.run(
+            read_stream,
+            write_stream,
+            app.create_initialization_options(),
+        )
+
+    logger.info(f"Senzing MCP daemon listening on {path}")
+    logger.info(f"Clients should run: senzing-mcp-shim --socket {path}")
+    await serve_unix_socket(path, run_session)
+
+
+def create_streamable_http_app(stateless: bool, owns_sdk: bool = False):
+    """Build the Starlette app for the streamable HTTP transport.
+
+    In stateless mode every request is handled on its own (no session IDs)
+    and answered with a plain JSON response, so requests can be spread over
+    worker processes or replicas by any load balancer. With owns_sdk the
+    app initializes the SDK on startup and cleans up on shutdown, as each
+    worker process does.
+    """
+    from contextlib import asynccontextmanager
+
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+
+    session_manager = StreamableHTTPSessionManager(app=app, json_response=stateless, stateless=stateless)
+
+    @asynccontextmanager
+    async def lifespan(starlette_app):
+        if owns_sdk:
+            await sdk_wrapper.initialize()
+            logger.info(f"Senzing SDK initialized in worker {os.getpid()}")
+            sdk_wrapper.start_config_monitor()
+        try:
+            async with session_manager.run():
+                yield
+        finally:
+            if owns_sdk:
+                await sdk_wrapper.cleanup()
+                tracing.set_exporter(tracing.NoopExporter())
+                slow_calls.stop()
+
+    return Starlette(
+        debug=False,
+        routes=[
+            Mount("/mcp", app=session_manager.handle_request),
+            metrics_route(),
+        ],
+        lifespan=lifespan,
+    )
+
+
+def create_worker_app():
+    """uvicorn app factory for --workers: configure this worker from its command line."""
+    # Worker processes are spawned with the parent's sys.argv
+    args = parse_args()
+    configure(args)
+    return create_streamable_http_app(stateless=True, owns_sdk=True)
+
+
+async def run_streamable_http_server(host: str, port: int, stateless: bool):
+    """Run the MCP server with the streamable HTTP transport in this process."""
+    import uvicorn
+
+    mode = "stateless" if stateless else "sessions"
+    logger.info(f"Senzing MCP server (streamable HTTP, {mode}) running at http://{host}:{port}/mcp")
+    logger.info(f"Metrics available at: http://{host}:{port}/metrics")
+
+    config = uvicorn.Config(
+        create_streamable_http_app(stateless),
+        host=host,
+        port=port,
+        log_level="info",
+        loop="auto",
+        http="auto",
+    )
+    server = uvicorn.Server(config)
+    await server.serve()
+
+
+def run_http_workers(args):
+    """Serve streamable HTTP (stateless) from args.workers processes.
+
+    uvicorn binds the socket once and spawns the workers, which share it;
+    each worker builds its own app and SDK engine via create_worker_app.
+    The parent only supervises and restarts workers. Metrics, caches and
+    traces are per worker.
+    """
+    import uvicorn
+
+    logger.info(f"Senzing MCP server (streamable HTTP, stateless) running at "
+                f"http://{args.host}:{args.port}/mcp with {args.workers} workers")
+    uvicorn.run(
+        "senzing_mcp.server:create_worker_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level="info",
+        loop="auto",
+        http="auto",
+    )
+
+
+def configure(args):
+    """Apply command line settings to the SDK wrapper, tracing and slow-call log."""
+    global default_output
+    if args.max_workers is not None or args.bulkhead:
+        sdk_wrapper.configure_concurrency(args.max_workers, dict(args.bulkhead))
+    if args.engine_workers is not None:
+        sdk_wrapper.engine_workers = args.engine_workers
+    if args.config_poll_interval is not None:
+        sdk_wrapper.config_poll_interval = args.config_poll_interval
+    if args.stateless:
+        # A cursor only lives in this process; the next stateless request may not
+        network_pages.disable()
+        logger.info("Network paging disabled in stateless mode")
+    if args.formatting_notes is not None:
+        formatting_notes.mode = args.formatting_notes
+    if args.output is not None:
+        default_output = args.output
+    if args.projection is not None:
+        projections.load(args.projection)
+    if args.slow_call_ms is not None:
+        slow_calls.default_ms, slow_calls.tool_ms = args.slow_call_ms
+    slow_calls.start(args.slow_call_log)
+    if args.trace_file:
+        tracing.set_exporter(tracing.FileExporter(args.trace_file))
+        logger.info(f"Writing tool call traces to {args.trace_file}")
+
+
 async def main():
     """Main entry point for the MCP server."""
     args = parse_args()
+    if args.workers > 1:
+        raise RuntimeError("--workers is handled by run(); use the senzing-mcp entry point")
 
     try:
         logger.info("Starting Senzing MCP server...")
+        configure(args)
 
         # Initialize SDK
         await sdk_wrapper.initialize()
         logger.info("Senzing SDK initialized successfully")
+        sdk_wrapper.start_config_monitor()
 
         # Run server with selected transport
-        if args.http:
+        if args.streamable_http:
+            logger.info(f"Using streamable HTTP transport on {args.host}:{args.port}")
+            await run_streamable_http_server(args.host, args.port, args.stateless)
+        elif args.http:
             logger.info(f"Using HTTP/SSE transport on {args.host}:{args.port}")
             await run_http_server(args.host, args.port)
+        elif args.unix_socket:
+            logger.info(f"Using Unix socket transport on {args.unix_socket}")
+            await run_unix_socket_server(args.unix_socket)
         else:
             logger.info("Using STDIO transport")
             await run_stdio_server()
@@ -498,12 +986,18 @@ async def main():
     finally:
         # Cleanup
         await sdk_wrapper.cleanup()
+        tracing.set_exporter(tracing.NoopExporter())
+        slow_calls.stop()
         logger.info("Senzing MCP server stopped")
 
 
 def run():
     """Entry point for console script."""
-    asyncio.run(main())
+    args = parse_args()
+    if args.workers > 1:
+        run_http_workers(args)
+    else:
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
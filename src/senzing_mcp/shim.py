@@ -0,0 +1,184 @@
+"""Thin STDIO shim that forwards an MCP session to a local daemon.
+
+AI assistants start an MCP server per session over STDIO. Point them at
+senzing-mcp-shim instead, and each session becomes a connection to one
+long-lived daemon (senzing-mcp --unix-socket PATH) that keeps the engine
+and caches warm. The shim only copies bytes between stdin/stdout and the
+socket, and imports nothing beyond the standard library, so it starts in
+milliseconds.
+
+With --autostart (or SENZING_MCP_SHIM_AUTOSTART=1) a missing daemon is
+started in the background with the shim's environment, and later sessions
+reuse it.
+
+The socket, its lock and log files live in a directory only the user can
+write to (a per-user 0700 directory when XDG_RUNTIME_DIR is unset). The shim
+refuses a socket or directory owned by another user, since whoever controls
+them sees every query.
+"""
+
+import argparse
+import fcntl
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+CHUNK_SIZE = 65536
+
+
+class UnsafeSocketError(RuntimeError):
+    """The socket or its directory is controlled by another user."""
+
+
+def default_socket_path() -> str:
+    """Per-user socket path: $XDG_RUNTIME_DIR/senzing-mcp.sock, else in a private directory under /tmp."""
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "senzing-mcp.sock")
+    return f"/tmp/senzing-mcp-{os.getuid()}/senzing-mcp.sock"
+
+
+def check_socket_dir(directory: str):
+    """Refuse a directory another user owns or can write to (they could swap the socket)."""
+    st = os.stat(directory)
+    if st.st_uid != os.getuid():
+        raise UnsafeSocketError(f"{directory} is owned by uid {st.st_uid}, not the current user")
+    if st.st_mode & 0o022:
+        raise UnsafeSocketError(f"{directory} is writable by other users")
+
+
+def make_socket_dir(path: str):
+    """Create the socket's directory owner-only (0700) if missing, and check it."""
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    check_socket_dir(directory)
+
+
+def connect(path: str) -> socket.socket:
+    """Connect to the daemon on path, after checking the socket and its directory are the user's."""
+    check_socket_dir(os.path.dirname(os.path.abspath(path)))
+    st = os.stat(path)
+    if st.st_uid != os.getuid():
+        raise UnsafeSocketError(f"{path} is owned by uid {st.st_uid}, not the current user")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def start_daemon(path: str, log_path: str, timeout: float) -> socket.socket:
+    """Start a daemon on path unless another shim just did, then connect to it."""
+    make_socket_dir(path)
+    # Serialize autostarts, so concurrent shims start one daemon between them
+    with open(path + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            return connect(path)
+        except OSError:
+            pass
+        with open(log_path, "ab") as log:
+            subprocess.Popen(
+                [sys.executable, "-m", "senzing_mcp.server", "--unix-socket", path],
+                stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+                start_new_session=True,
+            )
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return connect(path)
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Daemon did not start within {timeout}s (see {log_path})")
+                time.sleep(0.05)
+
+
+def pump(sock: socket.socket, stdin_fd: int = 0, stdout_fd: int = 1):
+    """Copy stdin to the socket and the socket to stdout until the daemon closes it."""
+    def forward_stdin():
+        try:
+            while True:
+                data = os.read(stdin_fd, CHUNK_SIZE)
+                if not data:
+                    break
+                sock.sendall(data)
+        except OSError:
+            pass
+        finally:
+            # Let the daemon see end of input and finish the session
+            try:
+                sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    threading.Thread(target=forward_stdin, daemon=True).start()
+    while True:
+        data = sock.recv(CHUNK_SIZE)
+        if not data:
+            break
+        view = memoryview(data)
+        while view:
+            written = os.write(stdout_fd, view)
+            view = view[written:]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Forward an MCP STDIO session to a senzing-mcp daemon on a Unix socket"
+    )
+    parser.add_argument(
+        '--socket',
+        default=os.getenv('SENZING_MCP_UNIX_SOCKET') or default_socket_path(),
+        help='Daemon socket path (default: $SENZING_MCP_UNIX_SOCKET or a per-user path)'
+    )
+    parser.add_argument(
+        '--autostart',
+        action='store_true',
+        default=os.getenv('SENZING_MCP_SHIM_AUTOSTART', '') in ('1', 'true', 'yes'),
+        help='Start the daemon if it is not running (default: $SENZING_MCP_SHIM_AUTOSTART)'
+    )
+    parser.add_argument(
+        '--autostart-log',
+        default=None,
+        metavar='PATH',
+        help='Daemon output when autostarted (default: SOCKET.log)'
+    )
+    parser.add_argument(
+        '--autostart-timeout',
+        type=float,
+        default=60.0,
+        metavar='SECONDS',
+        help='How long to wait for an autostarted daemon (default: 60)'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Entry point for the senzing-mcp-shim console script."""
+    args = parse_args(argv)
+    try:
+        try:
+            sock = connect(args.socket)
+        except OSError as e:
+            if not args.autostart:
+                print(f"Error: no senzing-mcp daemon on {args.socket} ({e}); start one with "
+                      f"'senzing-mcp --unix-socket {args.socket}' or pass --autostart", file=sys.stderr)
+                sys.exit(1)
+            sock = start_daemon(args.socket, args.autostart_log or args.socket + ".log", args.autostart_timeout)
+    except UnsafeSocketError as e:
+        print(f"Error: refusing to use {args.socket}: {e}", file=sys.stderr)
+        sys.exit(1)
+    with sock:
+        pump(sock)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Structured log of tool calls that exceed a latency threshold.
+
+Each slow call produces one JSON log line with the tool, sanitized arguments
+(IDs, degrees and limits, attribute names but never attribute values), the
+engine flags used, executor wait, engine time and response size. Records are
+handed to a QueueHandler and written by a QueueListener thread, so logging
+never blocks the event loop on file or terminal I/O.
+"""
+
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+from senzing_mcp.tracing import Trace
+
+logger = logging.getLogger("senzing_mcp.slow_calls")
+
+# Arguments logged as-is; anything else is dropped unless handled below
+_PLAIN_ARGUMENTS = {
+    "entity_id", "entity_id_1", "entity_id_2", "start_entity_id", "end_entity_id",
+    "max_degrees", "build_out_degrees", "max_entities", "data_source", "detail",
+    "include", "exclude", "output", "page", "page_size", "degree",
+}
+# Longest list of entity IDs logged in full
+_MAX_LOGGED_IDS = 20
+
+
+def parse_thresholds(spec: str) -> tuple[float, dict[str, float]]:
+    """Parse "MS[,TOOL=MS...]" into (default_ms, {tool: ms}).
+
+    Raises ValueError for malformed entries.
+    """
+    default_ms = 0.0
+    tool_ms = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        tool, sep, value = entry.rpartition("=")
+        if sep:
+            tool_ms[tool] = float(value)
+        else:
+            default_ms = float(value)
+    return default_ms, tool_ms
+
+
+def sanitize_arguments(arguments: Any) -> dict:
+    """Return the tool arguments that are safe and useful to log."""
+    if not isinstance(arguments, dict):
+        return {}
+    sanitized = {}
+    for key, value in arguments.items():
+        if key in _PLAIN_ARGUMENTS:
+            sanitized[key] = value
+        elif key == "entity_ids" and isinstance(value, list):
+            sanitized[key] = value[:_MAX_LOGGED_IDS]
+            sanitized["entity_id_count"] = len(value)
+        elif key == "attributes" and isinstance(value, dict):
+            sanitized["attribute_keys"] = sorted(value)
+        elif key == "records" and isinstance(value, list):
+            sanitized["record_count"] = len(value)
+            sanitized["data_sources"] = sorted({
+                record.get("data_source") for record in value if isinstance(record, dict)
+            } - {None})
+    return sanitized
+
+
+class SlowCallLog:
+    """Per-tool latency thresholds and the background writer for slow calls.
+
+    A threshold of 0 disables logging for that tool; tools without their own
+    threshold use default_ms.
+    """
+
+    def __init__(self, default_ms: float = 0.0, tool_ms: Optional[dict[str, float]] = None):
+        self.default_ms = default_ms
+        self.tool_ms = dict(tool_ms or {})
+        self._listener: Optional[QueueListener] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.default_ms > 0 or any(ms > 0 for ms in self.tool_ms.values())
+
+    def threshold_ms(self, tool: str) -> float:
+        return self.tool_ms.get(tool, self.default_ms)
+
+    def start(self, path: Optional[str] = None):
+        """Start the background writer, logging to path or stderr."""
+        if self._listener is not None or not self.enabled:
+            return
+        handler = logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(asctime)s SLOW_CALL %(message)s"))
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(records)
+        logger.addHandler(self._queue_handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        self._listener = QueueListener(records, handler)
+        self._listener.start()
+
+    def stop(self):
+        """Flush queued records and stop the background writer."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        logger.removeHandler(self._queue_handler)
+        self._listener = None
+
+    def observe(self, tool: str, arguments: Any, seconds: float, response_bytes, trace: Optional[Trace]) -> bool:
+        """Log the call if it exceeded its tool's threshold; return whether it did.
+
+        response_bytes is a callable so the size is only computed for slow calls.
+        """
+        threshold = self.threshold_ms(tool)
+        if threshold <= 0 or seconds * 1000 < threshold:
+            return False
+
+        entry = {
+            "tool": tool,
+            "duration_ms": round(seconds * 1000, 1),
+            "threshold_ms": threshold,
+            "arguments": sanitize_arguments(arguments),
+            "response_bytes": response_bytes(),
+        }
+        if trace is not None:
+            totals = trace.stage_totals()
+            sdk_spans = [attrs for stage, _, _, attrs in trace.spans if stage == "sdk"]
+            entry["executor_wait_ms"] = round(totals.get("queue_wait", 0.0) * 1000, 1)
+            entry["engine_ms"] = round(totals.get("sdk", 0.0) * 1000, 1)
+            entry["engine_calls"] = len(sdk_spans)
+            entry["flags"] = {
+                attrs["method"]: attrs["flags"] for attrs in sdk_spans if "flags" in attrs
+            }
+        logger.info(json.dumps(entry, separators=(",", ":"), default=str))
+        return True
@@ -0,0 +1,321 @@
+"""Compact, server-side summaries of engine responses.
+
+In compact output mode a tool returns a small Markdown digest computed
+here (tables of entity IDs, names, scores and data sources, resolution
+steps with their confirming and denying features) instead of the
+formatting instructions and the raw engine JSON. The raw JSON stays one
+call away with output="raw".
+
+Each summarizer takes the parsed response and returns the digest text.
+Tables are capped at MAX_ROWS rows.
+"""
+
+import re
+from typing import Any, Callable, Iterable, Optional
+
+OUTPUT_MODES = ("raw", "compact")
+
+# Longest table in a digest; the rest is counted, not listed
+MAX_ROWS = 25
+
+# Score buckets for search results, highest first
+SCORE_BUCKETS = (("Strong (90-100)", 90), ("Good (70-89)", 70), ("Possible (<70)", None))
+
+RAW_HINT = 'Call again with output="raw" for the full JSON.'
+
+_MATCH_KEY_PART = re.compile(r"([+-])([^+-]+)")
+
+
+def match_key_features(match_key: str) -> tuple[list[str], list[str]]:
+    """Split a match key such as "+NAME+DOB-SSN" into (confirming, denying) features."""
+    confirming, denying = [], []
+    for sign, feature in _MATCH_KEY_PART.findall(match_key or ""):
+        (confirming if sign == "+" else denying).append(feature)
+    return confirming, denying
+
+
+def _cell(value: Any) -> str:
+    return str(value if value is not None else "").replace("|", "/").replace("\n", " ")
+
+
+def _table(header: Iterable[str], rows: list[Iterable[Any]]) -> list[str]:
+    header = list(header)
+    lines = [
+        "| " + " | ".join(header) + " |",
+        "|" + "---|" * len(header),
+    ]
+    lines.extend("| " + " | ".join(_cell(value) for value in row) + " |" for row in rows[:MAX_ROWS])
+    if len(rows) > MAX_ROWS:
+        lines.append(f"... and {len(rows) - MAX_ROWS} more")
+    return lines
+
+
+def _sources(entity: dict) -> str:
+    """Record counts per data source, e.g. "CUSTOMERS:4, WATCHLIST:1"."""
+    summary = entity.get("RECORD_SUMMARY")
+    if summary:
+        return ", ".join(f"{item.get('DATA_SOURCE')}:{item.get('RECORD_COUNT', 0)}" for item in summary)
+    counts: dict[str, int] = {}
+    for record in entity.get("RECORDS", []):
+        counts[record.get("DATA_SOURCE")] = counts.get(record.get("DATA_SOURCE"), 0) + 1
+    return ", ".join(f"{source}:{count}" for source, count in counts.items())
+
+
+def _record_count(entity: dict) -> int:
+    summary = entity.get("RECORD_SUMMARY")
+    if summary:
+        return sum(item.get("RECORD_COUNT", 0) for item in summary)
+    return len(entity.get("RECORDS", []))
+
+
+def _resolved(item: Any) -> dict:
+    """The RESOLVED_ENTITY of an entity response (or the item itself)."""
+    if not isinstance(item, dict):
+        return {}
+    if "ENTITY" in item:
+        item = item["ENTITY"]
+    return item.get("RESOLVED_ENTITY", item)
+
+
+def _feature_score(score: dict) -> Optional[int]:
+    for key in ("SCORE", "FULL_SCORE", "GNR_FN"):
+        if isinstance(score.get(key), (int, float)):
+            return score[key]
+    return None
+
+
+def best_score(feature_scores: dict) -> Optional[int]:
+    """Search score of a result: the best NAME score, else the best of any feature."""
+    def best(scores: list) -> Optional[int]:
+        values = [value for value in map(_feature_score, scores) if value is not None]
+        return max(values) if values else None
+
+    name_score = best(feature_scores.get("NAME", []))
+    if name_score is not None:
+        return name_score
+    return best([score for scores in feature_scores.values() for score in scores])
+
+
+def _bucket(score: Optional[int]) -> str:
+    for label, minimum in SCORE_BUCKETS:
+        if minimum is None or (score is not None and score >= minimum):
+            return label
+    return SCORE_BUCKETS[-1][0]
+
+
+def summarize_search(data: dict) -> str:
+    results = data.get("RESOLVED_ENTITIES", [])
+    rows, buckets = [], {label: 0 for label, _ in SCORE_BUCKETS}
+    for result in results:
+        match_info = result.get("MATCH_INFO", {})
+        entity = _resolved(result)
+        score = best_score(match_info.get("FEATURE_SCORES", {}))
+        buckets[_bucket(score)] += 1
+        rows.append((entity.get("ENTITY_ID"), entity.get("ENTITY_NAME"), score if score is not None else "",
+                     _sources(entity), match_info.get("MATCH_KEY", "")))
+    rows.sort(key=lambda row: row[2] if row[2] != "" else -1, reverse=True)
+    lines = [f"## Search: {len(results)} entities found", ""]
+    lines.append("Score buckets: " + ", ".join(f"{label} {count}" for label, count in buckets.items()))
+    if rows:
+        lines += [""] + _table(("Entity ID", "Name", "Score", "Sources", "Match Key"), rows)
+    return "\n".join(lines)
+
+
+def _entity_lines(entity: dict, related: list) -> list[str]:
+    lines = [
+        f"## Entity {entity.get('ENTITY_ID')}: {entity.get('ENTITY_NAME', '')}",
+        "",
+        f"Records: {_record_count(entity)} ({_sources(entity)})",
+    ]
+    features = entity.get("FEATURES", {})
+    if features:
+        lines += ["", "Features:"]
+        for feature_type, values in features.items():
+            descriptions = [value.get("FEAT_DESC", "") for value in values]
+            shown = ", ".join(descriptions[:5]) + (f" +{len(descriptions) - 5} more" if len(descriptions) > 5 else "")
+            lines.append(f"- {feature_type}: {shown}")
+    if related:
+        lines += ["", f"Related entities: {len(related)}", ""]
+        lines += _table(("Entity ID", "Name", "Match Level", "Match Key"), [
+            (item.get("ENTITY_ID"), item.get("ENTITY_NAME", ""), item.get("MATCH_LEVEL_CODE", ""),
+             item.get("MATCH_KEY", ""))
+            for item in related
+        ])
+    return lines
+
+
+def summarize_entity(data: dict) -> str:
+    return "\n".join(_entity_lines(_resolved(data), data.get("RELATED_ENTITIES", [])))
+
+
+def _entity_rows(entities: dict) -> tuple[list, list]:
+    rows, errors = [], []
+    for entity_id, item in entities.items():
+        if isinstance(item, dict) and "error" in item:
+            errors.append(f"- {entity_id}: {item['error']}")
+            continue
+        entity = _resolved(item)
+        rows.append((entity.get("ENTITY_ID", entity_id), entity.get("ENTITY_NAME", ""), _record_count(entity),
+                     _sources(entity), len(item.get("RELATED_ENTITIES", []))))
+    return rows, errors
+
+
+def summarize_entities(data: dict) -> str:
+    rows, errors = _entity_rows(data.get("ENTITIES", {}))
+    lines = [f"## {len(rows)} entities", ""]
+    lines += _table(("Entity ID", "Name", "Records", "Sources", "Related"), rows)
+    if errors:
+        lines += ["", "Errors:"] + errors
+    return "\n".join(lines)
+
+
+def summarize_records(data: dict) -> str:
+    entities = data.get("ENTITIES", {})
+    rows, errors = [], []
+    for record, entity_id in data.get("RECORDS", {}).items():
+        if isinstance(entity_id, dict):
+            errors.append(f"- {record}: {entity_id.get('error', entity_id)}")
+            continue
+        entity = _resolved(entities.get(str(entity_id), {}))
+        rows.append((record, entity_id, entity.get("ENTITY_NAME", "")))
+    distinct = len({row[1] for row in rows})
+    lines = [f"## {len(rows)} records in {distinct} entities", ""]
+    lines += _table(("Source Record", "Entity ID", "Entity Name"), rows)
+    if errors:
+        lines += ["", "Errors:"] + errors
+    return "\n".join(lines)
+
+
+def _names(data: dict) -> dict:
+    return {entity.get("ENTITY_ID"): entity.get("ENTITY_NAME", "") for entity in map(_resolved, data.get("ENTITIES", []))}
+
+
+def _link_keys(links: list) -> dict:
+    return {
+        frozenset((link.get("MIN_ENTITY_ID"), link.get("MAX_ENTITY_ID"))): link.get("MATCH_KEY", "")
+        for link in links
+    }
+
+
+def summarize_path(data: dict) -> str:
+    names = _names(data)
+    links = _link_keys(data.get("ENTITY_PATH_LINKS", []))
+    lines = []
+    for path in data.get("ENTITY_PATHS", []):
+        start, end, ids = path.get("START_ENTITY_ID"), path.get("END_ENTITY_ID"), path.get("ENTITIES", [])
+        if not ids:
+            lines.append(f"## No path from {start} to {end}")
+            continue
+        lines += [f"## Path from {start} to {end}: {len(ids) - 1} degrees", ""]
+        for index, entity_id in enumerate(ids):
+            lines.append(f"{entity_id} ({names.get(entity_id, '')})")
+            if index + 1 < len(ids):
+                match_key = links.get(frozenset((entity_id, ids[index + 1])), "")
+                lines.append(f"    ↓ {match_key}" if match_key else "    ↓")
+    return "\n".join(lines) or "## No paths"
+
+
+def summarize_network(data: dict) -> str:
+    entities = [_resolved(entity) for entity in data.get("ENTITIES", [])]
+    links = data.get("ENTITY_NETWORK_LINKS", [])
+    match_keys: dict[str, int] = {}
+    for link in links:
+        match_keys[link.get("MATCH_KEY", "")] = match_keys.get(link.get("MATCH_KEY", ""), 0) + 1
+    lines = [f"## Network: {len(entities)} entities, {len(links)} links", ""]
+    page_info = data.get("PAGE_INFO")
+    if page_info:
+        lines += [f"Page {page_info.get('PAGE')} of {page_info.get('PAGES')} "
+                  f"({page_info.get('TOTAL_ENTITIES')} entities in all, cursor {page_info.get('CURSOR')}). "
+                  f"Entities by degree: {page_info.get('ENTITIES_BY_DEGREE')}", ""]
+    lines += _table(("Entity ID", "Name", "Sources"), [
+        (entity.get("ENTITY_ID"), entity.get("ENTITY_NAME", ""), _sources(entity)) for entity in entities
+    ])
+    if match_keys:
+        lines += ["", "Links by match key:", ""]
+        lines += _table(("Match Key", "Links"), sorted(match_keys.items(), key=lambda item: -item[1]))
+    return "\n".join(lines)
+
+
+def _feature_rows(feature_scores: dict) -> list:
+    return [
+        (feature_type, score.get("INBOUND_FEAT_DESC", ""), score.get("CANDIDATE_FEAT_DESC", ""),
+         _feature_score(score) if _feature_score(score) is not None else "", score.get("SCORE_BUCKET", ""))
+        for feature_type, scores in feature_scores.items()
+        for score in scores
+    ]
+
+
+def _marks(match_key: str) -> str:
+    confirming, denying = match_key_features(match_key)
+    marks = [f"✅ {feature}" for feature in confirming] + [f"❌ {feature}" for feature in denying]
+    return ", ".join(marks) or "no matching features"
+
+
+def summarize_why(data: dict) -> str:
+    names = _names(data)
+    sources = {entity.get("ENTITY_ID"): _sources(entity) for entity in map(_resolved, data.get("ENTITIES", []))}
+    lines = []
+    for why in data.get("WHY_RESULTS", []):
+        entity_1, entity_2 = why.get("ENTITY_ID"), why.get("ENTITY_ID_2")
+        match_info = why.get("MATCH_INFO", {})
+        lines += [
+            f"## Why {entity_1} ({names.get(entity_1, '')}) and {entity_2} ({names.get(entity_2, '')})",
+            "",
+            f"Result: {match_info.get('MATCH_LEVEL_CODE') or 'not related'}",
+            f"Features: {_marks(match_info.get('WHY_KEY', ''))}",
+            f"Sources: {entity_1}: {sources.get(entity_1, '')}; {entity_2}: {sources.get(entity_2, '')}",
+        ]
+        rows = _feature_rows(match_info.get("FEATURE_SCORES", {}))
+        if rows:
+            lines += [""] + _table(("Feature", f"Entity {entity_1}", f"Entity {entity_2}", "Score", "Bucket"), rows)
+        lines.append("")
+    return "\n".join(lines).rstrip() or "## No WHY results"
+
+
+def _members(virtual_entity: dict) -> tuple[str, int]:
+    """Group notation for a virtual entity, e.g. ("CUSTOMERS:1002 +3 more", 4)."""
+    records = [
+        f"{record.get('DATA_SOURCE')}:{record.get('RECORD_ID')}"
+        for member in virtual_entity.get("MEMBER_RECORDS", [])
+        for record in member.get("RECORDS", [])
+    ]
+    if not records:
+        return virtual_entity.get("VIRTUAL_ENTITY_ID", "?"), 1
+    more = f" +{len(records) - 1} more" if len(records) > 1 else ""
+    return records[0] + more, len(records)
+
+
+def summarize_how(data: dict) -> str:
+    how = data.get("HOW_RESULTS", {})
+    steps = how.get("RESOLUTION_STEPS", [])
+    final = how.get("FINAL_STATE", {}).get("VIRTUAL_ENTITIES", [])
+    lines = [f"## How resolved: {len(steps)} steps, {len(final)} final entities", ""]
+    for step in steps[:MAX_ROWS]:
+        name_1, size_1 = _members(step.get("VIRTUAL_ENTITY_1", {}))
+        name_2, size_2 = _members(step.get("VIRTUAL_ENTITY_2", {}))
+        # Single records merge "with" each other, or "into" a group
+        if size_1 > 1 and size_2 == 1:
+            name_1, name_2, size_1, size_2 = name_2, name_1, size_2, size_1
+        verb = "into" if size_2 > 1 else "with"
+        match_info = step.get("MATCH_INFO", {})
+        line = f"{step.get('STEP')}. {name_1} {verb} {name_2}: {_marks(match_info.get('MATCH_KEY', ''))}"
+        scores = [f"{row[0]} {row[3]}" for row in _feature_rows(match_info.get("FEATURE_SCORES", {})) if row[3] != ""]
+        lines.append(line + (f" ({', '.join(scores)})" if scores else ""))
+    if len(steps) > MAX_ROWS:
+        lines.append(f"... and {len(steps) - MAX_ROWS} more steps")
+    return "\n".join(lines)
+
+
+# Summarizer per tool
+SUMMARIZERS: dict[str, Callable[[dict], str]] = {
+    "search_entities": summarize_search,
+    "get_entity": summarize_entity,
+    "get_entities": summarize_entities,
+    "get_source_record": summarize_entity,
+    "get_source_records": summarize_records,
+    "find_path": summarize_path,
+    "expand_network": summarize_network,
+    "get_network_page": summarize_network,
+    "explain_why_related": summarize_why,
+    "explain_how_resolved": summarize_how,
+}
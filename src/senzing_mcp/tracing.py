@@ -0,0 +1,188 @@
+"""Per-tool-call tracing with a pluggable exporter.
+
+Each call_tool invocation runs inside a Trace held in a context variable, so
+code anywhere below it (SDK wrapper, JSON helpers, result formatting) can
+record timed spans without passing the trace around. Spans are grouped into
+stages:
+
+- queue_wait: waiting for a bulkhead slot and an executor thread
+- sdk: the engine call itself
+- parse: JSON parsing (jsonutil.loads)
+- serialize: JSON serialization (jsonutil.dumps)
+- format: building the tool response in format_result
+
+The default exporter is a no-op and no Trace is created, so recording costs
+one context variable lookup per span. FileExporter appends one JSON line per
+call to a local file; traces are queued and serialized and written by a
+background thread, so exporting never blocks the event loop on file I/O.
+"""
+
+import contextvars
+import itertools
+import json
+import logging
+import queue
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueListener
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Trace:
+    """Spans recorded during one tool call."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, tool: str):
+        self.trace_id = next(self._ids)
+        self.tool = tool
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.duration = 0.0
+        self.outcome = "ok"
+        self.spans: list[tuple[str, float, float, dict]] = []
+
+    def add(self, stage: str, start: float, duration: float, **attrs):
+        """Record a span; start is a time.perf_counter() value."""
+        self.spans.append((stage, start - self._start, duration, attrs))
+
+    def finish(self, outcome: str = "ok"):
+        self.duration = time.perf_counter() - self._start
+        self.outcome = outcome
+
+    def stage_totals(self) -> dict[str, float]:
+        """Return total seconds per stage (nested stages are counted in each)."""
+        totals: dict[str, float] = {}
+        for stage, _, duration, _ in self.spans:
+            totals[stage] = totals.get(stage, 0.0) + duration
+        return totals
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "tool": self.tool,
+            "timestamp": self.started_at,
+            "duration_ms": round(self.duration * 1000, 3),
+            "outcome": self.outcome,
+            "stages_ms": {stage: round(total * 1000, 3) for stage, total in self.stage_totals().items()},
+            "spans": [
+                {"stage": stage, "offset_ms": round(offset * 1000, 3), "duration_ms": round(duration * 1000, 3), **attrs}
+                for stage, offset, duration, attrs in self.spans
+            ],
+        }
+
+
+class NoopExporter:
+    """Default exporter: tracing disabled."""
+
+    enabled = False
+
+    def export(self, trace: Trace):
+        pass
+
+    def close(self):
+        pass
+
+
+class _TraceFormatter(logging.Formatter):
+    """Serialize the Trace carried as a record's message to one JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(record.msg.to_dict(), separators=(",", ":"))
+
+
+class FileExporter:
+    """Append each finished trace to a file as one JSON line."""
+
+    enabled = True
+
+    def __init__(self, path: str):
+        self.path = path
+        handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(_TraceFormatter())
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener: Optional[QueueListener] = QueueListener(self._queue, handler)
+        self._listener.start()
+
+    def export(self, trace: Trace):
+        self._queue.put_nowait(logging.makeLogRecord({"msg": trace}))
+
+    def close(self):
+        """Flush queued traces and stop the background writer."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+
+
+_current: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("senzing_mcp_trace", default=None)
+_exporter = NoopExporter()
+
+
+def set_exporter(exporter) -> None:
+    """Install the exporter for finished traces, closing the previous one."""
+    global _exporter
+    _exporter.close()
+    _exporter = exporter
+
+
+def get_exporter():
+    return _exporter
+
+
+def current() -> Optional[Trace]:
+    """Return the trace for the running tool call, or None if not tracing."""
+    return _current.get()
+
+
+@contextmanager
+def trace_call(tool: str, force: bool = False) -> Iterator[Optional[Trace]]:
+    """Trace one tool call and export it when done.
+
+    No trace is created unless an exporter is enabled or force is set (for
+    callers that need the timings themselves, such as the slow-call log).
+    """
+    if not (_exporter.enabled or force):
+        yield None
+        return
+    trace = Trace(tool)
+    token = _current.set(trace)
+    try:
+        yield trace
+    except BaseException:
+        trace.finish("error")
+        raise
+    else:
+        if trace.duration == 0.0:
+            trace.finish(trace.outcome)
+    finally:
+        _current.reset(token)
+        try:
+            _exporter.export(trace)
+        except Exception as e:
+            logger.warning(f"Failed to export trace: {e}")
+
+
+@contextmanager
+def span(stage: str, **attrs) -> Iterator[None]:
+    """Time the enclosed block as a span of the current trace, if any."""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(stage, start, time.perf_counter() - start, **attrs)
+
+
+def record(stage: str, start: float, duration: float, **attrs):
+    """Record a span measured elsewhere (e.g. in an executor thread)."""
+    trace = _current.get()
+    if trace is not None:
+        trace.add(stage, start, duration, **attrs)
@@ -0,0 +1,277 @@
+"""Pool of worker processes that each own a Senzing engine.
+
+Each worker process builds its own factory/engine and serves calls sent over
+a multiprocessing Pipe, so engine work and the JSON handling around it are
+spread across cores instead of sharing one interpreter's GIL. The parent
+routes each call to the worker with the fewest calls in flight and restarts
+workers that die.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised for calls that were in flight on a worker process that died."""
+
+
+def build_senzing_engine(instance_name: str, settings: str, verbose_logging: int):
+    """Build a Senzing factory and engine inside a worker process."""
+    from senzing_core import SzAbstractFactoryCore
+
+    factory = SzAbstractFactoryCore(
+        instance_name=instance_name,
+        settings=settings,
+        verbose_logging=verbose_logging
+    )
+    return factory, factory.create_engine()
+
+
+def _picklable_error(error: Exception) -> Exception:
+    """Return error, or a RuntimeError carrying its message if it cannot be pickled."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _worker_main(conn, engine_builder: Callable, builder_args: tuple):
+    """Worker process loop: build the engine, then serve (call_id, method, args, kwargs) requests."""
+    try:
+        factory, engine = engine_builder(*builder_args)
+    except Exception as e:
+        conn.send(("init_error", _picklable_error(e)))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        call_id, method, args, kwargs = message
+        try:
+            reply = (call_id, True, getattr(engine, method)(*args, **kwargs))
+        except Exception as e:
+            reply = (call_id, False, _picklable_error(e))
+        conn.send(reply)
+
+    if factory is not None:
+        factory.destroy()
+
+
+class _Worker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.pending: dict[int, Future] = {}
+        self.restarts = 0
+        self.alive = False
+        self.lock = threading.Lock()
+
+
+class RemoteMethod:
+    """Callable standing in for an engine method that runs in a worker process.
+
+    Compares equal for the same pool and method so calls can be coalesced,
+    and exposes __name__ so bulkheads classify it like the real method.
+    """
+
+    def __init__(self, pool: "EngineWorkerPool", name: str):
+        self._pool = pool
+        self.__name__ = name
+
+    def submit(self, *args, **kwargs) -> Future:
+        """Dispatch the call and return a future for its result."""
+        return self._pool.submit(self.__name__, *args, **kwargs)
+
+    def __call__(self, *args, **kwargs):
+        return self.submit(*args, **kwargs).result()
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, RemoteMethod)
+            and other._pool is self._pool
+            and other.__name__ == self.__name__
+        )
+
+    def __hash__(self):
+        return hash((id(self._pool), self.__name__))
+
+
+class _EngineProxy:
+    """Engine-shaped object whose methods run in the pool's workers."""
+
+    def __init__(self, pool: "EngineWorkerPool"):
+        self._pool = pool
+
+    def __getattr__(self, name: str) -> RemoteMethod:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return RemoteMethod(self._pool, name)
+
+
+class EngineWorkerPool:
+    """Fixed-size pool of engine worker processes with load-aware routing."""
+
+    def __init__(self, size: int, engine_builder: Callable = build_senzing_engine, builder_args: tuple = ()):
+        if size < 1:
+            raise ValueError("Engine worker pool size must be at least 1")
+        self.size = size
+        self.engine_builder = engine_builder
+        self.builder_args = builder_args
+        self.engine = _EngineProxy(self)
+        self._workers = [_Worker(index) for index in range(size)]
+        self._call_ids = itertools.count()
+        self._next = itertools.count()
+        self._closing = False
+        self._context = multiprocessing.get_context("spawn")
+
+    def start(self):
+        """Start every worker and wait until each has built its engine."""
+        for worker in self._workers:
+            self._start_worker(worker)
+        logger.info(f"Started {self.size} Senzing engine worker processes")
+
+    @staticmethod
+    def is_remote(func) -> bool:
+        """Return whether func is an engine method that runs in a worker process."""
+        return isinstance(func, RemoteMethod)
+
+    def _start_worker(self, worker: _Worker):
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.engine_builder, self.builder_args),
+            name=f"senzing-engine-{worker.index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            status, error = parent_conn.recv()
+        except EOFError:
+            status, error = "init_error", RuntimeError("worker exited during startup")
+        if status != "ready":
+            process.join(timeout=5)
+            raise RuntimeError(f"Engine worker {worker.index} failed to initialize: {error}")
+
+        worker.process = process
+        worker.conn = parent_conn
+        worker.alive = True
+        threading.Thread(
+            target=self._read_replies, args=(worker, parent_conn),
+            name=f"senzing-engine-{worker.index}-reader", daemon=True,
+        ).start()
+
+    def _read_replies(self, worker: _Worker, conn):
+        """Resolve futures from one worker's replies; restart it if it dies."""
+        while True:
+            try:
+                call_id, ok, value = conn.recv()
+            except (EOFError, OSError):
+                break
+            with worker.lock:
+                future = worker.pending.pop(call_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+        with worker.lock:
+            worker.alive = False
+            pending, worker.pending = worker.pending, {}
+        for future in pending.values():
+            future.set_exception(WorkerCrashedError(
+                f"Senzing engine worker {worker.index} exited while handling the call"
+            ))
+        if self._closing:
+            return
+
+        worker.process.join(timeout=1)
+        logger.error(
+            f"Senzing engine worker {worker.index} exited "
+            f"(exit code {worker.process.exitcode if worker.process else None}); restarting"
+        )
+        worker.restarts += 1
+        try:
+            self._start_worker(worker)
+        except Exception as e:
+            logger.error(f"Failed to restart Senzing engine worker {worker.index}: {e}")
+
+    def _pick_worker(self) -> _Worker:
+        """Return the live worker with the fewest calls in flight."""
+        offset = next(self._next)
+        candidates = [
+            self._workers[(offset + i) % self.size] for i in range(self.size)
+        ]
+        live = [worker for worker in candidates if worker.alive]
+        if not live:
+            raise WorkerCrashedError("No Senzing engine workers are running")
+        return min(live, key=lambda worker: len(worker.pending))
+
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """Send an engine call to the least loaded worker."""
+        if self._closing:
+            raise RuntimeError("Engine worker pool is closed")
+        future: Future = Future()
+        call_id = next(self._call_ids)
+        worker = self._pick_worker()
+        with worker.lock:
+            worker.pending[call_id] = future
+            try:
+                worker.conn.send((call_id, method, args, kwargs))
+            except (OSError, ValueError) as e:
+                worker.pending.pop(call_id, None)
+                future.set_exception(WorkerCrashedError(f"Could not reach engine worker {worker.index}: {e}"))
+        return future
+
+    def stats(self) -> list[dict]:
+        """Return pid, in-flight calls and restart count per worker."""
+        return [
+            {
+                "worker": worker.index,
+                "pid": worker.process.pid if worker.process else None,
+                "alive": worker.alive,
+                "pending": len(worker.pending),
+                "restarts": worker.restarts,
+            }
+            for worker in self._workers
+        ]
+
+    def close(self, timeout: Optional[float] = 30):
+        """Ask workers to destroy their engines and exit, terminating stragglers."""
+        self._closing = True
+        for worker in self._workers:
+            if worker.conn is None:
+                continue
+            try:
+                with worker.lock:
+                    worker.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+            worker.alive = False
+
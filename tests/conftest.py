@@ -0,0 +1,51 @@
+"""Shared test setup: a mocked Senzing SDK and fixtures for the SDK wrapper.
+
+The senzing modules are mocked here, before any test module imports
+senzing_mcp, so no test needs the SDK installed.
+"""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+# Mock the senzing imports before importing our module
+sys.modules.setdefault('senzing', MagicMock())
+sys.modules.setdefault('senzing_core', MagicMock())
+
+from senzing_mcp.sdk_wrapper import SenzingSDKWrapper
+
+
+class MockSzError(Exception):
+    """Mock Senzing error."""
+    pass
+
+
+class MockSzNotFoundError(Exception):
+    """Mock Senzing not found error."""
+    pass
+
+
+@pytest.fixture
+def wrapper():
+    """Create a wrapper instance with mocked internals."""
+    w = SenzingSDKWrapper()
+    w._initialized = True
+    w.engine = MagicMock()
+    w.factory = MagicMock()
+    return w
+
+
+class SzErrors:
+    """The mock error classes, as the SDK names them."""
+    SzError = MockSzError
+    SzNotFoundError = MockSzNotFoundError
+
+
+@pytest.fixture
+def sz_errors():
+    """Patch the wrapper's Senzing error classes with the mocks and return them."""
+    with patch('senzing_mcp.sdk_wrapper.SzError', MockSzError):
+        with patch('senzing_mcp.sdk_wrapper.SzNotFoundError', MockSzNotFoundError):
+            yield SzErrors
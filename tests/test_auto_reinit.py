@@ -2,53 +2,13 @@
 
 import asyncio
 import json
-import sys
-from unittest.mock import MagicMock, AsyncMock, patch
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 
-# Mock the senzing imports before importing our module
-sys.modules['senzing'] = MagicMock()
-sys.modules['senzing_core'] = MagicMock()
-
-# Now we can import our module
-from senzing_mcp.sdk_wrapper import SenzingSDKWrapper, STALE_CONFIG_ERROR_CODES
-
-
-class MockSzError(Exception):
-    """Mock Senzing error."""
-    pass
-
-
-class MockSzNotFoundError(Exception):
-    """Mock Senzing not found error."""
-    pass
-
-
-@pytest.fixture
-def mock_senzing():
-    """Set up mocked Senzing SDK."""
-    with patch.dict('sys.modules', {
-        'senzing': MagicMock(),
-        'senzing_core': MagicMock()
-    }):
-        # Patch the error classes
-        with patch('senzing_mcp.sdk_wrapper.SzError', MockSzError):
-            with patch('senzing_mcp.sdk_wrapper.SzNotFoundError', MockSzNotFoundError):
-                yield
-
-
-@pytest.fixture
-def wrapper():
-    """Create a wrapper instance with mocked internals."""
-    w = SenzingSDKWrapper()
-    w._initialized = True
-    w.engine = MagicMock()
-    w.factory = MagicMock()
-    return w
-
-
 class TestStaleConfigDetection:
     """Test detection of stale config errors."""
 
@@ -77,7 +37,7 @@ class TestAutoReinit:
     """Test automatic reinitialization on stale config errors."""
 
     @pytest.mark.asyncio
-    async def test_reinit_on_stale_config_get_entity(self, wrapper):
+    async def test_reinit_on_stale_config_get_entity(self, wrapper, sz_errors):
         """Should reinitialize and retry on SENZ2062 for get_entity."""
         call_count = 0
 
@@ -85,7 +45,7 @@ class TestAutoReinit:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise MockSzError("SENZ2062|Requested lookup of [DSRC_ID] using unknown value [1001]")
+                raise sz_errors.SzError("SENZ2062|Requested lookup of [DSRC_ID] using unknown value [1001]")
             return '{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}'
 
         wrapper.engine.get_entity_by_entity_id = mock_get_entity
@@ -97,20 +57,17 @@ class TestAutoReinit:
             reinit_called = True
         wrapper.reinitialize = mock_reinit
 
-        # Patch SzError for the except block
-        with patch('senzing_mcp.sdk_wrapper.SzError', MockSzError):
-            with patch('senzing_mcp.sdk_wrapper.SzNotFoundError', MockSzNotFoundError):
-                result = await wrapper.get_entity_by_entity_id(1)
+        result = await wrapper.get_entity_by_entity_id(1)
 
         assert reinit_called, "reinitialize() should have been called"
         assert call_count == 2, "SDK should have been called twice (initial + retry)"
         assert "RESOLVED_ENTITY" in result
 
     @pytest.mark.asyncio
-    async def test_no_reinit_on_regular_error(self, wrapper):
+    async def test_no_reinit_on_regular_error(self, wrapper, sz_errors):
         """Should NOT reinitialize on non-stale errors."""
         def mock_get_entity(entity_id, flags):
-            raise MockSzError("SENZ9999|Some other error")
+            raise sz_errors.SzError("SENZ9999|Some other error")
 
         wrapper.engine.get_entity_by_entity_id = mock_get_entity
 
@@ -120,16 +77,14 @@ class TestAutoReinit:
             reinit_called = True
         wrapper.reinitialize = mock_reinit
 
-        with patch('senzing_mcp.sdk_wrapper.SzError', MockSzError):
-            with patch('senzing_mcp.sdk_wrapper.SzNotFoundError', MockSzNotFoundError):
-                result = await wrapper.get_entity_by_entity_id(1)
+        result = await wrapper.get_entity_by_entity_id(1)
 
         assert not reinit_called, "reinitialize() should NOT have been called"
         result_data = json.loads(result)
         assert "error" in result_data
 
     @pytest.mark.asyncio
-    async def test_reinit_only_once(self, wrapper):
+    async def test_reinit_only_once(self, wrapper, sz_errors):
         """Should only retry once, not infinitely loop."""
         call_count = 0
 
@@ -137,7 +92,7 @@ class TestAutoReinit:
             nonlocal call_count
             call_count += 1
             # Always throw stale config error
-            raise MockSzError("SENZ2062|Stale config")
+            raise sz_errors.SzError("SENZ2062|Stale config")
 
         wrapper.engine.get_entity_by_entity_id = mock_get_entity
 
@@ -147,9 +102,7 @@ class TestAutoReinit:
             reinit_count += 1
         wrapper.reinitialize = mock_reinit
 
-        with patch('senzing_mcp.sdk_wrapper.SzError', MockSzError):
-            with patch('senzing_mcp.sdk_wrapper.SzNotFoundError', MockSzNotFoundError):
-                result = await wrapper.get_entity_by_entity_id(1)
+        result = await wrapper.get_entity_by_entity_id(1)
 
         assert reinit_count == 1, "reinitialize() should only be called once"
         assert call_count == 2, "SDK should be called exactly twice"
@@ -157,7 +110,7 @@ class TestAutoReinit:
         assert "error" in result_data
 
     @pytest.mark.asyncio
-    async def test_reinit_on_stale_config_search(self, wrapper):
+    async def test_reinit_on_stale_config_search(self, wrapper, sz_errors):
         """Should reinitialize and retry on SENZ2062 for search."""
         call_count = 0
 
@@ -165,7 +118,7 @@ class TestAutoReinit:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise MockSzError("SENZ2062|Stale config")
+                raise sz_errors.SzError("SENZ2062|Stale config")
             return '{"RESOLVED_ENTITIES": []}'
 
         wrapper.engine.search_by_attributes = mock_search
@@ -176,14 +129,13 @@ class TestAutoReinit:
             reinit_called = True
         wrapper.reinitialize = mock_reinit
 
-        with patch('senzing_mcp.sdk_wrapper.SzError', MockSzError):
-            result = await wrapper.search_by_attributes('{"NAME_FULL": "John"}')
+        result = await wrapper.search_by_attributes('{"NAME_FULL": "John"}')
 
         assert reinit_called
         assert call_count == 2
 
     @pytest.mark.asyncio
-    async def test_reinit_on_stale_config_why_entities(self, wrapper):
+    async def test_reinit_on_stale_config_why_entities(self, wrapper, sz_errors):
         """Should reinitialize and retry on SENZ2062 for why_entities."""
         call_count = 0
 
@@ -191,7 +143,7 @@ class TestAutoReinit:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise MockSzError("SENZ2062|Stale config")
+                raise sz_errors.SzError("SENZ2062|Stale config")
             return '{"WHY_RESULTS": []}'
 
         wrapper.engine.why_entities = mock_why
@@ -202,8 +154,7 @@ class TestAutoReinit:
             reinit_called = True
         wrapper.reinitialize = mock_reinit
 
-        with patch('senzing_mcp.sdk_wrapper.SzError', MockSzError):
-            result = await wrapper.why_entities(1, 2)
+        result = await wrapper.why_entities(1, 2)
 
         assert reinit_called
         assert call_count == 2
@@ -213,28 +164,176 @@ class TestReinitializeMethod:
     """Test the reinitialize method itself."""
 
     @pytest.mark.asyncio
-    async def test_reinitialize_cleans_up_and_reinits(self, wrapper):
-        """Should cleanup old instance and create new one."""
-        cleanup_called = False
-        init_called = False
+    async def test_reinitialize_swaps_in_new_engine(self, wrapper, monkeypatch):
+        """Should build a new engine, swap it in and destroy the old one."""
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        old_factory = wrapper.factory
+        new_factory, new_engine = MagicMock(), MagicMock()
+        wrapper._sync_initialize = MagicMock(return_value=(new_factory, new_engine, None))
 
-        def mock_cleanup():
-            nonlocal cleanup_called
-            cleanup_called = True
+        await wrapper.reinitialize()
+        await asyncio.sleep(0.05)  # retired engine is destroyed in the executor
 
-        async def mock_init():
-            nonlocal init_called
-            init_called = True
+        assert wrapper._sync_initialize.call_count == 1
+        assert wrapper.factory is new_factory
+        assert wrapper.engine is new_engine
+        assert wrapper._generation == 1
+        old_factory.destroy.assert_called_once()
+        new_factory.destroy.assert_not_called()
 
-        wrapper._sync_cleanup = mock_cleanup
-        wrapper.initialize = mock_init
+    @pytest.mark.asyncio
+    async def test_reinitialize_skipped_when_generation_advanced(self, wrapper, monkeypatch):
+        """A caller that waited on the lock while another rebuilt should not rebuild again."""
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        builds = 0
 
-        await wrapper.reinitialize()
+        def mock_build(*args):
+            nonlocal builds
+            builds += 1
+            return MagicMock(), MagicMock(), None
+        wrapper._sync_initialize = mock_build
+
+        await asyncio.gather(*(wrapper.reinitialize() for _ in range(5)))
 
-        assert cleanup_called, "Cleanup should be called"
-        assert init_called, "Initialize should be called"
-        assert wrapper.factory is None, "Factory should be cleared before reinit"
-        assert wrapper.engine is None, "Engine should be cleared before reinit"
+        assert builds == 1
+        assert wrapper._generation == 1
+
+
+class TestConcurrentReinit:
+    """Stress test: many concurrent calls hitting a stale config at once."""
+
+    @pytest.mark.asyncio
+    async def test_one_rebuild_and_old_engine_drained_before_destroy(self, wrapper, monkeypatch, sz_errors):
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        wrapper.coalesce_calls = False
+        wrapper.entity_cache.max_size = 0
+        calls = 50
+
+        old_factory = wrapper.factory
+        lock = threading.Lock()
+        in_flight_on_old = 0
+        in_flight_at_destroy = []
+        release_slow_call = threading.Event()
+        old_factory.destroy = lambda: in_flight_at_destroy.append(in_flight_on_old)
+
+        def old_get_entity(entity_id, flags):
+            nonlocal in_flight_on_old
+            with lock:
+                in_flight_on_old += 1
+            try:
+                if entity_id == 0:
+                    # A slow call still running on the old engine during the swap
+                    release_slow_call.wait(5)
+                    return '{"RESOLVED_ENTITY": {"ENTITY_ID": 0}}'
+                time.sleep(0.01)
+                raise sz_errors.SzError("SENZ2062|Stale config")
+            finally:
+                with lock:
+                    in_flight_on_old -= 1
+
+        new_calls = 0
+
+        def new_get_entity(entity_id, flags):
+            nonlocal new_calls
+            with lock:
+                new_calls += 1
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.get_entity_by_entity_id = old_get_entity
+        new_factory, new_engine = MagicMock(), MagicMock()
+        new_engine.get_entity_by_entity_id = new_get_entity
+
+        builds = 0
+
+        def mock_build(*args):
+            nonlocal builds
+            builds += 1
+            time.sleep(0.05)
+            return new_factory, new_engine, None
+        wrapper._sync_initialize = mock_build
+
+        slow = asyncio.ensure_future(wrapper.get_entity_by_entity_id(0))
+        results = await asyncio.gather(
+            *(wrapper.get_entity_by_entity_id(i) for i in range(1, calls + 1))
+        )
+
+        assert builds == 1, "engine should be rebuilt exactly once"
+        assert new_calls == calls, "every stale call should be retried on the new engine"
+        assert all(json.loads(r)["RESOLVED_ENTITY"]["ENTITY_ID"] for r in results)
+        assert in_flight_at_destroy == [], "old engine destroyed while still in use"
+
+        release_slow_call.set()
+        assert json.loads(await slow)["RESOLVED_ENTITY"]["ENTITY_ID"] == 0
+        await asyncio.sleep(0.05)
+
+        assert in_flight_at_destroy == [0], "old engine should be destroyed once, after draining"
+        assert wrapper.engine is new_engine
+        assert wrapper._generation == 1
+        assert wrapper._retired == {}
+
+
+class TestConfigMonitor:
+    """Test the background active-config monitor."""
+
+    @staticmethod
+    def set_config_ids(wrapper, default_id, active_id):
+        wrapper.factory.create_configmanager.return_value.get_default_config_id.return_value = default_id
+        wrapper.engine.get_active_config_id.return_value = active_id
+
+    @pytest.mark.asyncio
+    async def test_swaps_in_primed_engine_when_default_config_changes(self, wrapper, monkeypatch):
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        self.set_config_ids(wrapper, default_id=2, active_id=1)
+        new_factory, new_engine = MagicMock(), MagicMock()
+        new_factory.create_configmanager.return_value.get_default_config_id.return_value = 2
+        new_engine.get_active_config_id.return_value = 2
+        wrapper._sync_initialize = MagicMock(return_value=(new_factory, new_engine, None))
+
+        wrapper.start_config_monitor(interval=0.01)
+        await asyncio.sleep(0.1)
+        await wrapper.stop_config_monitor()
+
+        assert wrapper._sync_initialize.call_count == 1
+        new_engine.prime_engine.assert_called_once()
+        assert wrapper.engine is new_engine
+        assert wrapper._generation == 1
+        new_factory.create_configmanager.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_no_rebuild_while_config_unchanged(self, wrapper):
+        self.set_config_ids(wrapper, default_id=1, active_id=1)
+        wrapper._sync_initialize = MagicMock()
+
+        wrapper.start_config_monitor(interval=0.01)
+        await asyncio.sleep(0.05)
+        await wrapper.stop_config_monitor()
+
+        wrapper._sync_initialize.assert_not_called()
+        # One config manager serves every poll
+        assert wrapper.engine.get_active_config_id.call_count > 1
+        wrapper.factory.create_configmanager.assert_called_once()
+        assert wrapper._config_monitor is None
+
+    @pytest.mark.asyncio
+    async def test_failed_warmup_keeps_current_engine(self, wrapper, monkeypatch):
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        old_engine = wrapper.engine
+        self.set_config_ids(wrapper, default_id=2, active_id=1)
+        new_factory, new_engine = MagicMock(), MagicMock()
+        new_engine.prime_engine.side_effect = RuntimeError("prime failed")
+        wrapper._sync_initialize = MagicMock(return_value=(new_factory, new_engine, None))
+
+        wrapper.start_config_monitor(interval=0.01)
+        await asyncio.sleep(0.05)
+        await wrapper.stop_config_monitor()
+
+        assert wrapper.engine is old_engine
+        assert wrapper._generation == 0
+        new_factory.destroy.assert_called()
+
+    def test_disabled_by_default(self, wrapper):
+        wrapper.start_config_monitor()
+        assert wrapper._config_monitor is None
 
 
 class TestErrorFormatting:
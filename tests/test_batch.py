@@ -0,0 +1,118 @@
+"""Tests for batch lookup methods."""
+
+import json
+import threading
+import time
+
+import pytest
+
+
+class TestGetEntities:
+    """Test get_entities_by_entity_ids fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_results_keyed_by_id(self, wrapper, sz_errors):
+        def mock_get_entity(entity_id, flags):
+            if entity_id == 3:
+                raise sz_errors.SzNotFoundError("not found")
+            if entity_id == 4:
+                raise sz_errors.SzError("SENZ9999|Some other error")
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        result = await wrapper.get_entities_by_entity_ids([1, 2, 3, 4])
+        data = json.loads(result)
+
+        assert not result.is_error
+        assert list(data["ENTITIES"]) == ["1", "2", "3", "4"]
+        assert data["ENTITIES"]["1"] == {"RESOLVED_ENTITY": {"ENTITY_ID": 1}}
+        assert data["ENTITIES"]["3"] == {"error": "Entity not found", "entity_id": 3}
+        assert data["ENTITIES"]["4"] == {"error": "SENZ9999|Some other error"}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_fetched_once(self, wrapper, sz_errors):
+        fetched = []
+
+        def mock_get_entity(entity_id, flags):
+            fetched.append(entity_id)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.entity_cache.max_size = 0
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        result = await wrapper.get_entities_by_entity_ids([5, 5, 6])
+
+        assert sorted(fetched) == [5, 6]
+        assert list(json.loads(result)["ENTITIES"]) == ["5", "6"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped(self, wrapper, sz_errors):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def mock_get_entity(entity_id, flags):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        await wrapper.get_entities_by_entity_ids(list(range(1, 11)), max_concurrency=3)
+
+        assert 1 < peak <= 3
+
+
+class TestGetSourceRecords:
+    """Test get_entities_by_record_ids record collapsing."""
+
+    @pytest.mark.asyncio
+    async def test_records_in_same_entity_fetched_once(self, wrapper, sz_errors):
+        record_entities = {"1001": 1, "1002": 1, "1003": 2}
+        fetched = []
+
+        def mock_get_by_record(data_source, record_id, flags):
+            if record_id not in record_entities:
+                raise sz_errors.SzNotFoundError("not found")
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % record_entities[record_id]
+
+        def mock_get_entity(entity_id, flags):
+            fetched.append(entity_id)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d, "RECORDS": []}}' % entity_id
+
+        wrapper.engine.get_entity_by_record_id = mock_get_by_record
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        result = await wrapper.get_entities_by_record_ids([
+            ("CUSTOMERS", "1001"),
+            ("CUSTOMERS", "1002"),
+            ("CUSTOMERS", "1003"),
+            ("CUSTOMERS", "9999"),
+        ])
+        data = json.loads(result)
+
+        assert sorted(fetched) == [1, 2]
+        assert data["RECORDS"]["CUSTOMERS:1001"] == 1
+        assert data["RECORDS"]["CUSTOMERS:1002"] == 1
+        assert data["RECORDS"]["CUSTOMERS:1003"] == 2
+        assert data["RECORDS"]["CUSTOMERS:9999"]["error"] == "Record not found"
+        assert list(data["ENTITIES"]) == ["1", "2"]
+        assert data["ENTITIES"]["1"]["RESOLVED_ENTITY"]["ENTITY_ID"] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_records_missing(self, wrapper, sz_errors):
+        def mock_get_by_record(data_source, record_id, flags):
+            raise sz_errors.SzNotFoundError("not found")
+
+        wrapper.engine.get_entity_by_record_id = mock_get_by_record
+
+        data = json.loads(await wrapper.get_entities_by_record_ids([("CUSTOMERS", "1")]))
+
+        assert data["ENTITIES"] == {}
+        assert "error" in data["RECORDS"]["CUSTOMERS:1"]
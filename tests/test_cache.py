@@ -0,0 +1,251 @@
+"""Tests for the in-process result caches."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from senzing_mcp.cache import TTLCache, canonical_search_key
+
+
+class TestTTLCache:
+    """Test the LRU + TTL cache itself."""
+
+    def test_hit_and_miss_counts(self):
+        cache = TTLCache(max_size=10, ttl=60)
+        assert cache.get("a") is None
+        cache.put("a", "value")
+        assert cache.get("a") == "value"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self):
+        cache = TTLCache(max_size=10, ttl=5)
+        with patch('senzing_mcp.cache.time.monotonic', return_value=100.0):
+            cache.put("a", 1)
+        with patch('senzing_mcp.cache.time.monotonic', return_value=104.0):
+            assert cache.get("a") == 1
+        with patch('senzing_mcp.cache.time.monotonic', return_value=106.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables_cache(self):
+        cache = TTLCache(max_size=0, ttl=60)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestEntityCache:
+    """Test caching of entity lookups in the wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_get_entity_served_from_cache(self, wrapper, sz_errors):
+        """Second lookup of the same entity should not reach the engine."""
+        call_count = 0
+
+        def mock_get_entity(entity_id, flags):
+            nonlocal call_count
+            call_count += 1
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        first = await wrapper.get_entity_by_entity_id(1)
+        second = await wrapper.get_entity_by_entity_id(1)
+        await wrapper.get_entity_by_entity_id(2)
+
+        assert first == second
+        assert call_count == 2
+        stats = wrapper.cache_stats()["entity"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, wrapper, sz_errors):
+        """Not-found results should be looked up again next time."""
+        call_count = 0
+
+        def mock_get_entity(entity_id, flags):
+            nonlocal call_count
+            call_count += 1
+            raise sz_errors.SzNotFoundError("not found")
+
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        await wrapper.get_entity_by_entity_id(99)
+        await wrapper.get_entity_by_entity_id(99)
+
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_source_record_cached(self, wrapper, sz_errors):
+        """Record lookups should be cached per data source and record ID."""
+        call_count = 0
+
+        def mock_get_by_record(data_source, record_id, flags):
+            nonlocal call_count
+            call_count += 1
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}'
+
+        wrapper.engine.get_entity_by_record_id = mock_get_by_record
+
+        await wrapper.get_entity_by_record_id("CUSTOMERS", "1001")
+        await wrapper.get_entity_by_record_id("CUSTOMERS", "1001")
+        await wrapper.get_entity_by_record_id("CUSTOMERS", "1002")
+
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reinitialize_clears_cache(self, wrapper, monkeypatch):
+        """A config change must not serve entities resolved under the old config."""
+        wrapper.entity_cache.put(("entity", 1, 0), '{"RESOLVED_ENTITY": {}}')
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        wrapper._sync_initialize = lambda *args: (MagicMock(), MagicMock(), None)
+
+        await wrapper.reinitialize()
+
+        assert len(wrapper.entity_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_result_from_before_reinitialize_not_cached(self, wrapper, monkeypatch, sz_errors):
+        """A call still running on the old engine must not refill the cleared cache."""
+        release = threading.Event()
+
+        def slow_get_entity(entity_id, flags):
+            release.wait(5)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.get_entity_by_entity_id = slow_get_entity
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        wrapper._sync_initialize = lambda *args: (MagicMock(), MagicMock(), None)
+
+        call = asyncio.ensure_future(wrapper.get_entity_by_entity_id(1))
+        await asyncio.sleep(0.05)
+        await wrapper.reinitialize()
+        release.set()
+        result = await call
+
+        assert not result.is_error
+        assert len(wrapper.entity_cache) == 0
+
+
+class TestCanonicalSearchKey:
+    """Test normalization of search attributes for cache keys."""
+
+    def test_key_order_and_case_ignored(self):
+        a = canonical_search_key('{"NAME_FULL": "John Smith", "DATE_OF_BIRTH": "1980-01-01"}')
+        b = canonical_search_key('{"date_of_birth": "1980-01-01", "name_full": "  JOHN   smith "}')
+        assert a == b
+
+    def test_phone_digits_only(self):
+        a = canonical_search_key('{"PHONE_NUMBER": "(555) 123-4567"}')
+        b = canonical_search_key('{"PHONE_NUMBER": "555.123.4567"}')
+        assert a == b
+        assert canonical_search_key('{"WORK_PHONE_NUMBER": "+1 555 123 4567"}') == \
+            canonical_search_key('{"WORK_PHONE_NUMBER": "15551234567"}')
+
+    def test_phone_letters_and_other_phone_keys_kept(self):
+        assert canonical_search_key('{"PHONE_NUMBER": "1-800-FLOWERS"}') != \
+            canonical_search_key('{"PHONE_NUMBER": "1-800-CONTACTS"}')
+        assert canonical_search_key('{"PHONE_TYPE": "HOME"}') != canonical_search_key('{"PHONE_TYPE": "MOBILE"}')
+
+    def test_email_lowercased(self):
+        a = canonical_search_key('{"EMAIL_ADDRESS": " John.Smith@Example.COM"}')
+        b = canonical_search_key('{"EMAIL_ADDRESS": "john.smith@example.com"}')
+        assert a == b
+
+    def test_different_values_differ(self):
+        a = canonical_search_key('{"NAME_FULL": "John Smith"}')
+        b = canonical_search_key('{"NAME_FULL": "Jon Smith"}')
+        assert a != b
+
+    def test_invalid_json_passed_through(self):
+        assert canonical_search_key("not json") == "not json"
+
+
+class TestSearchCache:
+    """Test caching of search results in the wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_near_identical_searches_share_result(self, wrapper, sz_errors):
+        """Reissued searches differing only in formatting should hit the cache."""
+        call_count = 0
+
+        def mock_search(attrs, flags):
+            nonlocal call_count
+            call_count += 1
+            return '{"RESOLVED_ENTITIES": []}'
+
+        wrapper.engine.search_by_attributes = mock_search
+
+        await wrapper.search_by_attributes('{"NAME_FULL": "John Smith", "PHONE_NUMBER": "555-1234"}')
+        await wrapper.search_by_attributes('{"PHONE_NUMBER": "5551234", "NAME_FULL": "john smith"}')
+
+        assert call_count == 1
+        assert wrapper.cache_stats()["search"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_errors_not_cached(self, wrapper, sz_errors):
+        """Failed searches should be retried against the engine."""
+        call_count = 0
+
+        def mock_search(attrs, flags):
+            nonlocal call_count
+            call_count += 1
+            raise sz_errors.SzError("SENZ9999|Some other error")
+
+        wrapper.engine.search_by_attributes = mock_search
+
+        await wrapper.search_by_attributes('{"NAME_FULL": "John Smith"}')
+        await wrapper.search_by_attributes('{"NAME_FULL": "John Smith"}')
+
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reinitialize_clears_search_cache(self, wrapper, monkeypatch):
+        """Config changes must invalidate cached searches."""
+        wrapper.search_cache.put(("{}", 0), '{"RESOLVED_ENTITIES": []}')
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        wrapper._sync_initialize = lambda *args: (MagicMock(), MagicMock(), None)
+
+        await wrapper.reinitialize()
+
+        assert len(wrapper.search_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_search_from_before_reinitialize_not_cached(self, wrapper, monkeypatch, sz_errors):
+        """A search still running on the old engine must not refill the cleared cache."""
+        release = threading.Event()
+
+        def slow_search(attributes, flags):
+            release.wait(5)
+            return '{"RESOLVED_ENTITIES": []}'
+
+        wrapper.engine.search_by_attributes = slow_search
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        wrapper._sync_initialize = lambda *args: (MagicMock(), MagicMock(), None)
+
+        call = asyncio.ensure_future(wrapper.search_by_attributes('{"NAME_FULL": "Ann"}'))
+        await asyncio.sleep(0.05)
+        await wrapper.reinitialize()
+        release.set()
+        result = await call
+
+        assert not result.is_error
+        assert len(wrapper.search_cache) == 0
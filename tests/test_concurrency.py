@@ -0,0 +1,236 @@
+"""Tests for call coalescing and concurrency limits."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from senzing_mcp.concurrency import SingleFlight
+from senzing_mcp.sdk_wrapper import SenzingSDKWrapper
+
+
+@pytest.fixture
+def wrapper(wrapper):
+    """The shared wrapper with caching disabled."""
+    wrapper.entity_cache.max_size = 0
+    return wrapper
+
+
+class TestSingleFlight:
+    """Test the SingleFlight helper directly."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        starts = 0
+
+        async def work():
+            nonlocal starts
+            starts += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*(flight.run("key", work) for _ in range(5)))
+
+        assert results == ["done"] * 5
+        assert starts == 1
+        assert flight.coalesced == 4
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self):
+        flight = SingleFlight()
+        starts = 0
+
+        async def work():
+            nonlocal starts
+            starts += 1
+            return starts
+
+        assert await flight.run("key", work) == 1
+        assert await flight.run("key", work) == 2
+        assert flight.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.run("key", work))
+        second = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_errors_shared(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.run("key", work), flight.run("key", work), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+class TestWrapperCoalescing:
+    """Identical in-flight SDK calls share one executor job."""
+
+    @pytest.mark.asyncio
+    async def test_identical_why_calls_coalesced(self, wrapper, sz_errors):
+        calls = 0
+        lock = threading.Lock()
+
+        def mock_why(id1, id2, flags):
+            nonlocal calls
+            with lock:
+                calls += 1
+            time.sleep(0.05)
+            return '{"WHY_RESULTS": []}'
+
+        wrapper.engine.why_entities = mock_why
+
+        results = await asyncio.gather(*(wrapper.why_entities(1, 2) for _ in range(4)))
+
+        assert calls == 1
+        assert wrapper.coalesced_calls == 3
+        assert all(r == '{"WHY_RESULTS": []}' for r in results)
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_not_coalesced(self, wrapper, sz_errors):
+        calls = 0
+        lock = threading.Lock()
+
+        def mock_get_entity(entity_id, flags):
+            nonlocal calls
+            with lock:
+                calls += 1
+            time.sleep(0.02)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        await asyncio.gather(wrapper.get_entity_by_entity_id(1), wrapper.get_entity_by_entity_id(2))
+
+        assert calls == 2
+        assert wrapper.coalesced_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self, wrapper, sz_errors):
+        calls = 0
+        lock = threading.Lock()
+
+        def mock_why(id1, id2, flags):
+            nonlocal calls
+            with lock:
+                calls += 1
+            time.sleep(0.02)
+            return '{"WHY_RESULTS": []}'
+
+        wrapper.coalesce_calls = False
+        wrapper.engine.why_entities = mock_why
+
+        await asyncio.gather(wrapper.why_entities(1, 2), wrapper.why_entities(1, 2))
+
+        assert calls == 2
+
+
+class TestBulkheads:
+    """Per-operation-class concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_tracks_active_and_waiting(self):
+        from senzing_mcp.concurrency import Bulkhead
+
+        bulkhead = Bulkhead("network", 1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with bulkhead:
+                await release.wait()
+
+        tasks = [asyncio.ensure_future(hold()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert bulkhead.stats() == {"limit": 1, "active": 1, "waiting": 2}
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert bulkhead.stats() == {"limit": 1, "active": 0, "waiting": 0}
+
+    @pytest.mark.asyncio
+    async def test_heavy_calls_do_not_starve_lookups(self, wrapper, sz_errors):
+        """Network calls beyond their bulkhead queue up while lookups still run."""
+        wrapper.configure_concurrency(max_workers=4, bulkhead_limits={"network": 2})
+        release = threading.Event()
+
+        def find_network_by_entity_id(entity_list, max_degrees, build_out, max_entities, flags):
+            release.wait(5)
+            return '{"ENTITIES": []}'
+
+        def get_entity_by_entity_id(entity_id, flags):
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.find_network_by_entity_id = find_network_by_entity_id
+        wrapper.engine.get_entity_by_entity_id = get_entity_by_entity_id
+
+        networks = [
+            asyncio.ensure_future(wrapper.find_network_by_entity_id(f'{{"ENTITIES": [{{"ENTITY_ID": {i}}}]}}', 3, 1, 100))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0.05)
+
+        stats = wrapper.concurrency_stats()
+        assert stats["bulkheads"]["network"]["active"] == 2
+        assert stats["bulkheads"]["network"]["waiting"] == 3
+        assert stats["executor"]["active"] == 2
+
+        result = await asyncio.wait_for(wrapper.get_entity_by_entity_id(7), timeout=1)
+        assert "RESOLVED_ENTITY" in result
+
+        release.set()
+        await asyncio.gather(*networks)
+        assert wrapper.concurrency_stats()["executor"]["active"] == 0
+        wrapper.executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_executor_queue_counted(self, wrapper):
+        wrapper.configure_concurrency(max_workers=1, bulkhead_limits={"lookup": 0})
+        release = threading.Event()
+
+        def get_entity_by_entity_id(entity_id, flags):
+            release.wait(5)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+        wrapper.engine.get_entity_by_entity_id = get_entity_by_entity_id
+        calls = [asyncio.ensure_future(wrapper.get_entity_by_entity_id(i)) for i in (1, 2)]
+        await asyncio.sleep(0.05)
+        assert wrapper.concurrency_stats()["executor"] == {"max_workers": 1, "active": 2, "queued": 1}
+
+        release.set()
+        await asyncio.gather(*calls)
+        assert wrapper.concurrency_stats()["executor"] == {"max_workers": 1, "active": 0, "queued": 0}
+
+    def test_configure_from_environment(self, monkeypatch):
+        monkeypatch.setenv("SENZING_MCP_MAX_WORKERS", "6")
+        monkeypatch.setenv("SENZING_MCP_BULKHEAD_EXPLAIN", "1")
+
+        w = SenzingSDKWrapper()
+        stats = w.concurrency_stats()
+
+        assert stats["executor"]["max_workers"] == 6
+        assert stats["bulkheads"]["explain"]["limit"] == 1
+        assert stats["bulkheads"]["lookup"]["limit"] == 0
@@ -0,0 +1,139 @@
+"""Tests for the Unix socket daemon transport and the STDIO shim."""
+
+import asyncio
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCMessage, JSONRPCResponse
+
+from senzing_mcp.daemon import claim_socket_path, serve_unix_socket
+from senzing_mcp import shim
+from senzing_mcp.shim import UnsafeSocketError, connect, make_socket_dir, pump
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes; tmp_path can be longer
+    directory = tempfile.mkdtemp(prefix="senzing-mcp-test-", dir="/tmp")
+    yield os.path.join(directory, "senzing-mcp.sock")
+    shutil.rmtree(directory)
+
+
+async def echo_session(read_stream, write_stream):
+    """Answer each request with its method name (stands in for Server.run)."""
+    async for message in read_stream:
+        request = message.message.root
+        response = JSONRPCResponse(jsonrpc="2.0", id=request.id, result={"method": request.method})
+        await write_stream.send(SessionMessage(JSONRPCMessage(response)))
+
+
+class TestServeUnixSocket:
+    """Each connection is an independent line-framed session."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_one_listener(self, socket_path):
+        server = asyncio.create_task(serve_unix_socket(socket_path, echo_session))
+        try:
+            for _ in range(50):
+                if os.path.exists(socket_path):
+                    break
+                await asyncio.sleep(0.01)
+            assert os.stat(socket_path).st_mode & 0o077 == 0
+
+            async def request(method):
+                reader, writer = await asyncio.open_unix_connection(socket_path)
+                writer.write(json.dumps({"jsonrpc": "2.0", "id": 1, "method": method}).encode() + b"\n")
+                await writer.drain()
+                line = await reader.readline()
+                writer.close()
+                return json.loads(line)["result"]["method"]
+
+            assert await asyncio.gather(request("ping"), request("tools/list")) == ["ping", "tools/list"]
+        finally:
+            server.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await server
+        assert not os.path.exists(socket_path)
+
+    def test_stale_socket_removed(self, socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(socket_path)  # bound but not listening: a dead daemon's leftover
+        claim_socket_path(socket_path)
+        assert not os.path.exists(socket_path)
+
+    def test_live_socket_not_claimed(self, socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(socket_path)
+            sock.listen()
+            with pytest.raises(RuntimeError, match="already listening"):
+                claim_socket_path(socket_path)
+
+
+class TestSocketOwnership:
+    """The shim only talks to a socket in a directory no other user controls."""
+
+    def test_default_path_is_in_a_private_directory(self, monkeypatch):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        assert shim.default_socket_path() == f"/tmp/senzing-mcp-{os.getuid()}/senzing-mcp.sock"
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+        assert shim.default_socket_path() == "/run/user/1000/senzing-mcp.sock"
+
+    def test_make_socket_dir_is_owner_only(self, socket_path):
+        path = os.path.join(os.path.dirname(socket_path), "sub", "senzing-mcp.sock")
+        make_socket_dir(path)
+        assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+
+    def test_connect_checks_owner(self, socket_path, monkeypatch):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(socket_path)
+            sock.listen()
+            connect(socket_path).close()
+
+            monkeypatch.setattr(os, "getuid", lambda: os.stat(socket_path).st_uid + 1)
+            with pytest.raises(UnsafeSocketError, match="owned by uid"):
+                connect(socket_path)
+
+    def test_shared_directory_refused(self, socket_path):
+        os.chmod(os.path.dirname(socket_path), 0o777)
+        with pytest.raises(UnsafeSocketError, match="writable by other users"):
+            connect(socket_path)
+        with pytest.raises(UnsafeSocketError):
+            make_socket_dir(socket_path)
+
+
+class TestShimPump:
+    """The shim copies bytes both ways and half-closes on end of input."""
+
+    def test_round_trip(self):
+        shim_side, daemon_side = socket.socketpair()
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+
+        def daemon():
+            with daemon_side:
+                received = b""
+                while chunk := daemon_side.recv(1024):
+                    received += chunk
+                daemon_side.sendall(received.upper())
+
+        thread = threading.Thread(target=daemon)
+        thread.start()
+        os.write(stdin_write, b'{"jsonrpc": "2.0"}\n')
+        os.close(stdin_write)
+
+        with shim_side:
+            pump(shim_side, stdin_read, stdout_write)
+        thread.join()
+        os.close(stdout_write)
+        assert os.read(stdout_read, 1024) == b'{"JSONRPC": "2.0"}\n'
+        os.close(stdin_read)
+        os.close(stdout_read)
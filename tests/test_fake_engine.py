@@ -0,0 +1,102 @@
+"""Tests for the fake engine used by the benchmarks."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from senzing_mcp.fake_engine import FakeEngine, load_spec
+from senzing_mcp.sdk_wrapper import SenzingSDKWrapper
+
+
+@pytest.fixture
+def sz_errors(sz_errors):
+    with patch('senzing_mcp.fake_engine.SzError', sz_errors.SzError), \
+            patch('senzing_mcp.fake_engine.SzNotFoundError', sz_errors.SzNotFoundError):
+        yield sz_errors
+
+
+@pytest.fixture
+def make_engine(sz_errors):
+    def make(**overrides):
+        spec = load_spec(json.dumps({"default": {}, "methods": {}, **overrides}))
+        spec["methods"] = overrides.get("methods", {})
+        return FakeEngine(spec, sz_errors.SzError, sz_errors.SzNotFoundError)
+    return make
+
+
+class TestFakeEngine:
+    """Payload shapes, sizes and injected errors."""
+
+    def test_entity_payload(self, make_engine):
+        engine = make_engine(records_per_entity=2, related_per_entity=3)
+        data = json.loads(engine.get_entity_by_entity_id(7, 0))
+
+        assert data["RESOLVED_ENTITY"]["ENTITY_ID"] == 7
+        assert len(data["RESOLVED_ENTITY"]["RECORDS"]) == 2
+        assert len(data["RELATED_ENTITIES"]) == 3
+
+    def test_payload_bytes(self, make_engine):
+        engine = make_engine(methods={"get_entity_by_entity_id": {"payload_bytes": 50000}})
+        assert len(engine.get_entity_by_entity_id(1, 0)) >= 45000
+
+    def test_search_results(self, make_engine):
+        engine = make_engine(search_results=4)
+        data = json.loads(engine.search_by_attributes('{"NAME_FULL": "Entity 1"}', 0))
+        assert len(data["RESOLVED_ENTITIES"]) == 4
+
+    def test_how_steps_accumulate_members(self, make_engine):
+        engine = make_engine(records_per_entity=4)
+        steps = json.loads(engine.how_entity_by_entity_id(1, 0))["HOW_RESULTS"]["RESOLUTION_STEPS"]
+        assert len(steps) == 3
+        assert [len(step["VIRTUAL_ENTITY_1"]["MEMBER_RECORDS"]) for step in steps] == [1, 2, 3]
+
+    def test_unknown_entity_not_found(self, sz_errors, make_engine):
+        engine = make_engine(entities=10)
+        with pytest.raises(sz_errors.SzNotFoundError):
+            engine.get_entity_by_entity_id(11, 0)
+
+    def test_find_path_validates_arguments_like_the_sdk(self, make_engine):
+        engine = make_engine()
+        # Flags passed positionally land in avoid_entity_ids
+        with pytest.raises(TypeError, match="avoid_entity_ids"):
+            engine.find_path_by_entity_id(1, 2, 3, 4096)
+        path = json.loads(engine.find_path_by_entity_id(1, 2, 3, avoid_entity_ids=[5], flags=4096))
+        assert path["ENTITY_PATHS"][0]["START_ENTITY_ID"] == 1
+
+    def test_error_injection(self, sz_errors, make_engine):
+        engine = make_engine(methods={"why_entities": {"errors": {"SENZ2062": 1.0}}})
+        with pytest.raises(sz_errors.SzError, match="SENZ2062"):
+            engine.why_entities(1, 2, 0)
+
+    def test_fixed_latency(self, monkeypatch, make_engine):
+        sleeps = []
+        monkeypatch.setattr("senzing_mcp.fake_engine.time.sleep", sleeps.append)
+        engine = make_engine(default={"latency_ms": {"dist": "fixed", "ms": 25}})
+        engine.how_entity_by_entity_id(1, 0)
+        assert sleeps == [0.025]
+
+
+class TestWrapperWithFakeEngine:
+    """SENZING_MCP_FAKE_ENGINE plugs the fake in at initialization."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_and_recover_from_injected_stale_config(self, monkeypatch, sz_errors):
+        monkeypatch.delenv("SENZING_ENGINE_CONFIGURATION_JSON", raising=False)
+        monkeypatch.setenv("SENZING_MCP_FAKE_ENGINE", json.dumps({
+            "default": {},
+            "methods": {"get_entity_by_entity_id": {"errors": {"SENZ2062": 1.0}}},
+        }))
+        wrapper = SenzingSDKWrapper()
+        wrapper.search_enrich_max = 0  # enrichment would hit the failing get_entity
+
+        await wrapper.initialize()
+        assert isinstance(wrapper.engine, FakeEngine)
+
+        result = await wrapper.get_entity_by_entity_id(1)
+        search = await wrapper.search_by_attributes('{"NAME_FULL": "Entity 1"}')
+        await wrapper.cleanup()
+
+        assert "SENZ2062" in result.error
+        assert wrapper.reinit_count == 1
+        assert not search.is_error
@@ -0,0 +1,32 @@
+"""Tests for the JSON backends: both give the same text and accept SzResult."""
+
+import importlib
+import sys
+
+import pytest
+
+from senzing_mcp import jsonutil
+from senzing_mcp.results import SzResult
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    module = importlib.reload(jsonutil)
+    assert module.BACKEND == request.param
+    yield module
+    monkeypatch.undo()
+    importlib.reload(jsonutil)
+
+
+def test_dumps_leaves_non_ascii_unescaped(backend):
+    assert backend.dumps({"ENTITY_NAME": "José Müller"}) == '{"ENTITY_NAME":"José Müller"}'
+
+
+def test_loads_accepts_str_subclass(backend):
+    assert backend.loads(SzResult('{"ENTITY_NAME": "José"}')) == {"ENTITY_NAME": "José"}
+    with pytest.raises(backend.JSONDecodeError):
+        backend.loads(SzResult("not json"))
@@ -0,0 +1,76 @@
+"""Tests for the Prometheus-style metrics."""
+
+
+import pytest
+
+from senzing_mcp.metrics import MetricsRegistry, ToolMetrics, sdk_wrapper_collector
+
+
+class TestRender:
+    """Test the text exposition format."""
+
+    def test_counter_with_labels(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls", ("tool",))
+        counter.inc("get_entity")
+        counter.inc("get_entity")
+        counter.inc('odd"name')
+
+        text = registry.render()
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{tool="get_entity"} 2' in text
+        assert 'calls_total{tool="odd\\"name"} 1' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", (0.1, 1.0), ("tool",))
+        histogram.observe(0.05, "search")
+        histogram.observe(0.5, "search")
+        histogram.observe(5, "search")
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{tool="search",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{tool="search",le="1"} 2' in lines
+        assert 'latency_seconds_bucket{tool="search",le="+Inf"} 3' in lines
+        assert 'latency_seconds_sum{tool="search"} 5.55' in lines
+        assert 'latency_seconds_count{tool="search"} 3' in lines
+
+    def test_tool_metrics(self):
+        registry = MetricsRegistry()
+        tool_metrics = ToolMetrics(registry)
+        tool_metrics.observe("get_entity", 0.02, 1500, error=False)
+        tool_metrics.observe("get_entity", 0.01, 200, error=True)
+
+        assert tool_metrics.calls.value("get_entity", "ok") == 1
+        assert tool_metrics.calls.value("get_entity", "error") == 1
+        assert tool_metrics.latency.count("get_entity") == 2
+        assert tool_metrics.response_size.count("get_entity") == 2
+
+
+class TestWrapperCollector:
+    """Test export of SDK wrapper state."""
+
+    @pytest.mark.asyncio
+    async def test_sdk_errors_counted_by_code(self, wrapper, sz_errors):
+        def mock_get_entity(entity_id, flags):
+            if entity_id == 1:
+                raise sz_errors.SzNotFoundError("SENZ0037|Unknown resolved entity value")
+            raise sz_errors.SzError("SENZ9999|Some other error")
+
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        await wrapper.get_entity_by_entity_id(1)
+        await wrapper.get_entity_by_entity_id(2)
+        await wrapper.get_entity_by_entity_id(3)
+
+        registry = MetricsRegistry()
+        registry.add_collector(sdk_wrapper_collector(wrapper))
+        text = registry.render()
+
+        assert 'senzing_mcp_sdk_errors_total{code="SENZ0037"} 1' in text
+        assert 'senzing_mcp_sdk_errors_total{code="SENZ9999"} 2' in text
+        assert "senzing_mcp_reinitializations_total 0" in text
+        assert 'senzing_mcp_bulkhead_active{class="search"} 0' in text
+        assert 'senzing_mcp_cache_misses_total{cache="entity"} 3' in text
+        assert "senzing_mcp_executor_max_workers" in text
+        assert "senzing_mcp_executor_active 0" in text
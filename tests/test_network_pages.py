@@ -0,0 +1,99 @@
+"""Tests for cursor-based paging of expand_network results."""
+
+import json
+from unittest.mock import patch
+
+from senzing_mcp.network_pages import NetworkPages
+from senzing_mcp.results import SzResult
+
+
+def network(links):
+    """A network payload with an entity for every linked ID, listed in reverse order."""
+    ids = sorted({entity_id for link in links for entity_id in link}, reverse=True)
+    return json.dumps({
+        "ENTITY_PATHS": [{"START_ENTITY_ID": 1, "END_ENTITY_ID": 1, "ENTITIES": [1]}],
+        "ENTITY_NETWORK_LINKS": [{"MIN_ENTITY_ID": a, "MAX_ENTITY_ID": b, "MATCH_KEY": "+ADDRESS"} for a, b in links],
+        "ENTITIES": [{"RESOLVED_ENTITY": {"ENTITY_ID": entity_id}} for entity_id in ids],
+    })
+
+
+# 1 -> 2, 3 (degree 1) -> 4, 5, 6 (degree 2)
+LINKS = [(1, 2), (1, 3), (2, 4), (2, 5), (3, 6)]
+
+
+def pages(page_size=2):
+    store = NetworkPages()
+    store.page_size = page_size
+    return store
+
+
+def entity_ids(result):
+    return [entity["RESOLVED_ENTITY"]["ENTITY_ID"] for entity in json.loads(result)["ENTITIES"]]
+
+
+class TestNetworkPages:
+    """Large networks are stored once and served by cursor, in degree order."""
+
+    def test_small_network_unchanged(self):
+        result = SzResult(network(LINKS))
+        assert pages(page_size=6).first_page(result, [1]) is result
+        assert pages().first_page(result, [1], page_size=0) is result
+
+    def test_small_network_not_parsed(self):
+        result = SzResult(network(LINKS))
+        with patch("senzing_mcp.network_pages.jsonutil.loads", side_effect=AssertionError("parsed")):
+            assert pages(page_size=6).first_page(result, [1]) is result
+            assert pages().first_page(result, [1], max_entities=2) is result
+
+    def test_first_page_and_cursor(self):
+        store = pages()
+        first = json.loads(store.first_page(SzResult(network(LINKS)), [1]))
+        info = first["PAGE_INFO"]
+
+        assert [e["RESOLVED_ENTITY"]["ENTITY_ID"] for e in first["ENTITIES"]] == [1, 3]
+        assert info["PAGES"] == 3 and info["NEXT_PAGE"] == 2 and info["TOTAL_ENTITIES"] == 6
+        assert info["ENTITIES_BY_DEGREE"] == {"0": 1, "1": 2, "2": 3}
+        assert first["ENTITY_PATHS"]
+        # Links touching the page's entities
+        assert {(l["MIN_ENTITY_ID"], l["MAX_ENTITY_ID"]) for l in first["ENTITY_NETWORK_LINKS"]} == {(1, 2), (1, 3), (3, 6)}
+
+        assert entity_ids(store.page(info["CURSOR"], 2)) == [2, 6]
+        last = json.loads(store.page(info["CURSOR"], 3))
+        assert last["PAGE_INFO"]["NEXT_PAGE"] is None and last["ENTITY_PATHS"] == []
+
+    def test_page_by_degree(self):
+        store = pages()
+        cursor = json.loads(store.first_page(SzResult(network(LINKS)), [1]))["PAGE_INFO"]["CURSOR"]
+
+        assert entity_ids(store.page(cursor, 1, degree=2)) == [6, 5]
+        assert entity_ids(store.page(cursor, 2, degree=2)) == [4]
+        assert store.page(cursor, 1, degree=3).error == "No entities at degree 3"
+
+    def test_errors(self):
+        store = pages()
+        cursor = json.loads(store.first_page(SzResult(network(LINKS)), [1]))["PAGE_INFO"]["CURSOR"]
+
+        assert store.page(cursor, 4).error == "Page 4 out of range (1-3)"
+        assert store.page("nope").error.startswith("Unknown or expired cursor")
+        error = SzResult.from_error("Entity not found")
+        assert store.first_page(error, [1]) is error
+
+    def test_store_is_bounded(self):
+        store = pages()
+        store.store.max_size = 1
+        first = json.loads(store.first_page(SzResult(network(LINKS)), [1]))["PAGE_INFO"]["CURSOR"]
+        store.first_page(SzResult(network(LINKS)), [1])
+
+        assert store.page(first).is_error
+
+    def test_page_fetch_restarts_expiry(self):
+        store = pages()
+        store.store.ttl = 10
+        with patch("senzing_mcp.cache.time.monotonic", return_value=100.0):
+            cursor = json.loads(store.first_page(SzResult(network(LINKS)), [1]))["PAGE_INFO"]["CURSOR"]
+        with patch("senzing_mcp.cache.time.monotonic", return_value=108.0):
+            assert not store.page(cursor, 2).is_error
+        with patch("senzing_mcp.cache.time.monotonic", return_value=116.0):
+            assert not store.page(cursor, 3).is_error
+        with patch("senzing_mcp.cache.time.monotonic", return_value=127.0):
+            assert store.page(cursor, 1).is_error
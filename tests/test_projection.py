@@ -0,0 +1,115 @@
+"""Tests for include/exclude projection of engine responses."""
+
+import json
+
+import pytest
+
+from senzing_mcp.projection import Projection, ProjectionConfig
+from senzing_mcp.results import SzResult
+
+ENTITY = {
+    "RESOLVED_ENTITY": {
+        "ENTITY_ID": 1,
+        "ENTITY_NAME": "Robert Smith",
+        "FEATURES": {"NAME": [{"FEAT_DESC": "Robert Smith"}], "PHONE": [{"FEAT_DESC": "555-1212"}]},
+        "RECORDS": [
+            {"DATA_SOURCE": "CUSTOMERS", "RECORD_ID": "1", "UNMAPPED_DATA": {"X": 1}, "RECORD_FEATURES": []},
+            {"DATA_SOURCE": "WATCHLIST", "RECORD_ID": "2", "UNMAPPED_DATA": {"Y": 2}},
+        ],
+    },
+    "RELATED_ENTITIES": [{"ENTITY_ID": 2, "MATCH_INFO": {"FEATURE_SCORES": {"NAME": []}}}],
+}
+
+
+def project(data, include=(), exclude=()):
+    return Projection(include, exclude).prune(json.loads(json.dumps(data)))
+
+
+class TestProjection:
+    """Paths traverse lists, '*' matches any key and '**' any depth."""
+
+    def test_exclude_through_lists(self):
+        records = project(ENTITY, exclude=["RESOLVED_ENTITY.RECORDS.UNMAPPED_DATA"])["RESOLVED_ENTITY"]["RECORDS"]
+        assert records == [
+            {"DATA_SOURCE": "CUSTOMERS", "RECORD_ID": "1", "RECORD_FEATURES": []},
+            {"DATA_SOURCE": "WATCHLIST", "RECORD_ID": "2"},
+        ]
+
+    def test_exclude_any_depth(self):
+        data = project(ENTITY, exclude=["**.UNMAPPED_DATA", "**.FEATURE_SCORES", "**.RECORD_FEATURES"])
+        text = json.dumps(data)
+        assert "UNMAPPED_DATA" not in text and "FEATURE_SCORES" not in text and "RECORD_FEATURES" not in text
+        assert data["RELATED_ENTITIES"] == [{"ENTITY_ID": 2, "MATCH_INFO": {}}]
+
+    def test_exclude_wildcard_key(self):
+        features = project(ENTITY, exclude=["RESOLVED_ENTITY.FEATURES.*"])["RESOLVED_ENTITY"]["FEATURES"]
+        assert features == {}
+
+    def test_include_keeps_only_named_paths(self):
+        data = project(ENTITY, include=[
+            "RESOLVED_ENTITY.ENTITY_NAME",
+            "RESOLVED_ENTITY.RECORDS.DATA_SOURCE",
+            "RESOLVED_ENTITY.FEATURES",
+        ])
+        assert data == {"RESOLVED_ENTITY": {
+            "ENTITY_NAME": "Robert Smith",
+            "FEATURES": ENTITY["RESOLVED_ENTITY"]["FEATURES"],
+            "RECORDS": [{"DATA_SOURCE": "CUSTOMERS"}, {"DATA_SOURCE": "WATCHLIST"}],
+        }}
+
+    def test_include_then_exclude(self):
+        data = project(ENTITY, include=["RESOLVED_ENTITY.RECORDS"], exclude=["**.UNMAPPED_DATA"])
+        assert data["RESOLVED_ENTITY"]["RECORDS"][1] == {"DATA_SOURCE": "WATCHLIST", "RECORD_ID": "2"}
+
+    def test_include_keeps_page_info(self):
+        data = {"ENTITIES": [{"RESOLVED_ENTITY": {"ENTITY_ID": 1, "ENTITY_NAME": "A"}}],
+                "ENTITY_NETWORK_LINKS": [], "PAGE_INFO": {"CURSOR": "abc", "NEXT_PAGE": 2}}
+        assert project(data, include=["ENTITIES.RESOLVED_ENTITY.ENTITY_ID"]) == {
+            "ENTITIES": [{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}],
+            "PAGE_INFO": {"CURSOR": "abc", "NEXT_PAGE": 2},
+        }
+
+    def test_paths_must_be_a_list_of_strings(self):
+        with pytest.raises(ValueError, match="'include' must be a list"):
+            Projection(include="RESOLVED_ENTITY")
+        with pytest.raises(ValueError, match="'exclude' must be a list"):
+            Projection(exclude=["**.UNMAPPED_DATA", 3])
+        with pytest.raises(ValueError):
+            ProjectionConfig().for_call("get_entity", {"include": "RESOLVED_ENTITY"})
+
+    def test_include_rejects_any_depth(self):
+        with pytest.raises(ValueError, match="only supported in exclude"):
+            Projection(include=["**.ENTITY_NAME"])
+
+    def test_apply_keeps_result_type_and_skips_unmatched(self):
+        result = SzResult(json.dumps(ENTITY))
+        projected = Projection(exclude=["**.UNMAPPED_DATA"]).apply(result)
+        assert isinstance(projected, SzResult)
+        assert "UNMAPPED_DATA" not in projected
+
+        # No excluded key in the payload: returned as-is, without a parse
+        assert Projection(exclude=["**.NOT_THERE"]).apply(result) is result
+
+    def test_errors_pass_through(self):
+        error = SzResult.from_error("Entity not found", entity_id=9)
+        assert Projection(include=["RESOLVED_ENTITY"]).apply(error) is error
+
+
+class TestProjectionConfig:
+    """Call arguments win over the tool's entry, which wins over '*'."""
+
+    def test_for_call(self, tmp_path):
+        path = tmp_path / "projection.json"
+        path.write_text(json.dumps({
+            "*": {"exclude": ["**.UNMAPPED_DATA"]},
+            "get_entity": {"include": ["RESOLVED_ENTITY"]},
+        }))
+        config = ProjectionConfig()
+        config.load(str(path))
+
+        assert config.for_call("get_entity", {}).include == [("RESOLVED_ENTITY",)]
+        assert config.for_call("find_path", {}).exclude == [("**", "UNMAPPED_DATA")]
+        assert config.for_call("find_path", {"exclude": ["A.B"]}).exclude == [("A", "B")]
+
+        config.load("")
+        assert not config.for_call("find_path", {})
@@ -0,0 +1,141 @@
+"""Tests for SDK call recording and replay."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from senzing_mcp.replay import FixtureWriter, RecordingEngine, ReplayEngine, ReplayMissError
+from senzing_mcp.sdk_wrapper import SenzingSDKWrapper
+
+
+@pytest.fixture(autouse=True)
+def sz_errors(sz_errors):
+    with patch('senzing_mcp.replay.SzError', sz_errors.SzError), \
+            patch('senzing_mcp.replay.SzNotFoundError', sz_errors.SzNotFoundError):
+        yield sz_errors
+
+
+class RealEngine:
+    """Engine with deterministic responses and errors."""
+
+    def __init__(self, errors):
+        self.errors = errors
+
+    def get_entity_by_entity_id(self, entity_id, flags):
+        if entity_id == 404:
+            raise self.errors.SzNotFoundError("SENZ0037|Unknown resolved entity value")
+        return json.dumps({"RESOLVED_ENTITY": {"ENTITY_ID": entity_id}})
+
+    def find_path_by_entity_id(self, start_entity_id, end_entity_id, max_degrees,
+                               avoid_entity_ids=None, required_data_sources=None, flags=0):
+        return json.dumps({"FLAGS": flags})
+
+    def why_entities(self, entity_id_1, entity_id_2, flags):
+        raise self.errors.SzError("SENZ2062|Stale config")
+
+
+def record(path, calls, errors):
+    writer = FixtureWriter(str(path))
+    engine = RecordingEngine(RealEngine(errors), writer)
+    for method, args in calls:
+        try:
+            getattr(engine, method)(*args)
+        except Exception:
+            pass
+    writer.close()
+
+
+class TestRecordReplay:
+    """Recorded calls replay with the same responses and errors."""
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+    def test_round_trip(self, tmp_path, suffix, sz_errors):
+        path = tmp_path / f"fixture{suffix}"
+        record(path, [
+            ("get_entity_by_entity_id", (1, 3)),
+            ("get_entity_by_entity_id", (404, 3)),
+            ("why_entities", (1, 2, 0)),
+        ], sz_errors)
+
+        replay = ReplayEngine(str(path), speed=0)
+        assert json.loads(replay.get_entity_by_entity_id(1, 3))["RESOLVED_ENTITY"]["ENTITY_ID"] == 1
+        with pytest.raises(sz_errors.SzNotFoundError):
+            replay.get_entity_by_entity_id(404, 3)
+        with pytest.raises(sz_errors.SzError, match="SENZ2062"):
+            replay.why_entities(1, 2, 0)
+
+    def test_keyword_arguments_are_part_of_the_key(self, tmp_path, sz_errors):
+        path = tmp_path / "fixture.jsonl"
+        writer = FixtureWriter(str(path))
+        RecordingEngine(RealEngine(sz_errors), writer).find_path_by_entity_id(1, 2, 3, flags=5)
+        writer.close()
+
+        replay = ReplayEngine(str(path), speed=0)
+        assert json.loads(replay.find_path_by_entity_id(1, 2, 3, flags=5)) == {"FLAGS": 5}
+        with pytest.raises(ReplayMissError):
+            replay.find_path_by_entity_id(1, 2, 3, 5)
+
+    def test_unrecorded_call(self, tmp_path, sz_errors):
+        path = tmp_path / "fixture.jsonl"
+        record(path, [("get_entity_by_entity_id", (1, 3))], sz_errors)
+        replay = ReplayEngine(str(path), speed=0)
+
+        with pytest.raises(ReplayMissError):
+            replay.get_entity_by_entity_id(2, 3)
+        with pytest.raises(AttributeError):
+            replay.search_by_attributes
+        replay.prime_engine()
+
+    def test_original_timing(self, tmp_path, monkeypatch):
+        path = tmp_path / "fixture.jsonl"
+        path.write_text(json.dumps({
+            "method": "get_entity_by_entity_id", "args": [1, 3], "duration_ms": 40.0, "result": "{}",
+        }) + "\n")
+        sleeps = []
+        monkeypatch.setattr("senzing_mcp.replay.time.sleep", sleeps.append)
+
+        ReplayEngine(str(path)).get_entity_by_entity_id(1, 3)
+        ReplayEngine(str(path), speed=2).get_entity_by_entity_id(1, 3)
+
+        assert sleeps == [0.04, 0.02]
+
+    def test_methods_stable_for_coalescing(self, tmp_path, sz_errors):
+        path = tmp_path / "fixture.jsonl"
+        record(path, [("get_entity_by_entity_id", (1, 3))], sz_errors)
+        recording = RecordingEngine(RealEngine(sz_errors), FixtureWriter(str(tmp_path / "other.jsonl")))
+        replay = ReplayEngine(str(path), speed=0)
+
+        assert recording.get_entity_by_entity_id is recording.get_entity_by_entity_id
+        assert replay.get_entity_by_entity_id is replay.get_entity_by_entity_id
+        assert replay.get_entity_by_entity_id.__name__ == "get_entity_by_entity_id"
+
+
+class TestWrapperRecordReplay:
+    """SENZING_MCP_RECORD_FILE / SENZING_MCP_REPLAY_FILE wire in at initialization."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path, monkeypatch, sz_errors):
+        path = str(tmp_path / "fixture.jsonl")
+        monkeypatch.setenv("SENZING_ENGINE_CONFIGURATION_JSON", "{}")
+        monkeypatch.setenv("SENZING_MCP_RECORD_FILE", path)
+        recorder = SenzingSDKWrapper()
+        recorder.entity_cache.max_size = 0
+        factory = MagicMock()
+        factory.create_engine.return_value = RealEngine(sz_errors)
+        with patch('senzing_mcp.sdk_wrapper.SzAbstractFactoryCore', return_value=factory):
+            await recorder.initialize()
+        recorded = await recorder.get_entity_by_entity_id(7)
+        await recorder.cleanup()
+
+        monkeypatch.delenv("SENZING_ENGINE_CONFIGURATION_JSON")
+        monkeypatch.delenv("SENZING_MCP_RECORD_FILE")
+        monkeypatch.setenv("SENZING_MCP_REPLAY_FILE", path)
+        monkeypatch.setenv("SENZING_MCP_REPLAY_SPEED", "0")
+        replayer = SenzingSDKWrapper()
+        await replayer.initialize()
+        replayed = await replayer.get_entity_by_entity_id(7)
+        await replayer.cleanup()
+
+        assert isinstance(replayer.engine, ReplayEngine)
+        assert replayed == recorded
@@ -0,0 +1,51 @@
+"""Tests for typed wrapper results and the JSON backend."""
+
+import json
+import pickle
+
+from senzing_mcp import jsonutil
+from senzing_mcp.results import SzResult
+
+
+class TestSzResult:
+    """SzResult behaves like the raw JSON string it wraps."""
+
+    def test_success_result(self):
+        result = SzResult('{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}')
+        assert not result.is_error
+        assert result.error is None
+        assert json.loads(result) == {"RESOLVED_ENTITY": {"ENTITY_ID": 1}}
+        assert "RESOLVED_ENTITY" in result
+
+    def test_error_result(self):
+        result = SzResult.from_error("Entity not found", entity_id=999)
+        assert result.is_error
+        assert result.error == "Entity not found"
+        assert json.loads(result) == {"error": "Entity not found", "entity_id": 999}
+
+    def test_pickle_keeps_error(self):
+        result = pickle.loads(pickle.dumps(SzResult.from_error("SENZ0001|boom")))
+        assert isinstance(result, SzResult)
+        assert result.error == "SENZ0001|boom"
+
+
+class TestJsonBackend:
+    """loads/dumps work the same regardless of backend."""
+
+    def test_round_trip(self):
+        data = {"ENTITIES": [{"ENTITY_ID": 1, "NAME": "Zoë"}]}
+        assert jsonutil.loads(jsonutil.dumps(data)) == data
+
+    def test_dumps_returns_str(self):
+        assert isinstance(jsonutil.dumps({"a": 1}), str)
+
+    def test_loads_accepts_szresult(self):
+        assert jsonutil.loads(SzResult('{"a": 1}')) == {"a": 1}
+
+    def test_invalid_json_raises_stdlib_error(self):
+        try:
+            jsonutil.loads("not json")
+        except jsonutil.JSONDecodeError:
+            pass
+        else:
+            raise AssertionError("expected JSONDecodeError")
@@ -0,0 +1,129 @@
+"""Tests for search_by_attributes feature enrichment."""
+
+import json
+
+import pytest
+
+
+def search_response(entity_ids):
+    return json.dumps({"RESOLVED_ENTITIES": [
+        {
+            "MATCH_INFO": {"MATCH_KEY": "+NAME"},
+            "ENTITY": {"RESOLVED_ENTITY": {
+                "ENTITY_ID": eid,
+                "ENTITY_NAME": f"Entity {eid}",
+                "RECORDS": [{"DATA_SOURCE": "CUSTOMERS", "RECORD_ID": str(eid)}],
+            }},
+        }
+        for eid in entity_ids
+    ]})
+
+
+def entity_response(entity_id):
+    return json.dumps({"RESOLVED_ENTITY": {
+        "ENTITY_ID": entity_id,
+        "FEATURES": {"NAME": [{"FEAT_DESC": f"Entity {entity_id}"}]},
+        "RECORDS": [{
+            "DATA_SOURCE": "CUSTOMERS",
+            "RECORD_ID": str(entity_id),
+            "FEATURES": [{"LIB_FEAT_ID": entity_id}],
+        }],
+    }})
+
+
+@pytest.fixture
+def wrapper(wrapper):
+    """The shared wrapper with entity and search caching disabled."""
+    wrapper.entity_cache.max_size = 0
+    wrapper.search_cache.max_size = 0
+    return wrapper
+
+
+class TestSearchEnrichment:
+    """Small result sets get feature details without a second search."""
+
+    @pytest.mark.asyncio
+    async def test_single_search_call_with_entity_fetches(self, wrapper, sz_errors):
+        search_calls = 0
+        fetched = []
+
+        def mock_search(attrs, flags):
+            nonlocal search_calls
+            search_calls += 1
+            return search_response([1, 2])
+
+        def mock_get_entity(entity_id, flags):
+            fetched.append(entity_id)
+            return entity_response(entity_id)
+
+        wrapper.engine.search_by_attributes = mock_search
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        result = await wrapper.search_by_attributes('{"NAME_FULL": "Entity"}')
+
+        assert search_calls == 1
+        assert sorted(fetched) == [1, 2]
+
+        data = json.loads(result)
+        entity = data["RESOLVED_ENTITIES"][0]["ENTITY"]["RESOLVED_ENTITY"]
+        assert entity["FEATURES"]["NAME"][0]["FEAT_DESC"] == "Entity 1"
+        assert entity["RECORDS"][0]["FEATURES"] == [{"LIB_FEAT_ID": 1}]
+        assert entity["ENTITY_NAME"] == "Entity 1"
+        assert data["RESOLVED_ENTITIES"][0]["MATCH_INFO"] == {"MATCH_KEY": "+NAME"}
+
+    @pytest.mark.asyncio
+    async def test_large_result_not_enriched(self, wrapper, sz_errors):
+        fetched = []
+
+        wrapper.engine.search_by_attributes = lambda attrs, flags: search_response(range(1, 12))
+        wrapper.engine.get_entity_by_entity_id = lambda entity_id, flags: fetched.append(entity_id)
+
+        result = await wrapper.search_by_attributes('{"NAME_FULL": "Entity"}')
+
+        assert fetched == []
+        assert len(json.loads(result)["RESOLVED_ENTITIES"]) == 11
+
+    @pytest.mark.asyncio
+    async def test_standard_detail_not_enriched(self, wrapper, sz_errors):
+        fetched = []
+
+        wrapper.engine.search_by_attributes = lambda attrs, flags: search_response([1, 2])
+        wrapper.engine.get_entity_by_entity_id = lambda entity_id, flags: fetched.append(entity_id)
+
+        result = await wrapper.search_by_attributes('{"NAME_FULL": "Entity"}', detail="standard")
+
+        assert fetched == []
+        assert "FEATURES" not in json.loads(result)["RESOLVED_ENTITIES"][0]["ENTITY"]["RESOLVED_ENTITY"]
+
+    @pytest.mark.asyncio
+    async def test_enrich_threshold_configurable(self, wrapper, sz_errors):
+        fetched = []
+
+        def mock_get_entity(entity_id, flags):
+            fetched.append(entity_id)
+            return entity_response(entity_id)
+
+        wrapper.search_enrich_max = 1
+        wrapper.engine.search_by_attributes = lambda attrs, flags: search_response([1, 2])
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        await wrapper.search_by_attributes('{"NAME_FULL": "Entity"}')
+
+        assert fetched == []
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_search_entity(self, wrapper, sz_errors):
+        def mock_get_entity(entity_id, flags):
+            if entity_id == 2:
+                raise sz_errors.SzNotFoundError("merged away")
+            return entity_response(entity_id)
+
+        wrapper.engine.search_by_attributes = lambda attrs, flags: search_response([1, 2])
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        result = await wrapper.search_by_attributes('{"NAME_FULL": "Entity"}')
+
+        entities = json.loads(result)["RESOLVED_ENTITIES"]
+        assert "FEATURES" in entities[0]["ENTITY"]["RESOLVED_ENTITY"]
+        assert "FEATURES" not in entities[1]["ENTITY"]["RESOLVED_ENTITY"]
+        assert entities[1]["ENTITY"]["RESOLVED_ENTITY"]["ENTITY_NAME"] == "Entity 2"
@@ -0,0 +1,456 @@
+"""Tests for the MCP server layer (requires the mcp package)."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+
+pytest.importorskip("mcp")
+
+from senzing_mcp.results import SzResult
+from senzing_mcp.server import format_result
+
+
+class TestFormatResult:
+    """format_result uses the result type instead of re-parsing payloads."""
+
+    def test_success_passes_payload_through(self):
+        payload = SzResult('{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}')
+        content = format_result(payload, "[FORMATTING INSTRUCTIONS]\n")
+
+        assert [c.text for c in content] == ["[FORMATTING INSTRUCTIONS]\n", payload]
+
+    def test_error_result(self):
+        content = format_result(SzResult.from_error("SENZ2062|Requested lookup failed"), "[FORMATTING]")
+
+        assert len(content) == 1
+        assert "SENZING ERROR" in content[0].text
+        assert "SENZ2062" in content[0].text
+        assert "[FORMATTING]" not in content[0].text
+
+    def test_success_payload_not_parsed(self, monkeypatch):
+        """A success SzResult must not be parsed, even if it looks like an error."""
+        monkeypatch.setattr("senzing_mcp.server.jsonutil.loads", MagicMock(side_effect=AssertionError))
+        content = format_result(SzResult('{"error": "data field, not an error"}'), "[FORMATTING]")
+        assert len(content) == 2
+
+    def test_plain_string_error_still_detected(self):
+        content = format_result('{"error": "Entity not found", "entity_id": 999}', "[FORMATTING]")
+
+        assert len(content) == 1
+        assert "Entity not found" in content[0].text
+
+
+class TestToolMetrics:
+    """call_tool records per-tool metrics."""
+
+    @pytest.mark.asyncio
+    async def test_call_recorded_with_outcome(self, monkeypatch):
+        from senzing_mcp import server
+
+        async def mock_get_entity(entity_id, detail="full"):
+            if entity_id == 1:
+                return SzResult('{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}')
+            return SzResult.from_error("Entity not found")
+
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "get_entity_by_entity_id", mock_get_entity)
+        ok_before = server.tool_metrics.calls.value("get_entity", "ok")
+        error_before = server.tool_metrics.calls.value("get_entity", "error")
+
+        await server.call_tool("get_entity", {"entity_id": 1})
+        await server.call_tool("get_entity", {"entity_id": 2})
+
+        assert server.tool_metrics.calls.value("get_entity", "ok") == ok_before + 1
+        assert server.tool_metrics.calls.value("get_entity", "error") == error_before + 1
+        assert 'senzing_mcp_tool_latency_seconds_count{tool="get_entity"}' in server.metrics.render()
+
+    @pytest.mark.asyncio
+    async def test_unknown_tools_share_one_label(self, monkeypatch):
+        from senzing_mcp import server
+
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        before = server.tool_metrics.latency.count("unknown")
+
+        await server.call_tool("no_such_tool_1", {})
+        await server.call_tool("no_such_tool_2", {})
+
+        assert server.tool_metrics.latency.count("unknown") == before + 2
+        assert "no_such_tool" not in server.metrics.render()
+        assert {tool.name for tool in await server.list_tools()} == server.TOOL_NAMES
+
+
+class TestStreamableHTTP:
+    """The stateless streamable HTTP app answers each request on its own."""
+
+    def test_stateless_tool_call(self, monkeypatch):
+        from starlette.testclient import TestClient
+
+        from senzing_mcp import server
+
+        async def mock_get_entity(entity_id, detail="full"):
+            return SzResult('{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id)
+
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "get_entity_by_entity_id", mock_get_entity)
+        headers = {"Accept": "application/json, text/event-stream"}
+
+        with TestClient(server.create_streamable_http_app(stateless=True)) as client:
+            # No initialize handshake or session ID: any worker can take any request
+            for entity_id in (1, 2):
+                response = client.post("/mcp/", headers=headers, json={
+                    "jsonrpc": "2.0", "id": entity_id, "method": "tools/call",
+                    "params": {"name": "get_entity", "arguments": {"entity_id": entity_id}},
+                })
+                assert response.status_code == 200
+                assert "mcp-session-id" not in response.headers
+                content = response.json()["result"]["content"]
+                assert content[-1]["text"] == '{"RESOLVED_ENTITY": {"ENTITY_ID": %d}}' % entity_id
+
+            assert client.get("/metrics").status_code == 200
+
+    def test_workers_require_streamable_http(self, monkeypatch):
+        from senzing_mcp import server
+
+        monkeypatch.setattr("sys.argv", ["senzing-mcp", "--http", "--workers", "2"])
+        with pytest.raises(SystemExit):
+            server.parse_args()
+
+        monkeypatch.setattr("sys.argv", ["senzing-mcp", "--streamable-http", "--workers", "2"])
+        assert server.parse_args().stateless is True
+
+
+class TestDetailLevels:
+    """The detail argument selects a smaller engine flag set per tool."""
+
+    FLAGS = {
+        "get_entity_by_entity_id": {"summary": 1, "standard": 2, "full": 3},
+        "find_network_by_entity_id": {"summary": 10, "standard": 20, "full": 30},
+    }
+
+    @pytest.fixture
+    def engine_flags(self, monkeypatch):
+        from senzing_mcp import server
+
+        calls = []
+        engine = MagicMock()
+        engine.get_entity_by_entity_id = lambda entity_id, flags: calls.append(flags) or '{"RESOLVED_ENTITY": {}}'
+        engine.find_network_by_entity_id = lambda *args: calls.append(args[-1]) or '{"ENTITIES": []}'
+        monkeypatch.setattr("senzing_mcp.sdk_wrapper.DETAIL_FLAGS", self.FLAGS)
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "engine", engine)
+        monkeypatch.setattr(server.sdk_wrapper.entity_cache, "max_size", 0)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_tool_defaults_and_override(self, engine_flags):
+        from senzing_mcp import server
+
+        await server.call_tool("get_entity", {"entity_id": 1})
+        await server.call_tool("get_entity", {"entity_id": 1, "detail": "summary"})
+        await server.call_tool("expand_network", {"entity_ids": [1]})
+        await server.call_tool("expand_network", {"entity_ids": [1], "detail": "full"})
+
+        assert engine_flags == [3, 1, 10, 30]
+
+    @pytest.mark.asyncio
+    async def test_unknown_detail_is_an_error(self, engine_flags):
+        from senzing_mcp import server
+
+        content = await server.call_tool("get_entity", {"entity_id": 1, "detail": "everything"})
+
+        assert content[0].text.startswith("Error: Unknown detail level 'everything'")
+        assert engine_flags == []
+
+    @pytest.fixture
+    def bit_flags(self, monkeypatch):
+        """Engine flags with a distinct bit per flag name, and the detail sets built from them."""
+        from senzing_mcp import sdk_wrapper
+
+        class Flags:
+            def __init__(self):
+                self.bits = {}
+
+            def __getattr__(self, name):
+                return self.bits.setdefault(name, 1 << len(self.bits))
+
+        flags = Flags()
+        monkeypatch.setattr(sdk_wrapper, "SzEngineFlags", flags)
+        monkeypatch.setattr(sdk_wrapper, "DETAIL_FLAGS", sdk_wrapper._detail_flag_sets())
+        return flags
+
+    def test_network_levels_keep_links(self, bit_flags):
+        from senzing_mcp import sdk_wrapper
+
+        link_flag = bit_flags.SZ_FIND_NETWORK_INCLUDE_MATCHING_INFO
+        for level, value in sdk_wrapper.DETAIL_FLAGS["find_network_by_entity_id"].items():
+            assert value & link_flag, level
+
+    @pytest.mark.asyncio
+    async def test_engine_gets_flags_for_each_tool_and_level(self, bit_flags, monkeypatch):
+        from senzing_mcp import server
+        from senzing_mcp.sdk_wrapper import DETAIL_FLAGS
+
+        engine = MagicMock()
+        engine.search_by_attributes.return_value = '{"RESOLVED_ENTITIES": []}'
+        for method in ("get_entity_by_entity_id", "get_entity_by_record_id"):
+            getattr(engine, method).return_value = '{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}'
+        engine.find_path_by_entity_id.return_value = '{"ENTITY_PATHS": [], "ENTITIES": []}'
+        engine.find_network_by_entity_id.return_value = '{"ENTITY_NETWORK_LINKS": [], "ENTITIES": []}'
+        engine.why_entities.return_value = '{"WHY_RESULTS": []}'
+        engine.how_entity_by_entity_id.return_value = '{"HOW_RESULTS": {}}'
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "engine", engine)
+        monkeypatch.setattr(server.sdk_wrapper.entity_cache, "max_size", 0)
+        monkeypatch.setattr(server.sdk_wrapper.search_cache, "max_size", 0)
+
+        tools = {
+            "search_entities": ("search_by_attributes", {"attributes": {"NAME_FULL": "Robert Smith"}}),
+            "get_entity": ("get_entity_by_entity_id", {"entity_id": 1}),
+            "get_entities": ("get_entity_by_entity_id", {"entity_ids": [1]}),
+            "get_source_record": ("get_entity_by_record_id", {"data_source": "CUSTOMERS", "record_id": "1"}),
+            # Records are resolved with flags 0, then their entities fetched at the detail level
+            "get_source_records": ("get_entity_by_entity_id", {"records": [{"data_source": "CUSTOMERS", "record_id": "1"}]}),
+            "find_path": ("find_path_by_entity_id", {"start_entity_id": 1, "end_entity_id": 2}),
+            "expand_network": ("find_network_by_entity_id", {"entity_ids": [1]}),
+            "explain_why_related": ("why_entities", {"entity_id_1": 1, "entity_id_2": 2}),
+            "explain_how_resolved": ("how_entity_by_entity_id", {"entity_id": 1}),
+        }
+        assert set(tools) == set(server.DEFAULT_DETAIL)
+        for tool, (method, arguments) in tools.items():
+            for level in ("summary", "standard", "full"):
+                mock = getattr(engine, method)
+                mock.reset_mock()
+                content = await server.call_tool(tool, {**arguments, "detail": level})
+                assert not content[0].text.startswith("Error"), (tool, level, content[0].text)
+                args, kwargs = mock.call_args
+                flags = kwargs["flags"] if "flags" in kwargs else args[-1]
+                # Record lookups use the entity flag sets
+                flag_set = "get_entity_by_entity_id" if method == "get_entity_by_record_id" else method
+                assert flags == DETAIL_FLAGS[flag_set][level], (tool, level)
+
+        # Every summary level carries names and record counts, as the detail schema promises
+        for method, levels in DETAIL_FLAGS.items():
+            assert levels["summary"] & bit_flags.SZ_ENTITY_INCLUDE_RECORD_SUMMARY, method
+
+    @pytest.mark.asyncio
+    async def test_every_engine_tool_accepts_detail(self):
+        from senzing_mcp import server
+
+        tools = {tool.name: tool for tool in await server.list_tools()}
+        # get_network_page serves stored expand_network results, so has no detail of its own
+        assert set(tools) - set(server.DEFAULT_DETAIL) == {"get_network_page"}
+        for name in server.DEFAULT_DETAIL:
+            assert tools[name].inputSchema["properties"]["detail"]["enum"] == ["summary", "standard", "full"]
+
+
+class TestProjection:
+    """Configured and per-call projections prune responses before formatting."""
+
+    @pytest.fixture
+    def entity_engine(self, monkeypatch):
+        from senzing_mcp import server
+
+        engine = MagicMock()
+        engine.get_entity_by_entity_id = lambda entity_id, flags: (
+            '{"RESOLVED_ENTITY": {"ENTITY_ID": 1, "RECORDS": [{"RECORD_ID": "1", "UNMAPPED_DATA": {}}]}}'
+        )
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "engine", engine)
+        monkeypatch.setattr(server.sdk_wrapper.entity_cache, "max_size", 0)
+        monkeypatch.setattr(server.projections, "projections", {})
+
+    @pytest.mark.asyncio
+    async def test_configured_and_call_projection(self, entity_engine):
+        from senzing_mcp import server
+
+        server.projections.load('{"get_entity": {"exclude": ["**.UNMAPPED_DATA"]}}')
+        content = await server.call_tool("get_entity", {"entity_id": 1})
+        assert json.loads(content[1].text) == {"RESOLVED_ENTITY": {"ENTITY_ID": 1, "RECORDS": [{"RECORD_ID": "1"}]}}
+
+        content = await server.call_tool("get_entity", {"entity_id": 1, "include": ["RESOLVED_ENTITY.ENTITY_ID"]})
+        assert json.loads(content[1].text) == {"RESOLVED_ENTITY": {"ENTITY_ID": 1}}
+
+    @pytest.mark.asyncio
+    async def test_string_paths_are_an_error(self, entity_engine):
+        from senzing_mcp import server
+
+        content = await server.call_tool("get_entity", {"entity_id": 1, "include": "RESOLVED_ENTITY"})
+        assert content[0].text.startswith("Error: Projection 'include' must be a list")
+
+    @pytest.mark.asyncio
+    async def test_every_tool_accepts_projection(self):
+        from senzing_mcp import server
+
+        for tool in await server.list_tools():
+            assert {"include", "exclude"} <= set(tool.inputSchema["properties"])
+
+
+class TestCompactOutput:
+    """output="compact" replaces the formatting note and JSON with a digest."""
+
+    @pytest.fixture
+    def entity_engine(self, monkeypatch):
+        from senzing_mcp import server
+
+        engine = MagicMock()
+        engine.get_entity_by_entity_id = lambda entity_id, flags: (
+            '{"RESOLVED_ENTITY": {"ENTITY_ID": 1, "ENTITY_NAME": "Robert Smith", "RECORDS": []}}'
+        )
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "engine", engine)
+        monkeypatch.setattr(server.sdk_wrapper.entity_cache, "max_size", 0)
+        monkeypatch.setattr(server, "default_output", "raw")
+
+    @pytest.mark.asyncio
+    async def test_compact_and_raw(self, entity_engine, monkeypatch):
+        from senzing_mcp import server
+
+        content = await server.call_tool("get_entity", {"entity_id": 1, "output": "compact"})
+        assert len(content) == 1
+        assert content[0].text.startswith("## Entity 1: Robert Smith")
+        assert content[0].text.endswith('output="raw" for the full JSON.')
+
+        monkeypatch.setattr(server, "default_output", "compact")
+        content = await server.call_tool("get_entity", {"entity_id": 1, "output": "raw"})
+        assert json.loads(content[1].text)["RESOLVED_ENTITY"]["ENTITY_NAME"] == "Robert Smith"
+
+    @pytest.mark.asyncio
+    async def test_unsummarizable_result_falls_back_to_raw(self, entity_engine, monkeypatch):
+        from senzing_mcp import server
+
+        def broken(data):
+            raise KeyError("ENTITY_ID")
+
+        monkeypatch.setitem(server.SUMMARIZERS, "get_entity", broken)
+        content = await server.call_tool("get_entity", {"entity_id": 1, "output": "compact"})
+        assert json.loads(content[1].text)["RESOLVED_ENTITY"]["ENTITY_ID"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_output_is_an_error(self, entity_engine):
+        from senzing_mcp import server
+
+        content = await server.call_tool("get_entity", {"entity_id": 1, "output": "yaml"})
+        assert content[0].text.startswith("Error: Unknown output mode 'yaml'")
+
+
+class TestFormattingNotes:
+    """Notes are offered as prompts/resources and sent per --formatting-notes mode."""
+
+    @pytest.fixture
+    def entity_engine(self, monkeypatch):
+        from senzing_mcp import server
+
+        engine = MagicMock()
+        engine.get_entity_by_entity_id = lambda entity_id, flags: '{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}'
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "engine", engine)
+        monkeypatch.setattr(server.sdk_wrapper.entity_cache, "max_size", 0)
+        monkeypatch.setattr(server, "formatting_notes", server.NoteTracker("first-call"))
+
+    @pytest.mark.asyncio
+    async def test_first_call_per_session(self, entity_engine):
+        from mcp.shared.memory import create_connected_server_and_client_session
+        from senzing_mcp import server
+
+        for _ in range(2):
+            async with create_connected_server_and_client_session(server.app) as client:
+                first = await client.call_tool("get_entity", {"entity_id": 1})
+                second = await client.call_tool("get_entity", {"entity_id": 1})
+                assert first.content[0].text.startswith("[FORMATTING INSTRUCTIONS FOR ENTITY DETAILS]")
+                assert [json.loads(block.text) for block in second.content] == [{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}]
+
+    @pytest.mark.asyncio
+    async def test_never(self, entity_engine, monkeypatch):
+        from senzing_mcp import server
+
+        monkeypatch.setattr(server.formatting_notes, "mode", "never")
+        content = await server.call_tool("get_entity", {"entity_id": 1})
+        assert len(content) == 1
+
+    @pytest.mark.asyncio
+    async def test_prompts_and_resources(self):
+        from mcp.shared.memory import create_connected_server_and_client_session
+        from senzing_mcp import server
+        from senzing_mcp.formatting import FORMATTING_NOTES
+
+        async with create_connected_server_and_client_session(server.app) as client:
+            prompts = await client.list_prompts()
+            assert len(prompts.prompts) == len(FORMATTING_NOTES)
+            prompt = await client.get_prompt("format_explain_how_resolved")
+            assert prompt.messages[0].content.text == FORMATTING_NOTES["explain_how_resolved"]
+
+            resources = await client.list_resources()
+            assert len(resources.resources) == len(FORMATTING_NOTES)
+            contents = await client.read_resource("senzing://formatting-notes/search_entities")
+            assert contents.contents[0].text == FORMATTING_NOTES["search_entities"]
+
+
+class TestNetworkPaging:
+    """expand_network returns a first page and cursor for get_network_page."""
+
+    @pytest.mark.asyncio
+    async def test_expand_then_page(self, monkeypatch):
+        from senzing_mcp import server
+
+        members = list(range(1, 8))
+        payload = json.dumps({
+            "ENTITY_PATHS": [],
+            "ENTITY_NETWORK_LINKS": [{"MIN_ENTITY_ID": 1, "MAX_ENTITY_ID": eid} for eid in members[1:]],
+            "ENTITIES": [{"RESOLVED_ENTITY": {"ENTITY_ID": eid, "ENTITY_NAME": f"E{eid}"}} for eid in members],
+        })
+        engine = MagicMock()
+        engine.find_network_by_entity_id = lambda *args: payload
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "engine", engine)
+        monkeypatch.setattr(server.network_pages, "page_size", 3)
+
+        content = await server.call_tool("expand_network", {"entity_ids": [1]})
+        first = json.loads(content[1].text)
+        assert len(first["ENTITIES"]) == 3 and first["PAGE_INFO"]["PAGES"] == 3
+
+        cursor = first["PAGE_INFO"]["CURSOR"]
+        content = await server.call_tool("get_network_page", {"cursor": cursor, "page": 3, "output": "compact"})
+        assert content[0].text.startswith("## Network: 1 entities")
+        assert "Page 3 of 3" in content[0].text
+
+        content = await server.call_tool("expand_network", {"entity_ids": [1], "page_size": 0})
+        assert len(json.loads(content[1].text)["ENTITIES"]) == 7
+
+    def test_stateless_disables_paging(self, monkeypatch):
+        from senzing_mcp import server
+        from senzing_mcp.network_pages import NetworkPages
+
+        monkeypatch.setattr(server, "network_pages", NetworkPages())
+        monkeypatch.setattr("sys.argv", ["senzing-mcp", "--streamable-http", "--workers", "2"])
+        server.configure(server.parse_args())
+
+        payload = json.dumps({"ENTITIES": [{"RESOLVED_ENTITY": {"ENTITY_ID": eid}} for eid in range(1, 8)]})
+        assert server.network_pages.first_page(payload, [1], page_size=3) is payload
+
+
+class TestFindPath:
+    """find_path passes its flags by keyword (position 4 is avoid_entity_ids)."""
+
+    @pytest.mark.asyncio
+    async def test_flags_passed_by_keyword(self, monkeypatch):
+        from senzing_mcp import server
+        from senzing_mcp.sdk_wrapper import detail_flags
+
+        calls = []
+
+        def find_path_by_entity_id(start_entity_id, end_entity_id, max_degrees,
+                                   avoid_entity_ids=None, required_data_sources=None, flags=0):
+            calls.append((avoid_entity_ids, required_data_sources, flags))
+            return '{"ENTITY_PATHS": [], "ENTITIES": []}'
+
+        engine = MagicMock()
+        engine.find_path_by_entity_id = find_path_by_entity_id
+        monkeypatch.setattr(server.sdk_wrapper, "_initialized", True)
+        monkeypatch.setattr(server.sdk_wrapper, "engine", engine)
+
+        content = await server.call_tool("find_path", {"start_entity_id": 1, "end_entity_id": 2})
+
+        assert json.loads(content[1].text) == {"ENTITY_PATHS": [], "ENTITIES": []}
+        assert calls == [(None, None, detail_flags("find_path_by_entity_id", "standard"))]
@@ -0,0 +1,109 @@
+"""Tests for the slow-call log."""
+
+import json
+import time
+
+import pytest
+
+from senzing_mcp import tracing
+from senzing_mcp.slow_calls import SlowCallLog, parse_thresholds, sanitize_arguments
+
+
+@pytest.fixture
+def wrapper(wrapper):
+    """The shared wrapper with caching disabled."""
+    wrapper.entity_cache.max_size = 0
+    return wrapper
+
+
+def read_entries(path):
+    return [json.loads(line.split(" SLOW_CALL ", 1)[1]) for line in path.read_text().splitlines()]
+
+
+class TestThresholds:
+    """Test threshold parsing."""
+
+    def test_default_and_per_tool(self):
+        assert parse_thresholds("500,expand_network=5000") == (500.0, {"expand_network": 5000.0})
+
+    def test_per_tool_only(self):
+        log = SlowCallLog(*parse_thresholds("search_entities=100"))
+        assert log.enabled
+        assert log.threshold_ms("search_entities") == 100
+        assert log.threshold_ms("get_entity") == 0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_thresholds("fast")
+
+    def test_disabled_by_default(self):
+        assert not SlowCallLog().enabled
+
+
+class TestSanitizeArguments:
+    """Only IDs, limits and attribute names are logged."""
+
+    def test_attribute_values_dropped(self):
+        sanitized = sanitize_arguments({"attributes": {"NAME_FULL": "John Smith", "PHONE_NUMBER": "555-1234"}})
+        assert sanitized == {"attribute_keys": ["NAME_FULL", "PHONE_NUMBER"]}
+
+    def test_ids_and_limits_kept(self):
+        sanitized = sanitize_arguments({
+            "entity_ids": list(range(30)), "max_degrees": 2, "build_out_degrees": 1, "max_entities": 100,
+        })
+        assert sanitized["entity_ids"] == list(range(20))
+        assert sanitized["entity_id_count"] == 30
+        assert sanitized["max_degrees"] == 2
+        assert sanitized["max_entities"] == 100
+
+    def test_records_summarized(self):
+        sanitized = sanitize_arguments({"records": [
+            {"data_source": "CUSTOMERS", "record_id": "1001"},
+            {"data_source": "WATCHLIST", "record_id": "2002"},
+        ]})
+        assert sanitized == {"record_count": 2, "data_sources": ["CUSTOMERS", "WATCHLIST"]}
+
+
+class TestSlowCallLog:
+    """Test logging of slow calls through the background writer."""
+
+    def test_only_slow_calls_logged(self, tmp_path):
+        path = tmp_path / "slow.log"
+        log = SlowCallLog(100, {"expand_network": 1000})
+        log.start(str(path))
+        try:
+            assert log.observe("get_entity", {"entity_id": 1}, 0.2, lambda: 42, None)
+            assert not log.observe("get_entity", {"entity_id": 2}, 0.05, lambda: 42, None)
+            assert not log.observe("expand_network", {"entity_ids": [1]}, 0.2, lambda: 42, None)
+        finally:
+            log.stop()
+
+        (entry,) = read_entries(path)
+        assert entry["tool"] == "get_entity"
+        assert entry["arguments"] == {"entity_id": 1}
+        assert entry["duration_ms"] == 200.0
+        assert entry["response_bytes"] == 42
+
+    @pytest.mark.asyncio
+    async def test_timing_breakdown_and_flags(self, wrapper, tmp_path, sz_errors):
+        def get_entity_by_entity_id(entity_id, flags):
+            time.sleep(0.02)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}'
+
+        wrapper.engine.get_entity_by_entity_id = get_entity_by_entity_id
+        path = tmp_path / "slow.log"
+        log = SlowCallLog(1)
+        log.start(str(path))
+        try:
+            start = time.perf_counter()
+            with tracing.trace_call("get_entity", force=log.enabled) as trace:
+                await wrapper.get_entity_by_entity_id(1, flags=7)
+            log.observe("get_entity", {"entity_id": 1}, time.perf_counter() - start, lambda: 10, trace)
+        finally:
+            log.stop()
+
+        (entry,) = read_entries(path)
+        assert entry["engine_ms"] >= 20
+        assert entry["executor_wait_ms"] >= 0
+        assert entry["engine_calls"] == 1
+        assert entry["flags"] == {"get_entity_by_entity_id": 7}
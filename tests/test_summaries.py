@@ -0,0 +1,86 @@
+"""Tests for compact server-side summaries."""
+
+from senzing_mcp import summaries
+from senzing_mcp.summaries import best_score, match_key_features
+
+
+def entity(entity_id, name, **extra):
+    return {"RESOLVED_ENTITY": {
+        "ENTITY_ID": entity_id,
+        "ENTITY_NAME": name,
+        "RECORD_SUMMARY": [{"DATA_SOURCE": "CUSTOMERS", "RECORD_COUNT": 2}, {"DATA_SOURCE": "WATCHLIST", "RECORD_COUNT": 1}],
+        **extra,
+    }}
+
+
+class TestHelpers:
+    def test_match_key_features(self):
+        assert match_key_features("+NAME+DOB-SSN") == (["NAME", "DOB"], ["SSN"])
+        assert match_key_features("+ADDRESS(REL_POINTER)") == (["ADDRESS(REL_POINTER)"], [])
+        assert match_key_features("") == ([], [])
+
+    def test_best_score_prefers_name(self):
+        assert best_score({"NAME": [{"SCORE": 80}, {"SCORE": 92}], "DOB": [{"SCORE": 100}]}) == 92
+        assert best_score({"DOB": [{"FULL_SCORE": 85}]}) == 85
+        assert best_score({}) is None
+
+
+class TestSummarizers:
+    """Digests carry IDs, names, scores and sources, not the raw JSON."""
+
+    def test_search_buckets_and_table(self):
+        data = {"RESOLVED_ENTITIES": [
+            {"MATCH_INFO": {"MATCH_KEY": "+NAME", "FEATURE_SCORES": {"NAME": [{"SCORE": 75}]}},
+             "ENTITY": entity(2, "Bob Smith")},
+            {"MATCH_INFO": {"MATCH_KEY": "+NAME+DOB", "FEATURE_SCORES": {"NAME": [{"SCORE": 98}]}},
+             "ENTITY": entity(1, "Robert Smith")},
+        ]}
+        text = summaries.summarize_search(data)
+
+        assert "2 entities found" in text
+        assert "Strong (90-100) 1, Good (70-89) 1, Possible (<70) 0" in text
+        rows = [line for line in text.splitlines() if line.startswith("| ") and "Smith" in line]
+        assert rows == [
+            "| 1 | Robert Smith | 98 | CUSTOMERS:2, WATCHLIST:1 | +NAME+DOB |",
+            "| 2 | Bob Smith | 75 | CUSTOMERS:2, WATCHLIST:1 | +NAME |",
+        ]
+
+    def test_tables_are_capped(self):
+        data = {"ENTITIES": [entity(n, f"Entity {n}") for n in range(summaries.MAX_ROWS + 5)]}
+        text = summaries.summarize_network(data)
+        assert "... and 5 more" in text
+        assert "Entity 24" in text and "Entity 25" not in text
+
+    def test_how_steps(self):
+        def member(record_id):
+            return {"RECORDS": [{"DATA_SOURCE": "CUSTOMERS", "RECORD_ID": record_id}]}
+
+        data = {"HOW_RESULTS": {
+            "RESOLUTION_STEPS": [
+                {"STEP": 1,
+                 "VIRTUAL_ENTITY_1": {"MEMBER_RECORDS": [member("1001")]},
+                 "VIRTUAL_ENTITY_2": {"MEMBER_RECORDS": [member("1002")]},
+                 "MATCH_INFO": {"MATCH_KEY": "+NAME+DOB-SSN", "FEATURE_SCORES": {"NAME": [{"SCORE": 95}]}}},
+                {"STEP": 2,
+                 "VIRTUAL_ENTITY_1": {"MEMBER_RECORDS": [member("1001"), member("1002")]},
+                 "VIRTUAL_ENTITY_2": {"MEMBER_RECORDS": [member("1003")]},
+                 "MATCH_INFO": {"MATCH_KEY": "+ADDRESS"}},
+            ],
+            "FINAL_STATE": {"VIRTUAL_ENTITIES": [{"VIRTUAL_ENTITY_ID": "V1"}]},
+        }}
+        assert summaries.summarize_how(data).splitlines() == [
+            "## How resolved: 2 steps, 1 final entities",
+            "",
+            "1. CUSTOMERS:1001 with CUSTOMERS:1002: ✅ NAME, ✅ DOB, ❌ SSN (NAME 95)",
+            "2. CUSTOMERS:1003 into CUSTOMERS:1001 +1 more: ✅ ADDRESS",
+        ]
+
+    def test_entities_lists_errors(self):
+        data = {"ENTITIES": {"1": entity(1, "Robert Smith"), "9": {"error": "Entity not found"}}}
+        text = summaries.summarize_entities(data)
+        assert "| 1 | Robert Smith | 3 | CUSTOMERS:2, WATCHLIST:1 | 0 |" in text
+        assert "- 9: Entity not found" in text
+
+    def test_every_tool_has_a_summarizer(self):
+        for summarize in summaries.SUMMARIZERS.values():
+            assert isinstance(summarize({}), str)
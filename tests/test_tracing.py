@@ -0,0 +1,136 @@
+"""Tests for per-tool-call tracing."""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from senzing_mcp import jsonutil, tracing
+
+
+class ListExporter:
+    """Collects finished traces in memory."""
+
+    enabled = True
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace.to_dict())
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def exporter():
+    exporter = ListExporter()
+    tracing.set_exporter(exporter)
+    yield exporter
+    tracing.set_exporter(tracing.NoopExporter())
+
+
+@pytest.fixture
+def wrapper(wrapper):
+    """The shared wrapper with caching disabled."""
+    wrapper.entity_cache.max_size = 0
+    return wrapper
+
+
+class TestTracing:
+    """Test trace and span recording."""
+
+    def test_noop_by_default(self):
+        with tracing.trace_call("get_entity") as trace:
+            with tracing.span("format"):
+                pass
+        assert trace is None
+        assert tracing.current() is None
+
+    def test_json_calls_recorded(self, exporter):
+        with tracing.trace_call("get_entity"):
+            jsonutil.dumps(jsonutil.loads('{"a": 1}'))
+
+        (trace,) = exporter.traces
+        assert trace["tool"] == "get_entity"
+        assert [span["stage"] for span in trace["spans"]] == ["parse", "serialize"]
+        assert set(trace["stages_ms"]) == {"parse", "serialize"}
+
+    def test_error_outcome(self, exporter):
+        with pytest.raises(ValueError):
+            with tracing.trace_call("get_entity"):
+                raise ValueError("boom")
+        assert exporter.traces[0]["outcome"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_and_sdk_stages(self, wrapper, exporter, sz_errors):
+        def get_entity_by_entity_id(entity_id, flags):
+            time.sleep(0.02)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}'
+
+        wrapper.engine.get_entity_by_entity_id = get_entity_by_entity_id
+
+        with tracing.trace_call("get_entity"):
+            await wrapper.get_entity_by_entity_id(1)
+
+        spans = exporter.traces[0]["spans"]
+        assert [span["stage"] for span in spans] == ["queue_wait", "sdk"]
+        assert spans[1]["method"] == "get_entity_by_entity_id"
+        assert spans[1]["duration_ms"] >= 20
+
+    @pytest.mark.asyncio
+    async def test_coalesced_call_marked(self, wrapper, exporter, sz_errors):
+        def mock_get_entity(entity_id, flags):
+            time.sleep(0.02)
+            return '{"RESOLVED_ENTITY": {"ENTITY_ID": 1}}'
+
+        wrapper.engine.get_entity_by_entity_id = mock_get_entity
+
+        async def traced_lookup():
+            with tracing.trace_call("get_entity"):
+                await wrapper.get_entity_by_entity_id(1)
+
+        await asyncio.gather(traced_lookup(), traced_lookup())
+
+        coalesced = [
+            span.get("coalesced", False)
+            for trace in exporter.traces for span in trace["spans"] if span["stage"] == "sdk"
+        ]
+        assert sorted(coalesced) == [False, True]
+
+
+class TestFileExporter:
+    """Test the JSONL file exporter."""
+
+    def test_writes_one_line_per_call(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracing.set_exporter(tracing.FileExporter(str(path)))
+        try:
+            for tool in ("get_entity", "search_entities"):
+                with tracing.trace_call(tool):
+                    with tracing.span("format"):
+                        pass
+        finally:
+            tracing.set_exporter(tracing.NoopExporter())
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["tool"] for line in lines] == ["get_entity", "search_entities"]
+        assert "format" in lines[0]["stages_ms"]
+
+    def test_written_by_background_thread(self, tmp_path, monkeypatch):
+        writers = []
+        emit = logging.FileHandler.emit
+        monkeypatch.setattr(logging.FileHandler, "emit", lambda self, record: (
+            writers.append(threading.current_thread()), emit(self, record)))
+        exporter = tracing.FileExporter(str(tmp_path / "traces.jsonl"))
+
+        exporter.export(tracing.Trace("get_entity"))
+        exporter.close()
+        exporter.close()
+
+        assert len(writers) == 1
+        assert writers[0] is not threading.current_thread()
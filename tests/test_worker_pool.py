@@ -0,0 +1,129 @@
+"""Tests for the multi-process engine worker pool."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from senzing_mcp.worker_pool import EngineWorkerPool, WorkerCrashedError
+
+
+class FakeEngineError(Exception):
+    """Error raised by the fake engine."""
+    pass
+
+
+class FakeNotFoundError(FakeEngineError):
+    """Not-found error raised by the fake engine."""
+    pass
+
+
+class FakeEngine:
+    """Minimal engine run inside worker processes."""
+
+    def get_entity_by_entity_id(self, entity_id, flags):
+        if entity_id < 0:
+            raise FakeEngineError(f"SENZ0037|Unknown resolved entity value '{entity_id}'")
+        return json.dumps({"RESOLVED_ENTITY": {"ENTITY_ID": entity_id}, "PID": os.getpid()})
+
+    def find_path_by_entity_id(self, start_entity_id, end_entity_id, max_degrees,
+                               avoid_entity_ids=None, required_data_sources=None, flags=0):
+        return json.dumps({"AVOID": avoid_entity_ids, "FLAGS": flags})
+
+    def crash(self):
+        os._exit(1)
+
+
+def build_fake_engine():
+    """Engine builder used by the worker processes (must be importable)."""
+    return None, FakeEngine()
+
+
+def build_failing_engine():
+    raise FakeEngineError("SENZ0001|cannot connect")
+
+
+@pytest.fixture
+def pool():
+    pool = EngineWorkerPool(2, engine_builder=build_fake_engine)
+    pool.start()
+    yield pool
+    pool.close()
+
+
+class TestEngineWorkerPool:
+    """Calls are dispatched to worker processes over pipes."""
+
+    def test_calls_run_in_worker_processes(self, pool):
+        results = [json.loads(pool.engine.get_entity_by_entity_id(i, 0)) for i in range(1, 5)]
+
+        assert [r["RESOLVED_ENTITY"]["ENTITY_ID"] for r in results] == [1, 2, 3, 4]
+        assert all(r["PID"] != os.getpid() for r in results)
+
+    def test_load_spread_across_workers(self, pool):
+        futures = [pool.submit("get_entity_by_entity_id", i, 0) for i in range(20)]
+        pids = {json.loads(f.result(timeout=10))["PID"] for f in futures}
+
+        assert len(pids) == 2
+
+    def test_keyword_arguments_forwarded(self, pool):
+        result = json.loads(pool.engine.find_path_by_entity_id(1, 2, 3, flags=7))
+        assert result == {"AVOID": None, "FLAGS": 7}
+
+    def test_engine_errors_propagate(self, pool):
+        with pytest.raises(FakeEngineError, match="SENZ0037"):
+            pool.engine.get_entity_by_entity_id(-1, 0)
+
+    def test_crashed_worker_restarted(self, pool):
+        with pytest.raises(WorkerCrashedError):
+            pool.submit("crash").result(timeout=10)
+
+        # The crashed worker comes back; every worker keeps serving calls
+        for _ in range(100):
+            if all(stat["alive"] for stat in pool.stats()):
+                break
+            time.sleep(0.05)
+        assert sum(stat["restarts"] for stat in pool.stats()) == 1
+        futures = [pool.submit("get_entity_by_entity_id", i, 0) for i in range(10)]
+        assert all("RESOLVED_ENTITY" in f.result(timeout=10) for f in futures)
+
+    def test_startup_failure_reported(self):
+        pool = EngineWorkerPool(1, engine_builder=build_failing_engine)
+        with pytest.raises(RuntimeError, match="SENZ0001"):
+            pool.start()
+        pool.close()
+
+
+class TestWrapperWorkerMode:
+    """The wrapper dispatches engine calls to the pool."""
+
+    @pytest.mark.asyncio
+    async def test_wrapper_uses_pool(self, pool, wrapper):
+        wrapper.worker_pool = pool
+        wrapper.engine = pool.engine
+
+        with patch('senzing_mcp.sdk_wrapper.SzError', FakeEngineError):
+            with patch('senzing_mcp.sdk_wrapper.SzNotFoundError', FakeNotFoundError):
+                results = await asyncio.gather(*(wrapper.get_entity_by_entity_id(i, 0) for i in range(1, 4)))
+                missing = await wrapper.get_entity_by_entity_id(-5, 0)
+
+        assert [json.loads(r)["RESOLVED_ENTITY"]["ENTITY_ID"] for r in results] == [1, 2, 3]
+        assert missing.is_error
+        assert "SENZ0037" in missing.error
+        assert wrapper.concurrency_stats()["bulkheads"]["lookup"]["active"] == 0
+
+    def test_optional_modules_imported_lazily(self):
+        """A plain in-process engine loads neither the pool nor the fake/replay engines."""
+        code = (
+            "import sys; from unittest.mock import MagicMock;"
+            "sys.modules['senzing'] = sys.modules['senzing_core'] = MagicMock();"
+            "import senzing_mcp.sdk_wrapper;"
+            "print(sorted(m for m in sys.modules if m.rsplit('.', 1)[-1] in ('fake_engine', 'replay', 'worker_pool')))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "[]"